@@ -3,10 +3,19 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import hashlib
+import io
 import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import datetime
+from typing import BinaryIO, Dict, Optional, Tuple, Union
 
 import jwt
 from fastapi import Depends, FastAPI, File, Form, HTTPException, UploadFile
@@ -19,8 +28,19 @@ try:
 except (ImportError, PermissionError):
     pass
 
-from mpxj_pm.db import DBConfig
-from mpxj_pm.importer import MPPImporter
+from mpxj_pm.db import DBConfig, create_pool
+from mpxj_pm.importer import LOAD_ENGINES, MPPImporter
+from mpxj_pm.jobs import enqueue_job, get_job
+from mpxj_pm.mpp import (
+    READER_ENGINES,
+    attach_jvm_thread,
+    create_reader,
+    detach_jvm_thread,
+    start_jvm,
+    startup_timings,
+    warm_up,
+)
+from mpxj_pm.parse_pool import ParseWorkerPool
 
 # =============================================================================
 # Configuração
@@ -28,14 +48,138 @@ from mpxj_pm.importer import MPPImporter
 
 S3_BUCKET = os.getenv("S3_BUCKET")
 AWS_REGION = os.getenv("AWS_REGION") or os.getenv("AWS_DEFAULT_REGION")
+# Endpoint alternativo (MinIO/LocalStack em testes locais); vazio = AWS
+S3_ENDPOINT_URL = os.getenv("S3_ENDPOINT_URL") or None
 
 # JWT Configuration
 JWT_SECRET = os.getenv("JWT_SECRET")
 
+# Imports simultâneos por processo (threads do executor; os demais esperam na fila)
+IMPORT_MAX_WORKERS = int(os.getenv("IMPORT_MAX_WORKERS", "2"))
+
+# Tamanho dos chunks ao ler o upload (hash incremental)
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Uploads até este tamanho ficam em memória (reader via ByteArrayInputStream); os
+# maiores vão para um arquivo temporário, com um chunk por vez em memória
+UPLOAD_MEMORY_MAX_BYTES = int(os.getenv("UPLOAD_MEMORY_MAX_BYTES", str(16 * 1024 * 1024)))
+
+# Upload gerenciado do S3: multipart a partir de 8 MiB, partes de 8 MiB em paralelo
+S3_MULTIPART_THRESHOLD = 8 * 1024 * 1024
+S3_MULTIPART_CHUNKSIZE = 8 * 1024 * 1024
+S3_MAX_CONCURRENCY = 4
+
+# Engines aquecidos no startup com o cronograma de exemplo (vazio = só sobe a JVM)
+JVM_WARMUP_ENGINES = [e.strip() for e in os.getenv("JVM_WARMUP_ENGINES", "jpype").split(",") if e.strip()]
+
+# Processos de parse com JVM própria (0 = parse no processo da API, JVM local)
+PARSE_WORKERS = int(os.getenv("PARSE_WORKERS", "0"))
+
+# JVM/warm-up em background: /health/ready só fica pronto depois de jvm_ready
+jvm_ready = threading.Event()
+jvm_error: Optional[str] = None
+# Tempos (ms) do startup da API, medidos a partir do início do lifespan
+app_startup_timings: Dict[str, float] = {}
+
+# Pool de conexões, executores e client S3 do processo (criados/fechados no lifespan)
+db_pool = None
+import_executor: Optional[ThreadPoolExecutor] = None
+s3_executor: Optional[ThreadPoolExecutor] = None
+s3_client = None
+parse_pool: Optional[ParseWorkerPool] = None
+
+
+def _elapsed_ms(start: float) -> float:
+    return round((time.perf_counter() - start) * 1000, 2)
+
+
+def _warm_up_jvm(lifespan_start: float) -> None:
+    """Sobe a JVM e aquece o JIT fora do caminho do startup (thread em background).
+    
+    Requests de import que chegam antes esperam a mesma inicialização (start_jvm
+    é thread-safe); só a readiness fica "not_ready" até aqui terminar.
+    """
+    global jvm_error
+    try:
+        if JVM_WARMUP_ENGINES:
+            warm_up(engines=JVM_WARMUP_ENGINES)
+        else:
+            start_jvm()
+    except Exception as e:
+        jvm_error = str(e)
+        print(f"Erro ao iniciar a JVM: {e}")
+        return
+    app_startup_timings["jvm_ready"] = _elapsed_ms(lifespan_start)
+    jvm_ready.set()
+    # A thread termina aqui: solta o attach à JVM feito no warm-up
+    detach_jvm_thread()
+
+
+def _wait_parse_workers(pool: ParseWorkerPool, lifespan_start: float) -> None:
+    """Com PARSE_WORKERS: a readiness espera a JVM + warm-up de todos os workers."""
+    global jvm_error
+    if not pool.wait_ready(pool.start_timeout):
+        errors = [slot["error"] for slot in pool.stats()["slots"] if slot["error"]]
+        jvm_error = "; ".join(errors) or "workers de parse não ficaram prontos"
+        print(f"Erro ao iniciar os workers de parse: {jvm_error}")
+        return
+    app_startup_timings["jvm_ready"] = _elapsed_ms(lifespan_start)
+    jvm_ready.set()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Abre o pool de conexões, os executores e o client S3 no startup e fecha no shutdown.
+    
+    A JVM sobe em background: /health/live responde de imediato e /health/ready
+    espera o warm-up. Com PARSE_WORKERS > 0 a JVM fica só nos processos do
+    ParseWorkerPool (cada um com o próprio warm-up) e a API não sobe JVM.
+    """
+    global db_pool, import_executor, s3_executor, parse_pool
+    lifespan_start = time.perf_counter()
+    if PARSE_WORKERS > 0:
+        parse_pool = ParseWorkerPool(PARSE_WORKERS, warmup_engines=JVM_WARMUP_ENGINES)
+        parse_pool.start()
+        threading.Thread(
+            target=_wait_parse_workers, args=(parse_pool, lifespan_start), name="parse-workers-ready", daemon=True
+        ).start()
+    else:
+        threading.Thread(target=_warm_up_jvm, args=(lifespan_start,), name="jvm-warmup", daemon=True).start()
+    
+    db_pool = create_pool(DBConfig())
+    # Não bloqueia o startup: as conexões mínimas são abertas em background
+    db_pool.open(wait=False)
+    # Threads do executor anexadas à JVM (como daemon) uma vez, na criação
+    import_executor = ThreadPoolExecutor(
+        max_workers=IMPORT_MAX_WORKERS,
+        thread_name_prefix="import",
+        initializer=None if parse_pool else attach_jvm_thread,
+    )
+    # Uploads no S3 rodam em paralelo ao import (um por import em andamento)
+    s3_executor = ThreadPoolExecutor(max_workers=IMPORT_MAX_WORKERS, thread_name_prefix="s3-upload")
+    if S3_BUCKET:
+        # Resolve credenciais/endpoint uma vez, fora do caminho dos requests
+        _get_s3_client()
+    app_startup_timings["lifespan"] = _elapsed_ms(lifespan_start)
+    try:
+        yield
+    finally:
+        import_executor.shutdown(wait=True)
+        import_executor = None
+        s3_executor.shutdown(wait=True)
+        s3_executor = None
+        db_pool.close()
+        db_pool = None
+        if parse_pool is not None:
+            parse_pool.close()
+            parse_pool = None
+
+
 app = FastAPI(
     title="MPXJ Importer API",
     description="API para upload e importação de arquivos Microsoft Project (.mpp)",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 security = HTTPBearer()
@@ -95,8 +239,32 @@ async def get_current_user(
 # =============================================================================
 
 def _get_s3_client():
-    import boto3
-    return boto3.client("s3", region_name=AWS_REGION)
+    """Client S3 único do processo (clients boto3 são thread-safe).
+    
+    Criado no startup (ou no primeiro uso): credenciais e endpoint são resolvidos
+    uma vez, e não a cada request ou health check.
+    """
+    global s3_client
+    if s3_client is None:
+        import boto3
+        from botocore.config import Config
+        s3_client = boto3.client(
+            "s3",
+            region_name=AWS_REGION,
+            endpoint_url=S3_ENDPOINT_URL,
+            # Conexões para as partes do multipart de todos os uploads simultâneos
+            config=Config(max_pool_connections=max(10, S3_MAX_CONCURRENCY * IMPORT_MAX_WORKERS * 2)),
+        )
+    return s3_client
+
+
+def _s3_transfer_config():
+    from boto3.s3.transfer import TransferConfig
+    return TransferConfig(
+        multipart_threshold=S3_MULTIPART_THRESHOLD,
+        multipart_chunksize=S3_MULTIPART_CHUNKSIZE,
+        max_concurrency=S3_MAX_CONCURRENCY,
+    )
 
 
 def _sanitize_metadata_value(value: str) -> str:
@@ -112,27 +280,183 @@ def _sanitize_metadata(metadata: dict) -> dict:
     return {key: _sanitize_metadata_value(str(value)) for key, value in metadata.items()}
 
 
+def _read_upload(upload: BinaryIO) -> Tuple[Union[bytes, str], str, int]:
+    """Lê o upload em chunks, calculando o SHA256 no caminho.
+    
+    Retorna (conteúdo, hash, tamanho). Até UPLOAD_MEMORY_MAX_BYTES o conteúdo são
+    os bytes do upload: o mesmo buffer alimenta o reader (MPXJ lê de um
+    ByteArrayInputStream) e o upload no S3, sem arquivo temporário. Acima disso o
+    upload é copiado para um arquivo temporário e o conteúdo é o caminho dele (só
+    um chunk em memória; reader e S3 leem do disco). Quem chama descarta o
+    conteúdo com _discard_upload.
+    """
+    sha256 = hashlib.sha256()
+    chunks = []
+    size_bytes = 0
+    spool = None
+    try:
+        while chunk := upload.read(UPLOAD_CHUNK_SIZE):
+            sha256.update(chunk)
+            size_bytes += len(chunk)
+            if spool is None and size_bytes > UPLOAD_MEMORY_MAX_BYTES:
+                spool = tempfile.NamedTemporaryFile(suffix=".mpp", delete=False)
+                spool.writelines(chunks)
+                chunks = []
+            if spool is not None:
+                spool.write(chunk)
+            else:
+                chunks.append(chunk)
+        if spool is not None:
+            spool.close()
+    except Exception as e:
+        if spool is not None:
+            spool.close()
+            os.remove(spool.name)
+        raise HTTPException(status_code=400, detail=f"Erro ao ler arquivo: {e}")
+    if spool is not None:
+        return spool.name, sha256.hexdigest(), size_bytes
+    if not size_bytes:
+        raise HTTPException(status_code=400, detail="Arquivo vazio")
+    return b"".join(chunks), sha256.hexdigest(), size_bytes
+
+
+def _discard_upload(content: Union[bytes, str]) -> None:
+    """Remove o arquivo temporário de um upload grande (conteúdo em memória: nada a fazer)."""
+    if isinstance(content, str) and os.path.exists(content):
+        os.remove(content)
+
+
+def _upload_to_s3(content: Union[bytes, str], s3_key: str, metadata: dict) -> None:
+    """Envia o conteúdo (bytes ou caminho local) para o S3 (upload_fileobj, multipart se grande)."""
+    s3 = _get_s3_client()
+    # BytesIO sobre bytes não copia o buffer enquanto não é modificado
+    with open(content, "rb") if isinstance(content, str) else io.BytesIO(content) as body:
+        s3.upload_fileobj(
+            body,
+            S3_BUCKET,
+            s3_key,
+            ExtraArgs={
+                "ContentType": "application/vnd.ms-project",
+                # Sanitiza metadados para garantir apenas caracteres ASCII
+                "Metadata": _sanitize_metadata(metadata),
+            },
+            Config=_s3_transfer_config(),
+        )
+
+
+def _object_s3_key(file_hash: str) -> str:
+    """Key endereçada por conteúdo: bytes iguais vão sempre para o mesmo objeto.
+    
+    O nome original e o masterplan de cada import ficam no pm.import_log, que
+    aponta para o objeto (file_storage_path).
+    """
+    return f"objects/sha256/{file_hash}"
+
+
+def _s3_object_exists(s3_key: str, file_hash: str) -> bool:
+    """Verifica se o objeto já está no bucket: primeiro no import_log, depois HEAD."""
+    try:
+        with db_pool.connection() as conn:
+            row = conn.execute(
+                """
+                SELECT 1 FROM pm.import_log
+                WHERE file_hash = %s AND file_storage_path = %s
+                LIMIT 1
+                """,
+                (file_hash, f"s3://{S3_BUCKET}/{s3_key}"),
+            ).fetchone()
+        if row:
+            return True
+    except Exception as e:
+        print(f"Aviso: Erro ao consultar import_log por file_hash: {e}")
+    
+    from botocore.exceptions import ClientError
+    try:
+        _get_s3_client().head_object(Bucket=S3_BUCKET, Key=s3_key)
+        return True
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+            return False
+        raise
+
+
+def _store_object(content: Union[bytes, str], s3_key: str, file_hash: str, metadata: dict) -> Tuple[bool, float]:
+    """Garante o objeto no S3, enviando só se ainda não existe.
+    
+    Retorna (enviado, segundos). Uploads simultâneos do mesmo arquivo gravam os
+    mesmos bytes na mesma key, então a corrida entre o check e o upload é inofensiva.
+    """
+    start = time.perf_counter()
+    if _s3_object_exists(s3_key, file_hash):
+        return False, time.perf_counter() - start
+    _upload_to_s3(content, s3_key, metadata)
+    return True, time.perf_counter() - start
+
+
+def _upload_response(result, filename: str, file_hash: str, size_bytes: int, s3_uri, s3_key) -> dict:
+    """Monta a resposta do /upload a partir do ImportReport."""
+    return {
+        "success": True,
+        "skipped": result.skipped,
+        "masterplan_id": result.masterplan_id,
+        "masterplan_name": result.masterplan_name,
+        "masterplan_action": result.masterplan_action,
+        "import_log_id": result.import_log_id,
+        "s3_uri": s3_uri,
+        "s3_bucket": S3_BUCKET,
+        "s3_key": s3_key,
+        "file_hash": file_hash,
+        "filename": filename,
+        "size_bytes": size_bytes,
+        "tasks": result.tasks,
+        "resources": result.resources,
+        "assignments": result.assignments,
+        "calendars": result.calendars,
+        "dependencies": result.dependencies,
+        "total_time_seconds": result.total_time_seconds(),
+    }
+
+
+def _timed_response(response: dict, submitted_at: float, started_at: float) -> dict:
+    """Acrescenta a espera na fila do executor e o tempo de processamento à resposta."""
+    response["queue_wait_seconds"] = round(started_at - submitted_at, 3)
+    response["processing_seconds"] = round(time.perf_counter() - started_at, 3)
+    return response
+
+
 # =============================================================================
 # Health Check Endpoints
 # =============================================================================
 
 @app.get("/health")
-async def health_check():
-    """Health check completo - verifica todos os serviços."""
+def health_check():
+    """Health check completo - verifica todos os serviços.
+    
+    Síncrono de propósito: o FastAPI roda no threadpool, e a consulta ao banco e o
+    head_bucket não bloqueiam o event loop.
+    """
     checks = {
         "api": {"status": "healthy"},
         "database": {"status": "unknown"},
         "s3": {"status": "unknown"},
+        "jvm": {"status": "unknown"},
     }
     overall_healthy = True
     
-    # Verifica banco de dados
+    # JVM/MPXJ (warm-up em background no startup)
+    if jvm_ready.is_set():
+        checks["jvm"]["status"] = "healthy"
+    elif jvm_error:
+        checks["jvm"]["status"] = "unhealthy"
+        checks["jvm"]["error"] = jvm_error
+        overall_healthy = False
+    else:
+        checks["jvm"]["status"] = "starting"
+    
+    # Verifica banco de dados (conexão do pool, sem handshake TLS por probe)
     try:
-        import psycopg
-        db_cfg = DBConfig()
-        with psycopg.connect(db_cfg.to_dsn(), connect_timeout=5) as conn:
-            with conn.cursor() as cur:
-                cur.execute("SELECT 1")
+        with db_pool.connection(timeout=5) as conn:
+            conn.execute("SELECT 1")
         checks["database"]["status"] = "healthy"
     except Exception as e:
         checks["database"]["status"] = "unhealthy"
@@ -167,17 +491,21 @@ async def liveness_probe():
 
 
 @app.get("/health/ready")
-async def readiness_probe():
-    """Readiness probe - verifica se a API está pronta para receber requests."""
+def readiness_probe():
+    """Readiness probe - verifica se a API está pronta para receber requests (síncrono, no threadpool).
+    
+    Fica not_ready até a JVM subir e o warm-up terminar.
+    """
     errors = []
     
+    # Verifica JVM (warm-up)
+    if not jvm_ready.is_set():
+        errors.append(f"jvm: {jvm_error}" if jvm_error else "jvm: warm-up em andamento")
+    
     # Verifica banco de dados
     try:
-        import psycopg
-        db_cfg = DBConfig()
-        with psycopg.connect(db_cfg.to_dsn(), connect_timeout=5) as conn:
-            with conn.cursor() as cur:
-                cur.execute("SELECT 1")
+        with db_pool.connection(timeout=5) as conn:
+            conn.execute("SELECT 1")
     except Exception as e:
         errors.append(f"database: {e}")
     
@@ -204,15 +532,220 @@ async def readiness_probe():
     return {"status": "ready", "timestamp": datetime.utcnow().isoformat()}
 
 
+@app.get("/diagnostics/pool")
+async def pool_diagnostics():
+    """Estatísticas do pool de conexões (psycopg_pool.get_stats)."""
+    if db_pool is None:
+        raise HTTPException(status_code=503, detail="Pool de conexões não inicializado")
+    return {
+        "name": db_pool.name,
+        "min_size": db_pool.min_size,
+        "max_size": db_pool.max_size,
+        "stats": db_pool.get_stats(),
+        "timestamp": datetime.utcnow().isoformat(),
+    }
+
+
+@app.get("/diagnostics/startup")
+async def startup_diagnostics():
+    """Tempos do startup: lifespan, subida da JVM e warm-up (ms)."""
+    return {
+        "jvm_ready": jvm_ready.is_set(),
+        "jvm_error": jvm_error,
+        "warmup_engines": JVM_WARMUP_ENGINES,
+        "timings_ms": {**app_startup_timings, **startup_timings},
+        "timestamp": datetime.utcnow().isoformat(),
+    }
+
+
+@app.get("/diagnostics/parse-workers")
+async def parse_workers_diagnostics():
+    """Estado dos workers de parse (PARSE_WORKERS): arquivos, reciclagens, heap da JVM."""
+    if parse_pool is None:
+        raise HTTPException(status_code=404, detail="Workers de parse desativados (PARSE_WORKERS=0)")
+    return {**parse_pool.stats(), "timestamp": datetime.utcnow().isoformat()}
+
+
 # =============================================================================
 # Upload/Import Endpoints
 # =============================================================================
 
 
+def _process_upload(
+    upload: BinaryIO,
+    filename: str,
+    user_id: int,
+    masterplan_external_id: Optional[str],
+    engine: str,
+    pipelined: bool,
+    parallel_threads: int,
+    load_engine: str,
+    force: bool,
+    submitted_at: float,
+) -> dict:
+    """Leitura + hash, import com upload no S3 em paralelo e atualização do import_log.
+    
+    Roda no executor de imports. O upload no S3 começa assim que o conteúdo foi
+    lido (em memória ou, se grande, em arquivo temporário) e roda no executor de
+    uploads, junto com o parse/carga; é pulado se o objeto objects/sha256/<hash>
+    já existe. O import_log só recebe o path do S3 depois que os dois terminam, e
+    o arquivo temporário é descartado no final.
+    """
+    started_at = time.perf_counter()
+    
+    # Lê o upload (memória ou arquivo temporário) calculando o hash SHA256 incrementalmente
+    content, file_hash, size_bytes = _read_upload(upload)
+    
+    s3_key = _object_s3_key(file_hash)
+    s3_uri = f"s3://{S3_BUCKET}/{s3_key}"
+    upload_future = s3_executor.submit(
+        _store_object,
+        content,
+        s3_key,
+        file_hash,
+        {
+            "original-filename": filename,
+            "file-hash": file_hash,
+            "uploaded-at": datetime.utcnow().isoformat(),
+        },
+    )
+    
+    try:
+        # Importa no banco de dados (sem o s3_uri ainda), lendo do buffer ou do arquivo
+        importer = MPPImporter(created_by=user_id, pool=db_pool)
+        result = importer.import_project(
+            content,
+            source_file=filename,
+            file_hash=file_hash,
+            masterplan_external_id=masterplan_external_id,
+            engine=engine,
+            pipelined=pipelined,
+            parallel_threads=parallel_threads,
+            load_engine=load_engine,
+            force=force,
+            reader_factory=parse_pool.open_reader if parse_pool else create_reader,
+        )
+        
+        if not result.success:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Erro na importação: {result.error_message}",
+            )
+        
+        if result.skipped:
+            # Arquivo já importado: reaproveita o objeto do S3 do import anterior
+            previous_uri = result.file_storage_path
+            previous_key = previous_uri.split(f"s3://{S3_BUCKET}/", 1)[-1] if previous_uri else None
+            return _timed_response(
+                _upload_response(result, filename, file_hash, size_bytes, previous_uri, previous_key),
+                submitted_at,
+                started_at,
+            )
+        
+        # Espera o upload em paralelo (normalmente já terminou durante o import)
+        s3_wait_start = time.perf_counter()
+        try:
+            s3_uploaded, s3_upload_seconds = upload_future.result()
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Erro ao salvar no S3: {e}")
+        s3_wait_seconds = time.perf_counter() - s3_wait_start
+    finally:
+        # O arquivo temporário (upload grande) só sai depois que reader e upload terminaram
+        wait([upload_future])
+        _discard_upload(content)
+    
+    # Atualiza o import_log com o path do S3 (import e upload concluídos)
+    try:
+        with db_pool.connection() as conn:
+            conn.execute(
+                """
+                UPDATE pm.import_log
+                SET file_storage_path = %s
+                WHERE id = %s
+                """,
+                (s3_uri, result.import_log_id),
+            )
+    except Exception as e:
+        # Não falha o request se não conseguir atualizar, mas loga
+        print(f"Aviso: Erro ao atualizar import_log com S3 path: {e}")
+    
+    response = _upload_response(result, filename, file_hash, size_bytes, s3_uri, s3_key)
+    response["s3_uploaded"] = s3_uploaded
+    response["s3_upload_seconds"] = round(s3_upload_seconds, 3)
+    response["s3_wait_seconds"] = round(s3_wait_seconds, 3)
+    return _timed_response(response, submitted_at, started_at)
+
+
+def _enqueue_upload(
+    upload: BinaryIO,
+    filename: str,
+    user_id: int,
+    masterplan_external_id: Optional[str],
+    options: dict,
+) -> JSONResponse:
+    """Modo assíncrono: salva o arquivo no S3 e enfileira o import (pm.import_job)."""
+    content, file_hash, size_bytes = _read_upload(upload)
+    s3_key = _object_s3_key(file_hash)
+    s3_uri = f"s3://{S3_BUCKET}/{s3_key}"
+    
+    try:
+        s3_uploaded, _ = _store_object(
+            content,
+            s3_key,
+            file_hash,
+            {
+                "original-filename": filename,
+                "file-hash": file_hash,
+                "uploaded-at": datetime.utcnow().isoformat(),
+            },
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Erro ao salvar no S3: {e}")
+    finally:
+        _discard_upload(content)
+    
+    try:
+        job_id = enqueue_job(
+            db_pool,
+            source_file=filename,
+            file_storage_path=s3_uri,
+            created_by=user_id,
+            file_hash=file_hash,
+            masterplan_external_id=masterplan_external_id,
+            options=options,
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Erro ao enfileirar o import: {e}")
+    
+    return JSONResponse(
+        status_code=202,
+        content={
+            "success": True,
+            "job_id": job_id,
+            "status": "queued",
+            "status_url": f"/imports/{job_id}",
+            "s3_uri": s3_uri,
+            "s3_bucket": S3_BUCKET,
+            "s3_key": s3_key,
+            "s3_uploaded": s3_uploaded,
+            "file_hash": file_hash,
+            "filename": filename,
+            "size_bytes": size_bytes,
+        },
+        headers={"Location": f"/imports/{job_id}"},
+    )
+
+
 @app.post("/upload")
 async def upload_mpp(
     file: UploadFile = File(..., description="Arquivo .mpp para upload"),
     masterplan_external_id: str = Form(None, description="UUID do masterplan para atualização (opcional)"),
+    engine: str = Form("jpype", description="Engine de extração: jpype (padrão), json ou columnar"),
+    pipelined: bool = Form(False, description="Extração em thread própria, sobreposta à gravação no banco"),
+    parallel_threads: int = Form(1, description="Threads da extração em shards (engine jpype; 1 = sequencial)"),
+    load_engine: str = Form("executemany", description="Engine de carga: executemany (padrão) ou copy"),
+    force: bool = Form(False, description="Reimporta mesmo que o arquivo (hash) já seja o último import do masterplan"),
+    async_import: bool = Form(False, description="Enfileira o import e responde 202 com o id do job"),
     current_user: CurrentUser = Depends(get_current_user),
 ):
     """
@@ -220,25 +753,47 @@ async def upload_mpp(
     
     Requer autenticação via Bearer token JWT.
     
-    Fluxo:
-    1. Valida e calcula hash do arquivo
-    2. Importa o arquivo no banco de dados
-    3. Salva o arquivo no S3 em `imports/{masterplan_id}/{arquivo}`
-    4. Atualiza o import_log com o path do S3 e hash
+    Fluxo (a partir do passo 1, no executor de imports, fora do event loop):
+    1. Lê o upload em chunks, calculando o hash: até UPLOAD_MEMORY_MAX_BYTES
+       (padrão 16 MiB) fica em memória e o mesmo buffer serve ao parse e ao S3;
+       acima disso vai para um arquivo temporário, descartado no fim do request
+    2. Importa o arquivo no banco de dados e, em paralelo, salva o arquivo no S3
+       em `objects/sha256/{hash}` (multipart gerenciado; pulado se já existe)
+    3. Com os dois concluídos, atualiza o import_log com o path do S3
+    
+    Se o último import concluído do masterplan tem o mesmo hash, nada é gravado
+    no banco e a resposta traz `skipped: true` com as contagens e o s3_uri do
+    import anterior.
+    
+    Com `async_import=true` o request só salva o arquivo no S3 (`objects/sha256/...`),
+    cria um job em pm.import_job e responde **202 Accepted** com `job_id` e
+    `status_url` (header `Location`); o import roda em um worker
+    (scripts/import_worker.py) e o progresso é consultado em `GET /imports/{job_id}`.
+    Use para arquivos grandes, cujo import passa do idle timeout do ALB.
     
     - **file**: Arquivo .mpp (obrigatório)
     - **masterplan_external_id**: UUID do masterplan para atualização (opcional). 
       Se fornecido, o sistema tentará atualizar o masterplan existente com esse UUID.
       Se não fornecido, criará um novo masterplan ou atualizará baseado no external_id do arquivo.
+    - **engine**: Engine de extração (opcional): `jpype` (padrão), `json` ou `columnar`.
+    - **pipelined**: Se true, extrai e grava em paralelo (produtor/consumidor).
+    - **parallel_threads**: Threads anexadas à JVM que extraem o arquivo em shards
+      (opcional, engine `jpype`; padrão 1 = sequencial). Vale para cronogramas grandes.
+    - **load_engine**: Engine de carga (opcional): `executemany` (padrão) ou `copy`.
+    - **force**: Se true, reimporta mesmo quando o arquivo já foi importado.
+    - **async_import**: Se true, enfileira o import (202) em vez de importar no request.
     
     Retorna:
     - masterplan_id: ID do masterplan criado ou atualizado
     - s3_uri: URI do arquivo no S3
     - file_hash: Hash SHA256 do arquivo
     - import_log_id: ID do log de importação
+    - queue_wait_seconds: Tempo esperando um worker livre do executor de imports
+    - processing_seconds: Tempo de processamento (hash, import, S3)
+    - s3_uploaded: False se o objeto já existia no bucket (transferência pulada)
+    - s3_upload_seconds: Duração do check + upload no S3 (em paralelo ao import)
+    - s3_wait_seconds: Tempo esperando o upload depois do fim do import
     """
-    import tempfile
-    
     # Validações
     if not file.filename:
         raise HTTPException(status_code=400, detail="Nome do arquivo não fornecido")
@@ -246,119 +801,92 @@ async def upload_mpp(
     if not file.filename.lower().endswith(".mpp"):
         raise HTTPException(status_code=400, detail="Apenas arquivos .mpp são aceitos")
     
-    if not S3_BUCKET:
-        raise HTTPException(status_code=500, detail="S3_BUCKET não configurado")
-    
-    # Lê o conteúdo do arquivo
-    try:
-        content = await file.read()
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Erro ao ler arquivo: {e}")
+    if engine not in READER_ENGINES:
+        raise HTTPException(status_code=400, detail=f"Engine de extração inválido: {engine}")
     
-    if len(content) == 0:
-        raise HTTPException(status_code=400, detail="Arquivo vazio")
+    if load_engine not in LOAD_ENGINES:
+        raise HTTPException(status_code=400, detail=f"Engine de carga inválido: {load_engine}")
     
-    # Calcula hash SHA256 do arquivo
-    file_hash = hashlib.sha256(content).hexdigest()
+    if not 1 <= parallel_threads <= (os.cpu_count() or 1):
+        raise HTTPException(
+            status_code=400,
+            detail=f"parallel_threads deve estar entre 1 e {os.cpu_count() or 1}",
+        )
     
-    # Gera S3 key antecipadamente (usando hash como prefixo temporário)
-    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-    safe_name = "".join(c if c.isalnum() or c in ".-_" else "_" for c in file.filename)
+    if not S3_BUCKET:
+        raise HTTPException(status_code=500, detail="S3_BUCKET não configurado")
     
-    # Salva temporariamente para processar
-    fd, tmp_path = tempfile.mkstemp(suffix=".mpp")
-    try:
-        os.write(fd, content)
-        os.close(fd)
-        
-        # Importa no banco de dados (sem o s3_uri ainda)
-        db_cfg = DBConfig()
-        importer = MPPImporter(db_cfg, created_by=current_user.user_id)
-        result = importer.import_project(
-            tmp_path,
-            source_file=file.filename,
-            file_hash=file_hash,
-            masterplan_external_id=masterplan_external_id,
+    # O corpo não é lido aqui: o UploadFile (spool do Starlette) é lido em chunks
+    # para a memória, com hash incremental, no executor
+    loop = asyncio.get_running_loop()
+    if async_import:
+        # Upload no S3 e INSERT do job no threadpool padrão: não disputa o executor de imports
+        return await loop.run_in_executor(
+            None,
+            functools.partial(
+                _enqueue_upload,
+                file.file,
+                file.filename,
+                current_user.user_id,
+                masterplan_external_id,
+                {
+                    "engine": engine,
+                    "pipelined": pipelined,
+                    "parallel_threads": parallel_threads,
+                    "load_engine": load_engine,
+                    "force": force,
+                },
+            ),
         )
-        
-        if not result.success:
-            raise HTTPException(
-                status_code=500,
-                detail=f"Erro na importação: {result.error_message}",
-            )
-        
-        masterplan_id = result.masterplan_id
-        import_log_id = result.import_log_id
-        
-    finally:
-        if os.path.exists(tmp_path):
-            os.remove(tmp_path)
     
-    # Salva no S3 com o path imports/{masterplan_id}/{filename}
-    s3_key = f"imports/{masterplan_id}/{timestamp}_{safe_name}"
-    s3_uri = f"s3://{S3_BUCKET}/{s3_key}"
+    # Parse (JVM), carga no banco e upload no S3 rodam no executor de imports:
+    # o event loop continua atendendo probes e outros requests
+    submitted_at = time.perf_counter()
+    return await loop.run_in_executor(
+        import_executor,
+        functools.partial(
+            _process_upload,
+            file.file,
+            file.filename,
+            current_user.user_id,
+            masterplan_external_id,
+            engine,
+            pipelined,
+            parallel_threads,
+            load_engine,
+            force,
+            submitted_at,
+        ),
+    )
+
+
+@app.get("/imports/{job_id}")
+def import_job_status(
+    job_id: int,
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    """
+    Estado de um import assíncrono (job criado pelo POST /upload com async_import).
     
-    try:
-        s3 = _get_s3_client()
-        # Sanitiza metadados para garantir apenas caracteres ASCII
-        metadata = {
-            "original-filename": file.filename,
-            "masterplan-id": str(masterplan_id),
-            "import-log-id": str(import_log_id),
-            "file-hash": file_hash,
-            "uploaded-at": datetime.utcnow().isoformat(),
-        }
-        s3.put_object(
-            Bucket=S3_BUCKET,
-            Key=s3_key,
-            Body=content,
-            ContentType="application/vnd.ms-project",
-            Metadata=_sanitize_metadata(metadata),
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Erro ao salvar no S3: {e}")
+    Requer autenticação via Bearer token JWT; só o usuário que criou o job o
+    enxerga (404 para os demais).
     
-    # Atualiza o import_log com o path do S3
+    Retorna:
+    - status: queued, running, completed ou failed
+    - phase: fase em execução (nomes dos Timers do importer, ex.: `read_mpp_file`,
+      `import_tasks`) ou `download` enquanto o worker baixa o arquivo do S3
+    - progress: timings (ms) das fases já concluídas
+    - result: relatório do import (ImportReport.to_dict) quando concluído
+    - masterplan_id / import_log_id / error_message
+    """
     try:
-        import psycopg
-        with psycopg.connect(db_cfg.to_dsn()) as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    UPDATE pm.import_log
-                    SET file_storage_path = %s
-                    WHERE id = %s
-                    """,
-                    (s3_uri, import_log_id),
-                )
-                conn.commit()
+        job = get_job(db_pool, job_id)
     except Exception as e:
-        # Não falha o request se não conseguir atualizar, mas loga
-        print(f"Aviso: Erro ao atualizar import_log com S3 path: {e}")
-    
-    return {
-        "success": True,
-        "masterplan_id": masterplan_id,
-        "masterplan_name": result.masterplan_name,
-        "masterplan_action": result.masterplan_action,
-        "import_log_id": import_log_id,
-        "s3_uri": s3_uri,
-        "s3_bucket": S3_BUCKET,
-        "s3_key": s3_key,
-        "file_hash": file_hash,
-        "filename": file.filename,
-        "size_bytes": len(content),
-        "tasks": result.tasks,
-        "resources": result.resources,
-        "assignments": result.assignments,
-        "calendars": result.calendars,
-        "dependencies": result.dependencies,
-        "total_time_seconds": result.total_time_seconds(),
-    }
-
-
-
-
+        raise HTTPException(status_code=500, detail=f"Erro ao consultar o job: {e}")
+    # Job de outro usuário responde como inexistente (não revela que o id existe)
+    if job is None or job["created_by"] != current_user.user_id:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} não encontrado")
+    return job
 
 
 # =============================================================================
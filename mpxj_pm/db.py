@@ -15,6 +15,13 @@ def parse_iso_datetime(value: Optional[str]) -> Optional[datetime]:
         return None
 
 
+def coerce_datetime(value: Any) -> Optional[datetime]:
+    """Aceita datetime nativo (reader com native_dates) ou string ISO."""
+    if value is None or isinstance(value, datetime):
+        return value
+    return parse_iso_datetime(value)
+
+
 def coerce_int(value: Any) -> Optional[int]:
     if value is None:
         return None
@@ -75,3 +82,39 @@ class DBConfig:
             parts.append(f"sslrootcert={ssl_cert}")
         
         return " ".join(parts)
+
+
+def create_pool(
+    db_config: Optional[DBConfig] = None,
+    min_size: Optional[int] = None,
+    max_size: Optional[int] = None,
+    open: bool = False,
+):
+    """Cria um psycopg_pool.ConnectionPool para o processo (API ou worker).
+
+    Tamanho via argumentos ou PGPOOL_MIN_SIZE/PGPOOL_MAX_SIZE (padrão 1..5) e
+    timeout de espera por conexão via PGPOOL_TIMEOUT (segundos, padrão 30).
+    As conexões são verificadas na retirada (check_connection), para não entregar
+    conexões derrubadas por failover/idle timeout do RDS.
+
+    O pool é criado fechado por padrão: quem o possui chama `open()`/`close()`
+    no ciclo de vida da aplicação.
+    """
+    try:
+        from psycopg_pool import ConnectionPool
+    except ImportError as e:
+        raise SystemExit(
+            "psycopg_pool não encontrado. Instale as dependências: pip install -r requirements.txt"
+        ) from e
+
+    min_size = min_size or coerce_int(os.getenv("PGPOOL_MIN_SIZE")) or 1
+    max_size = max(max_size or coerce_int(os.getenv("PGPOOL_MAX_SIZE")) or 5, min_size)
+    return ConnectionPool(
+        (db_config or DBConfig()).to_dsn(),
+        min_size=min_size,
+        max_size=max_size,
+        timeout=coerce_float(os.getenv("PGPOOL_TIMEOUT")) or 30.0,
+        check=ConnectionPool.check_connection,
+        name="mpxj_pm",
+        open=open,
+    )
@@ -1,15 +1,30 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import os
+import queue
+import threading
 import time
 import uuid
+from contextlib import ExitStack, contextmanager
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
-
-from .db import DBConfig, parse_iso_datetime
-from .mpp import MPPReader
+from datetime import date, datetime, timedelta
+from decimal import Context
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .db import DBConfig, coerce_datetime
+from .mpp import (
+    ITER_BATCH_SIZE,
+    MPPReader,
+    ReaderSource,
+    attach_jvm_thread,
+    create_reader,
+    detach_jvm_thread,
+    jvm_started,
+    source_bytes,
+    source_name,
+)
 
 
 @dataclass
@@ -26,7 +41,7 @@ class ImportReport:
     # Metadados do projeto
     masterplan_name: str = ""
     masterplan_external_id: str = ""
-    masterplan_action: str = ""  # "created" ou "updated"
+    masterplan_action: str = ""  # "created", "updated" ou "unchanged" (import pulado)
     
     # Datas do projeto
     masterplan_start_date: Optional[str] = None
@@ -43,6 +58,8 @@ class ImportReport:
     assignments: int = 0
     calendars: int = 0
     dependencies: int = 0
+    # Re-import: inserted/updated/restored/unchanged/deleted por entidade
+    row_changes: Dict[str, Dict[str, int]] = field(default_factory=dict)
     
     # Tempos (em ms)
     timings_ms: Dict[str, float] = field(default_factory=dict)
@@ -53,6 +70,7 @@ class ImportReport:
     # Status
     success: bool = True
     error_message: Optional[str] = None
+    skipped: bool = False  # Mesmo arquivo já importado: contagens vêm do import_log anterior
     
     def total_time_seconds(self) -> float:
         """Retorna o tempo total em segundos."""
@@ -87,6 +105,7 @@ class ImportReport:
                 "assignments": self.assignments,
                 "calendars": self.calendars,
                 "dependencies": self.dependencies,
+                "row_changes": self.row_changes,
             },
             "performance": {
                 "timings_ms": self.timings_ms,
@@ -95,6 +114,7 @@ class ImportReport:
             "status": {
                 "success": self.success,
                 "error_message": self.error_message,
+                "skipped": self.skipped,
             },
         }
     
@@ -113,6 +133,8 @@ class ImportReport:
         
         # Status
         status_text = "SUCESSO" if self.success else "FALHA"
+        if self.skipped:
+            status_text += " (arquivo já importado, nada foi gravado)"
         lines.append(f"Status: {status_text}")
         lines.append(f"Data/Hora: {self.imported_at}")
         lines.append("")
@@ -151,6 +173,19 @@ class ImportReport:
         lines.append(f"  Dependencies:              {self.dependencies:>10}")
         lines.append("")
         
+        # Linhas gravadas vs inalteradas no re-import
+        if self.row_changes:
+            lines.append("-" * 70)
+            lines.append("ALTERAÇÕES POR ENTIDADE")
+            lines.append("-" * 70)
+            lines.append(f"  {'':<12}" + "".join(f"{kind:>12}" for kind in ROW_CHANGE_KINDS))
+            for entity, counts in self.row_changes.items():
+                lines.append(
+                    f"  {entity.capitalize():<12}"
+                    + "".join(f"{counts.get(kind, 0):>12}" for kind in ROW_CHANGE_KINDS)
+                )
+            lines.append("")
+        
         # Performance
         lines.append("-" * 70)
         lines.append("PERFORMANCE")
@@ -222,31 +257,411 @@ class ImportReport:
     def print_summary(self) -> None:
         """Imprime um resumo curto no terminal."""
         status = "OK" if self.success else "ERRO"
+        if self.skipped:
+            status = "SKIP"
         print(f"[{status}] {self.masterplan_name} - {self.total_time_seconds():.2f}s")
 
 
+def _isoformat(value: Any) -> Optional[str]:
+    """Datas do relatório continuam como string ISO (datetime nativo ou str)."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _json_default(value: Any) -> str:
+    """Custom fields do tipo DATE chegam como datetime com native_dates=True."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Valor de custom field não serializável: {type(value).__name__}")
+
+
+def _custom_fields_json(values: Optional[Dict[str, Any]]) -> str:
+    """JSON da coluna custom_fields; datas viram string ISO (mesmo texto do reader sem native_dates)."""
+    return json.dumps(values or {}, default=_json_default)
+
+
+def _file_sha256(path: str, chunk_size: int = 1024 * 1024) -> str:
+    """SHA-256 do arquivo lido em blocos (mesmo hash calculado pela API no upload)."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _as_date(value: Any) -> date:
+    """Converte datetime nativo ou string ISO em date (exceções de calendário)."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(value[:10], "%Y-%m-%d").date()
+
+
+# Callback de progresso: (fase que está começando, cópia dos timings já medidos)
+ProgressCallback = Callable[[str, Dict[str, float]], None]
+
+
+class PhaseTimings(dict):
+    """Dicionário de timings (ms por fase) que avisa `progress` quando uma fase começa.
+    
+    Cada Timer notifica ao entrar; fases medidas lote a lote (accumulate=True)
+    notificam a cada lote, então o callback deve limitar a própria frequência.
+    Erros do callback são logados e não interrompem o import.
+    """
+    
+    def __init__(self, progress: ProgressCallback):
+        super().__init__()
+        self.progress = progress
+    
+    def notify(self, phase: str) -> None:
+        try:
+            self.progress(phase, dict(self))
+        except Exception as e:
+            print(f"Aviso: Erro no callback de progresso ({phase}): {e}")
+
+
 class Timer:
-    """Context manager para medir tempo de execução."""
+    """Context manager para medir tempo de execução.
+    
+    Com accumulate=True soma ao tempo já registrado em `name` (fases medidas lote a
+    lote) e não imprime; o total é impresso com _print_timing ao fim da fase.
+    Se `timings` for um PhaseTimings, avisa o callback de progresso ao entrar.
+    """
     
-    def __init__(self, name: str, timings: Dict[str, float]):
+    def __init__(self, name: str, timings: Dict[str, float], accumulate: bool = False):
         self.name = name
         self.timings = timings
+        self.accumulate = accumulate
         self.start = 0.0
     
     def __enter__(self):
+        if isinstance(self.timings, PhaseTimings):
+            self.timings.notify(self.name)
         self.start = time.perf_counter()
         return self
     
     def __exit__(self, *args):
         elapsed = time.perf_counter() - self.start
+        if self.accumulate:
+            self.timings[self.name] = round(self.timings.get(self.name, 0.0) + elapsed * 1000, 2)
+            return
         self.timings[self.name] = round(elapsed * 1000, 2)  # em ms
         print(f"  [{self.name}] {elapsed:.3f}s")
 
 
+def _print_timing(name: str, timings: Dict[str, float]) -> None:
+    """Imprime o total acumulado de uma fase medida por lotes."""
+    print(f"  [{name}] {timings.get(name, 0.0) / 1000:.3f}s")
+
+
+def _timed_batches(batches: Iterable[Any], name: str, timings: Dict[str, float]) -> Iterator[Any]:
+    """Repassa os lotes de um iterador iter_* acumulando em `name` o tempo gasto para produzi-los."""
+    iterator = iter(batches)
+    while True:
+        with Timer(name, timings, accumulate=True):
+            try:
+                batch = next(iterator)
+            except StopIteration:
+                return
+        yield batch
+
+
+# Lotes extraídos que podem ficar na fila do pipeline aguardando o writer
+PIPELINE_QUEUE_SIZE = 4
+
+# Marca de fim de fase na fila do pipeline
+_STAGE_END = object()
+
+
+class _SequentialExtraction:
+    """Fonte de lotes sem pipeline: cada fase é extraída sob demanda pelo writer."""
+
+    def __init__(self, stages: List[Tuple[str, Callable[[], Iterable[Any]]]], timings: Dict[str, float]):
+        self.stages = dict(stages)
+        self.timings = timings
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def batches(self, name: str) -> Iterator[Any]:
+        return _timed_batches(self.stages[name](), name, self.timings)
+
+
+class _PipelinedExtraction:
+    """Produtor/consumidor: extrai as fases em uma thread anexada à JVM.
+
+    A thread percorre as fases em ordem e coloca os lotes em uma fila limitada
+    (PIPELINE_QUEUE_SIZE); o writer consome com batches(name) na mesma ordem, dentro
+    da transação. Enquanto o Postgres grava um lote, a JVM já extrai o próximo.
+    O tempo de extração de cada fase é medido na thread produtora (mesmos nomes
+    de fase do modo sequencial).
+    """
+
+    def __init__(
+        self,
+        stages: List[Tuple[str, Callable[[], Iterable[Any]]]],
+        timings: Dict[str, float],
+        maxsize: int = PIPELINE_QUEUE_SIZE,
+    ):
+        self.stages = stages
+        self.timings = timings
+        self.queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._produce, name="mpp-extract", daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        # Em caso de erro no writer, libera o produtor (que pode estar bloqueado na fila)
+        self._stop.set()
+        while self._thread.is_alive():
+            try:
+                self.queue.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        self._thread.join()
+
+    def _put(self, item: Tuple[Optional[str], Any]) -> bool:
+        while not self._stop.is_set():
+            try:
+                self.queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce(self) -> None:
+        try:
+            # Reader servido por bundle (mpxj_pm.parse_pool) não usa JVM neste processo
+            if jvm_started():
+                attach_jvm_thread()
+            for name, factory in self.stages:
+                for batch in _timed_batches(factory(), name, self.timings):
+                    if not self._put((name, batch)):
+                        return
+                if not self._put((name, _STAGE_END)):
+                    return
+        except BaseException as e:
+            self._put((None, e))
+        finally:
+            try:
+                detach_jvm_thread()
+            except Exception:
+                pass
+
+    def batches(self, name: str) -> Iterator[Any]:
+        while True:
+            stage, item = self.queue.get()
+            if stage is None:
+                raise item
+            if stage != name:
+                raise RuntimeError(f"Pipeline fora de ordem: esperado {name}, recebido {stage}")
+            if item is _STAGE_END:
+                return
+            yield item
+
+
+# Engines de carga: executemany (UPSERT em chunks) ou copy (COPY em staging + merge set-based)
+LOAD_ENGINES = ("executemany", "copy")
+
+# Colunas gravadas por entidade no engine copy (mesma ordem das linhas montadas em _import_*)
+_RESOURCE_COLUMNS = (
+    "masterplan_id", "external_id", "name", "email", "type", '"group"',
+    "max_units", "standard_rate", "cost", "notes", "custom_fields", "content_hash", "created_by",
+)
+_TASK_COLUMNS = (
+    "masterplan_id", "external_id", "name", "start_date", "finish_date",
+    "duration", "work", "percent_complete", "priority", "notes", "wbs",
+    "outline_level", "milestone", "summary", "custom_fields", "content_hash", "created_by",
+)
+_ASSIGNMENT_COLUMNS = (
+    "masterplan_id", "external_id", "task_id", "resource_id",
+    "work", "cost", "start_date", "finish_date", "units",
+    "percent_complete", "custom_fields", "content_hash", "created_by",
+)
+_DEPENDENCY_COLUMNS = (
+    "masterplan_id", "predecessor_task_id", "successor_task_id",
+    "dependency_type", "lag", "created_by",
+)
+
+# Tipos do COPY binário das tabelas timephased (assignment_id, period_start, period_end,
+# work, cost, units, created_by)
+_TIMEPHASED_COPY_TYPES = ("int4", "timestamp", "timestamp", "numeric", "numeric", "numeric", "int4")
+
+# float -> Decimal para colunas numeric no COPY binário (15 dígitos significativos)
+_NUMERIC_CONTEXT = Context(prec=15)
+
+
+def _to_numeric(value: Any) -> Any:
+    """Converte float em Decimal (o dumper binário de numeric do psycopg não aceita float)."""
+    if value is None:
+        return None
+    return _NUMERIC_CONTEXT.create_decimal_from_float(value)
+
+
+# Tabelas com soft delete por (masterplan_id, external_id)
+_SOFT_DELETE_TABLES = ("pm.resource", "pm.task", "pm.assignment")
+
+# Contadores de re-import por entidade (ImportReport.row_changes / import_log.stats)
+ROW_CHANGE_KINDS = ("inserted", "updated", "restored", "unchanged", "deleted")
+
+# Só atualiza linhas cujo conteúdo mudou (sem nova versão da linha, trigger ou WAL)
+_CONTENT_CHANGED = "{table}.content_hash IS DISTINCT FROM EXCLUDED.content_hash"
+
+
+def _executemany_returning(cur, query: str, rows: List[Tuple[Any, ...]]) -> List[Tuple[Any, ...]]:
+    """executemany com RETURNING: junta as linhas devolvidas por cada statement do lote."""
+    if not rows:
+        return []
+    cur.executemany(query, rows, returning=True)
+    returned: List[Tuple[Any, ...]] = []
+    while True:
+        returned.extend(cur.fetchall())
+        if not cur.nextset():
+            return returned
+
+
+def _content_hash(values: Tuple[Any, ...]) -> str:
+    """Fingerprint das colunas de conteúdo de uma linha (sem masterplan_id/external_id/auditoria)."""
+    return hashlib.blake2b(repr(values).encode("utf-8"), digest_size=16).hexdigest()
+
+
 class MPPImporter:
-    def __init__(self, db_config: DBConfig, created_by: int = 1):
-        self.db_config = db_config
+    def __init__(
+        self,
+        db_config: Optional[DBConfig] = None,
+        created_by: int = 1,
+        pool: Any = None,
+        connection: Any = None,
+    ):
+        """
+        Args:
+            db_config: Config de conexão (usada quando não há pool nem conexão)
+            created_by: ID do usuário gravado em created_by/updated_by
+            pool: psycopg_pool.ConnectionPool compartilhado (ex.: o da API); cada
+                import pega uma conexão do pool e a devolve no final
+            connection: Conexão psycopg já aberta (do chamador, que a fecha)
+        """
+        self.db_config = db_config or DBConfig()
         self.created_by = created_by
+        self.pool = pool
+        self.connection = connection
+
+    def _find_previous_import(
+        self,
+        file_hash: str,
+        masterplan_external_id: str,
+    ) -> Optional[Dict[str, Any]]:
+        """Busca o import concluído deste arquivo que ainda é o estado atual do masterplan.
+        
+        Resolve primeiro o masterplan ativo pelo external_id e depois procura pelo
+        índice (masterplan_id, file_hash). Só conta se for o último import concluído
+        do masterplan (um arquivo antigo reenviado depois de outra versão precisa ser
+        reimportado). Masterplan ainda inexistente nunca é pulado.
+        
+        Returns:
+            Dict com as colunas do import_log + dados do masterplan, ou None
+        """
+        with self._connection() as conn, conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT id FROM pm.masterplan
+                WHERE external_id = %s AND deleted_at IS NULL
+                LIMIT 1
+                """,
+                (masterplan_external_id,),
+            )
+            row = cur.fetchone()
+            if not row:
+                return None
+            cur.execute(
+                """
+                SELECT
+                    l.id, l.masterplan_id, l.file_storage_path,
+                    l.custom_field_definitions, l.tasks, l.resources,
+                    l.assignments, l.calendars, l.dependencies,
+                    m.name, m.external_id, m.start_date, m.finish_date,
+                    m.author, m.company, m.creation_date, m.last_saved
+                FROM pm.import_log l
+                JOIN pm.masterplan m ON m.id = l.masterplan_id
+                WHERE l.masterplan_id = %s
+                    AND l.file_hash = %s
+                    AND l.status = 'completed'
+                    AND NOT EXISTS (
+                        SELECT 1 FROM pm.import_log newer
+                        WHERE newer.masterplan_id = l.masterplan_id
+                            AND newer.status = 'completed'
+                            AND newer.id > l.id
+                    )
+                ORDER BY l.id DESC
+                LIMIT 1
+                """,
+                (row[0], file_hash),
+            )
+            row = cur.fetchone()
+            if not row:
+                return None
+            columns = [desc[0] for desc in cur.description]
+            return dict(zip(columns, row))
+
+    def _find_file_masterplan(self, file_hash: str) -> Optional[str]:
+        """Resolve pelo hash o masterplan candidato de um import sem masterplan_external_id.
+        
+        É o masterplan do último import concluído deste arquivo cujo external_id veio
+        do próprio arquivo (stats.masterplan_external_id_source = 'file'): o mesmo
+        conteúdo tem o mesmo id, então o import anterior pode ser checado antes de
+        ler o arquivo. Imports com external_id informado ou gerado não contam.
+        
+        Returns:
+            external_id do masterplan, ou None (arquivo nunca importado assim)
+        """
+        with self._connection() as conn, conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT m.external_id
+                FROM pm.import_log l
+                JOIN pm.masterplan m ON m.id = l.masterplan_id
+                WHERE l.file_hash = %s
+                    AND l.status = 'completed'
+                    AND l.stats->>'masterplan_external_id_source' = 'file'
+                    AND m.deleted_at IS NULL
+                ORDER BY l.id DESC
+                LIMIT 1
+                """,
+                (file_hash,),
+            )
+            row = cur.fetchone()
+            return row[0] if row else None
+
+    def _fill_skipped_report(self, report: ImportReport, previous: Dict[str, Any]) -> None:
+        """Preenche o relatório de um import pulado com os dados do import anterior."""
+        report.skipped = True
+        report.success = True
+        report.import_log_id = previous["id"]
+        report.masterplan_id = previous["masterplan_id"]
+        report.masterplan_action = "unchanged"
+        report.masterplan_name = previous["name"]
+        report.masterplan_external_id = previous["external_id"]
+        report.masterplan_start_date = _isoformat(previous["start_date"])
+        report.masterplan_finish_date = _isoformat(previous["finish_date"])
+        report.masterplan_author = previous["author"]
+        report.masterplan_company = previous["company"]
+        report.masterplan_creation_date = _isoformat(previous["creation_date"])
+        report.masterplan_last_saved = _isoformat(previous["last_saved"])
+        report.file_storage_path = report.file_storage_path or previous["file_storage_path"]
+        report.custom_field_definitions = previous["custom_field_definitions"]
+        report.tasks = previous["tasks"]
+        report.resources = previous["resources"]
+        report.assignments = previous["assignments"]
+        report.calendars = previous["calendars"]
+        report.dependencies = previous["dependencies"]
 
     def _connect(self):
         try:
@@ -258,74 +673,169 @@ class MPPImporter:
 
         return psycopg.connect(self.db_config.to_dsn())
 
+    @contextmanager
+    def _connection(self):
+        """Conexão para uma unidade de trabalho: commit no final, rollback em erro.
+        
+        Usa, nesta ordem, a conexão recebida no construtor (dentro de um bloco
+        transaction(), sem fechá-la), uma conexão do pool (devolvida ao pool no
+        final) ou uma conexão nova (fechada no final).
+        """
+        if self.connection is not None:
+            with self.connection.transaction():
+                yield self.connection
+        elif self.pool is not None:
+            with self.pool.connection() as conn:
+                yield conn
+        else:
+            with self._connect() as conn:
+                yield conn
+
     def import_project(
         self,
-        mpp_path: str,
+        mpp_path: ReaderSource,
         source_file: Optional[str] = None,
         file_storage_path: Optional[str] = None,
         file_hash: Optional[str] = None,
         masterplan_external_id: Optional[str] = None,
+        engine: str = "jpype",
+        batch_size: int = ITER_BATCH_SIZE,
+        pipelined: bool = False,
+        parallel_threads: int = 1,
+        load_engine: str = "executemany",
+        force: bool = False,
+        progress: Optional[ProgressCallback] = None,
+        reader_factory: Callable[..., MPPReader] = create_reader,
     ) -> ImportReport:
         """Importa um arquivo .mpp para o banco de dados.
         
         Args:
-            mpp_path: Caminho local do arquivo .mpp
+            mpp_path: Caminho local do arquivo .mpp, ou o conteúdo em memória (bytes,
+                memoryview) ou um arquivo binário aberto (ver MPPReader)
             source_file: Nome do arquivo original (para log)
             file_storage_path: Caminho onde o arquivo foi armazenado (ex: S3)
             file_hash: Hash SHA256 do arquivo (para detectar duplicatas)
             masterplan_external_id: UUID do masterplan para atualização (opcional).
                 Se fornecido, será usado ao invés do external_id do arquivo ou gerado.
+            engine: Engine de extração ("jpype" = getters por entidade, "json" =
+                serialização do projeto inteiro via JsonWriter do MPXJ, "columnar" =
+                arrays primitivos por campo via helper Java)
+            batch_size: Entidades por lote na extração/gravação (memória limitada
+                ao lote, independente do tamanho do projeto)
+            pipelined: Se True, a extração roda em uma thread própria (anexada à
+                JVM) e entrega os lotes por uma fila limitada enquanto o writer
+                grava no banco; o tempo total tende a max(extração, carga)
+            parallel_threads: Threads anexadas à JVM que extraem tasks, resources,
+                assignments e timephased em shards por faixa de índice (engine
+                jpype; 1 = sequencial). Ver MPPReader e scripts/bench_parallel_extract.py
+            load_engine: Engine de carga ("executemany" = UPSERT em chunks,
+                "copy" = COPY em tabela de staging temporária + merge set-based)
+            force: Se True, importa mesmo que o último import concluído do masterplan
+                tenha o mesmo file_hash (por padrão esse caso é pulado sem gravar
+                nada, e o relatório vem com skipped=True). O masterplan é resolvido
+                antes de ler o arquivo: pelo masterplan_external_id informado ou,
+                sem ele, pelo último import deste file_hash com o id do próprio
+                arquivo; só sem candidato a checagem espera a leitura. O file_hash
+                é calculado sempre
+            progress: Callback chamado no início de cada fase (nomes dos Timers,
+                ex.: "read_mpp_file", "import_tasks") com os timings já medidos;
+                usado pelos jobs assíncronos (mpxj_pm.jobs) para reportar progresso
+            reader_factory: Cria o reader com a assinatura de mpp.create_reader; ex.:
+                ParseWorkerPool.open_reader faz o parse em um processo worker com
+                JVM própria (mpxj_pm.parse_pool) e devolve um reader sobre o bundle
         
         Returns:
             ImportReport com todos os detalhes da importação
         """
+        if load_engine not in LOAD_ENGINES:
+            raise ValueError(f"Engine de carga inválido: {load_engine}")
+
         total_start = time.perf_counter()
-        timings: Dict[str, float] = {}
+        timings: Dict[str, float] = PhaseTimings(progress) if progress else {}
+        # Arquivo aberto: lido uma vez, o mesmo conteúdo serve ao hash e ao reader
+        if hasattr(mpp_path, "read"):
+            source_file = source_file or source_name(mpp_path)
+            mpp_path = source_bytes(mpp_path)
         
         # Inicializa o relatório
         report = ImportReport(
-            source_file=source_file or os.path.basename(mpp_path),
+            source_file=source_file or source_name(mpp_path),
             file_storage_path=file_storage_path,
             file_hash=file_hash,
         )
 
         try:
+            # Fase 0: Hash do arquivo (também com force: fica no import_log e serve
+            # aos próximos imports) e import idempotente - se o masterplan informado
+            # (ou, sem ele, o resolvido pelo hash) já tem este arquivo como estado
+            # atual, nem lê o arquivo
+            if not file_hash:
+                with Timer("hash_file", timings):
+                    data = source_bytes(mpp_path)
+                    file_hash = hashlib.sha256(data).hexdigest() if data is not None else _file_sha256(mpp_path)
+                    report.file_hash = file_hash
+            checked_external_id = None
+            if not force:
+                with Timer("check_previous_import", timings):
+                    checked_external_id = masterplan_external_id or self._find_file_masterplan(file_hash)
+                    previous = (
+                        self._find_previous_import(file_hash, checked_external_id)
+                        if checked_external_id
+                        else None
+                    )
+                if previous:
+                    self._fill_skipped_report(report, previous)
+                    return report
+
             # Fase 1: Leitura do arquivo .mpp
             with Timer("read_mpp_file", timings):
-                reader = MPPReader(mpp_path)
+                # Datas nativas: o psycopg recebe datetime direto, sem ida e volta por ISO
+                reader = reader_factory(
+                    mpp_path, engine=engine, native_dates=True, parallel_threads=parallel_threads
+                )
                 reader.read()
 
             # Fase 2: Extração de metadados do projeto
             with Timer("extract_project_info", timings):
                 info = reader.get_project_info()
 
-            masterplan_name = info.get("name") or os.path.basename(mpp_path)
+            masterplan_name = info.get("name") or report.source_file
             
             # Se masterplan_external_id foi fornecido, usa ele (para atualização)
             # Caso contrário, tenta pegar do arquivo ou gera um novo
             if masterplan_external_id:
                 # Usa o UUID fornecido (para atualização de masterplan existente)
-                pass
+                masterplan_external_id_source = "argument"
             else:
                 masterplan_external_id = info.get("id")
+                masterplan_external_id_source = "file"
                 if not masterplan_external_id:
                     masterplan_external_id = str(uuid.uuid4())
+                    masterplan_external_id_source = "generated"
+                elif not force and masterplan_external_id != checked_external_id:
+                    # External_id do arquivo sem candidato pelo hash (primeiro import
+                    # deste conteúdo): só agora dá para resolver o masterplan; o
+                    # arquivo já foi lido, mas nada é gravado
+                    with Timer("check_previous_import", timings):
+                        previous = self._find_previous_import(file_hash, masterplan_external_id)
+                    if previous:
+                        self._fill_skipped_report(report, previous)
+                        return report
             
             # Preenche dados do projeto no relatório
             report.masterplan_name = masterplan_name
             report.masterplan_external_id = masterplan_external_id
-            report.masterplan_start_date = info.get("start_date")
-            report.masterplan_finish_date = info.get("finish_date")
+            report.masterplan_start_date = _isoformat(info.get("start_date"))
+            report.masterplan_finish_date = _isoformat(info.get("finish_date"))
             report.masterplan_author = info.get("author")
             report.masterplan_company = info.get("company")
-            report.masterplan_creation_date = info.get("creation_date")
-            report.masterplan_last_saved = info.get("last_saved")
+            report.masterplan_creation_date = _isoformat(info.get("creation_date"))
+            report.masterplan_last_saved = _isoformat(info.get("last_saved"))
 
-            # Fase 3: Conexão com banco
-            with Timer("db_connect", timings):
-                conn = self._connect()
-
-            try:
+            # Fase 3: Conexão com banco (do pool, se houver)
+            with ExitStack() as db:
+                with Timer("db_connect", timings):
+                    conn = db.enter_context(self._connection())
                 with conn.cursor() as cur:
                     with conn.transaction():
                         # Fase 4: Busca/cria projeto
@@ -359,13 +869,13 @@ class MPPImporter:
                                     """,
                                     (
                                         masterplan_name,
-                                        parse_iso_datetime(info.get("start_date")),
-                                        parse_iso_datetime(info.get("finish_date")),
+                                        coerce_datetime(info.get("start_date")),
+                                        coerce_datetime(info.get("finish_date")),
                                         info.get("author"),
                                         info.get("company"),
                                         info.get("comments"),
-                                        parse_iso_datetime(info.get("creation_date")),
-                                        parse_iso_datetime(info.get("last_saved")),
+                                        coerce_datetime(info.get("creation_date")),
+                                        coerce_datetime(info.get("last_saved")),
                                         self.created_by,
                                         masterplan_id,
                                     ),
@@ -384,13 +894,13 @@ class MPPImporter:
                                     (
                                         masterplan_name,
                                         masterplan_external_id,
-                                        parse_iso_datetime(info.get("start_date")),
-                                        parse_iso_datetime(info.get("finish_date")),
+                                        coerce_datetime(info.get("start_date")),
+                                        coerce_datetime(info.get("finish_date")),
                                         info.get("author"),
                                         info.get("company"),
                                         info.get("comments"),
-                                        parse_iso_datetime(info.get("creation_date")),
-                                        parse_iso_datetime(info.get("last_saved")),
+                                        coerce_datetime(info.get("creation_date")),
+                                        coerce_datetime(info.get("last_saved")),
                                         self.created_by,
                                     ),
                                 )
@@ -407,8 +917,13 @@ class MPPImporter:
                         timephased_complete_rows = 0
                         timephased_assignments_with_data = 0
                         timephased_negative_values_count = 0
+                        row_changes = {
+                            entity: dict.fromkeys(ROW_CHANGE_KINDS, 0)
+                            for entity in ("resources", "tasks", "assignments", "dependencies")
+                        }
+                        report.row_changes = row_changes
 
-                        # Fase 5: Extração de custom fields (cache para reuso)
+                        # Fase 5: Extração de custom fields (planos compilados, sem campos vazios)
                         with Timer("extract_custom_fields", timings):
                             custom_field_definitions, fields_by_class = reader.get_custom_field_definitions()
                         
@@ -430,84 +945,155 @@ class MPPImporter:
                             )
                         report.calendars = calendar_count
 
-                        # Fase 9: Descobre baselines (antes de extrair tasks/resources para usar nos bundles)
+                        # Fase 9: Descobre baselines (antes de extrair tasks/resources para usar nos lotes)
                         with Timer("discover_baselines", timings):
                             baselines_meta = reader.get_baseline_indices_and_names()
                             baseline_indices = [b["index"] for b in baselines_meta] if baselines_meta else []
 
-                        # Fase 10: Extração otimizada de resources + resource baselines (single pass)
-                        with Timer("extract_resources", timings):
-                            resources_data, resource_baselines_data = reader.extract_resources_bundle(
-                                resource_custom_fields=fields_by_class.get("RESOURCE", []),
-                                baseline_indices=baseline_indices if baseline_indices else None,
-                            )
-                        
-                        # Fase 11: Import resources
-                        with Timer("import_resources", timings):
-                            resource_count, resource_id_map = self._import_resources(
-                                cur, masterplan_id, resources_data
+                        # Fase 10: Import baselines (linhas de pm.baseline; os valores vêm com os lotes)
+                        with Timer("import_baselines", timings, accumulate=True):
+                            baseline_id_map = self._import_baselines(
+                                cur, masterplan_id, baselines_meta
                             )
-                        report.resources = resource_count
+                            self._clear_baseline_values(cur, baseline_id_map)
 
-                        # Fase 12: Extração otimizada de tasks + dependencies + task baselines (single pass)
-                        with Timer("extract_tasks", timings):
-                            tasks_data, dependencies_data, task_baselines_data = reader.extract_tasks_bundle(
+                        # Fases 11-14: extração em lotes (sequencial ou em pipeline com o writer)
+                        extraction_stages = [
+                            ("extract_resources", lambda: reader.iter_resources_bundle(
+                                resource_custom_fields=fields_by_class.get("RESOURCE", []),
+                                baseline_indices=baseline_indices if baseline_indices else None,
+                                batch_size=batch_size,
+                            )),
+                            ("extract_tasks", lambda: reader.iter_tasks_bundle(
                                 task_custom_fields=fields_by_class.get("TASK", []),
                                 baseline_indices=baseline_indices if baseline_indices else None,
+                                batch_size=batch_size,
+                            )),
+                            ("extract_assignments", lambda: reader.iter_assignments(
+                                assignment_custom_fields=fields_by_class.get("ASSIGNMENT", []),
+                                batch_size=batch_size,
+                            )),
+                            # Engine copy: linhas em tupla direto para o COPY binário (sem dicts)
+                            ("extract_timephased", lambda: (
+                                reader.iter_assignment_timephased_rows()
+                                if load_engine == "copy"
+                                else reader.iter_assignment_timephased()
+                            )),
+                        ]
+                        import_timephased = (
+                            self._copy_assignment_timephased
+                            if load_engine == "copy"
+                            else self._import_assignment_timephased
+                        )
+                        extraction_class = _PipelinedExtraction if pipelined else _SequentialExtraction
+                        pipeline_start = time.perf_counter()
+                        with extraction_class(extraction_stages, timings) as extraction:
+                            # Fase 11: Extração + import de resources e resource baselines, lote a lote
+                            resource_id_map: Dict[str, int] = {}
+                            for resources_batch, resource_baselines_batch in extraction.batches("extract_resources"):
+                                with Timer("import_resources", timings, accumulate=True):
+                                    batch_resource_ids = self._import_resources(
+                                        cur, masterplan_id, resources_batch, load_engine,
+                                        row_changes["resources"],
+                                    )
+                                    resource_id_map.update(batch_resource_ids)
+                                with Timer("import_baselines", timings, accumulate=True):
+                                    resource_baseline_count += self._import_resource_baselines(
+                                        cur, baseline_id_map, batch_resource_ids, resource_baselines_batch
+                                    )
+                            with Timer("import_resources", timings, accumulate=True):
+                                row_changes["resources"]["deleted"] = self._soft_delete_missing(
+                                    cur, "pm.resource", masterplan_id, list(resource_id_map)
+                                )
+                            _print_timing("extract_resources", timings)
+                            _print_timing("import_resources", timings)
+                            report.resources = len(resource_id_map)
+
+                            # Fase 12: Extração + import de tasks e task baselines, lote a lote
+                            # (dependencies acumulam: a predecessora pode estar em outro lote)
+                            task_id_map: Dict[str, int] = {}
+                            dependencies_data: List[Dict[str, Any]] = []
+                            for tasks_batch, dependencies_batch, task_baselines_batch in extraction.batches("extract_tasks"):
+                                with Timer("import_tasks", timings, accumulate=True):
+                                    batch_task_ids = self._import_tasks(
+                                        cur, masterplan_id, tasks_batch, load_engine,
+                                        row_changes["tasks"],
+                                    )
+                                    task_id_map.update(batch_task_ids)
+                                with Timer("import_baselines", timings, accumulate=True):
+                                    task_baseline_count += self._import_task_baselines(
+                                        cur, baseline_id_map, batch_task_ids, task_baselines_batch
+                                    )
+                                dependencies_data.extend(dependencies_batch)
+                            with Timer("import_tasks", timings, accumulate=True):
+                                row_changes["tasks"]["deleted"] = self._soft_delete_missing(
+                                    cur, "pm.task", masterplan_id, list(task_id_map)
+                                )
+                            _print_timing("extract_tasks", timings)
+                            _print_timing("import_tasks", timings)
+                            report.tasks = len(task_id_map)
+
+                            # Fase 13: Extração + import de assignments, lote a lote
+                            assignment_id_map: Dict[str, int] = {}
+                            for assignments_batch in extraction.batches("extract_assignments"):
+                                with Timer("import_assignments", timings, accumulate=True):
+                                    batch_assignment_ids = self._import_assignments(
+                                        cur, masterplan_id, assignments_batch, task_id_map, resource_id_map,
+                                        load_engine, row_changes["assignments"],
+                                    )
+                                    assignment_id_map.update(batch_assignment_ids)
+                            with Timer("import_assignments", timings, accumulate=True):
+                                row_changes["assignments"]["deleted"] = self._soft_delete_missing(
+                                    cur, "pm.assignment", masterplan_id, list(assignment_id_map),
+                                    delete_all_if_empty=True,
+                                )
+                            _print_timing("extract_assignments", timings)
+                            _print_timing("import_assignments", timings)
+                            report.assignments = len(assignment_id_map)
+
+                            # Fase 14: Extração + import de timephased data, lote a lote
+                            # (IDs dos assignments vêm do import acima, sem reler a tabela)
+                            for timephased_batch, negative_values_count in extraction.batches("extract_timephased"):
+                                with Timer("import_timephased", timings, accumulate=True):
+                                    planned_rows, complete_rows, assignments_with_timephased = import_timephased(
+                                        cur, timephased_batch, assignment_id_map
+                                    )
+                                timephased_planned_rows += planned_rows
+                                timephased_complete_rows += complete_rows
+                                timephased_assignments_with_data += assignments_with_timephased
+                                timephased_negative_values_count += negative_values_count
+                            _print_timing("extract_timephased", timings)
+                            _print_timing("import_timephased", timings)
+
+                        pipeline_elapsed_ms = (time.perf_counter() - pipeline_start) * 1000
+                        # Tempo em que extração e carga rodaram ao mesmo tempo (0 no modo sequencial)
+                        staged_ms = sum(
+                            timings.get(name, 0.0)
+                            for name in (
+                                "extract_resources", "import_resources",
+                                "extract_tasks", "import_tasks",
+                                "extract_assignments", "import_assignments",
+                                "extract_timephased", "import_timephased",
                             )
-                        
-                        # Fase 13: Import tasks
-                        with Timer("import_tasks", timings):
-                            task_count, task_id_map = self._import_tasks(
-                                cur, masterplan_id, tasks_data
-                            )
-                        report.tasks = task_count
-
-                        # Fase 14: Extração de assignments
-                        with Timer("extract_assignments", timings):
-                            assignments_data = reader.get_assignments(
-                                assignment_custom_fields=fields_by_class.get("ASSIGNMENT", [])
-                            )
-                        
-                        # Fase 15: Import assignments
-                        with Timer("import_assignments", timings):
-                            assignment_count = self._import_assignments(
-                                cur, masterplan_id, assignments_data, task_id_map, resource_id_map
-                            )
-                        report.assignments = assignment_count
-
-                        # Fase 16: Extração de timephased data
-                        with Timer("extract_timephased", timings):
-                            timephased_data, negative_values_count = reader.get_assignment_timephased()
-                        
-                        # Fase 17: Import timephased data
-                        with Timer("import_timephased", timings):
-                            planned_rows, complete_rows, assignments_with_timephased = self._import_assignment_timephased(
-                                cur, masterplan_id, timephased_data
-                            )
-                        timephased_planned_rows = planned_rows
-                        timephased_complete_rows = complete_rows
-                        timephased_assignments_with_data = assignments_with_timephased
-                        timephased_negative_values_count = negative_values_count
+                        )
+                        timings["overlap_ms"] = round(max(0.0, staged_ms - pipeline_elapsed_ms), 2) if pipelined else 0.0
 
-                        # Fase 18: Import dependencies (já extraídas no bundle)
+                        # Fase 15: Import dependencies (acumuladas dos lotes de tasks)
                         with Timer("import_dependencies", timings):
                             dependency_count = self._import_dependencies(
-                                cur, masterplan_id, dependencies_data, task_id_map
+                                cur, masterplan_id, dependencies_data, task_id_map, load_engine,
+                                row_changes["dependencies"],
                             )
                         report.dependencies = dependency_count
-
-                        # Fase 19: Import baselines (já extraídas nos bundles)
-                        with Timer("import_baselines", timings):
-                            baseline_id_map = self._import_baselines(
-                                cur, masterplan_id, baselines_meta
-                            )
-                            task_baseline_count = self._import_task_baselines(
-                                cur, baseline_id_map, task_id_map, task_baselines_data
-                            )
-                            resource_baseline_count = self._import_resource_baselines(
-                                cur, baseline_id_map, resource_id_map, resource_baselines_data
-                            )
+                        _print_timing("import_baselines", timings)
+                        
+                        # Throughput da gravação timephased (linhas planned + complete por segundo)
+                        timephased_import_seconds = timings.get("import_timephased", 0.0) / 1000
+                        timephased_rows_per_second = (
+                            round((timephased_planned_rows + timephased_complete_rows) / timephased_import_seconds, 1)
+                            if timephased_import_seconds > 0
+                            else None
+                        )
                         
                         # Atualiza stats com contagens de baseline
                         baseline_count = len(baseline_id_map) if baselines_meta else 0
@@ -549,6 +1135,7 @@ class MPPImporter:
                                         "masterplan_action": report.masterplan_action,
                                         "masterplan_name": report.masterplan_name,
                                         "masterplan_external_id": report.masterplan_external_id,
+                                        "masterplan_external_id_source": masterplan_external_id_source,
                                         "baselines_count": baseline_count,
                                         "task_baselines_count": task_baseline_count,
                                         "resource_baselines_count": resource_baseline_count,
@@ -556,18 +1143,24 @@ class MPPImporter:
                                         "timephased_complete_rows": timephased_complete_rows,
                                         "timephased_assignments_with_data": timephased_assignments_with_data,
                                         "timephased_negative_values_count": timephased_negative_values_count,
+                                        "timephased_rows_per_second": timephased_rows_per_second,
+                                        "row_changes": row_changes,
                                         "optimization": {
                                             "bulk_inserts_enabled": True,
                                             "single_pass_extraction": True,
                                             "baseline_discovery_optimized": True,
+                                            "extraction_engine": engine,
+                                            "streaming_batches": True,
+                                            "batch_size": batch_size,
+                                            "pipelined": pipelined,
+                                            "load_engine": load_engine,
+                                            "content_hash_diff": True,
                                         },
                                     }),
                                     self.created_by,
                                 ),
                             )
                             report.import_log_id = cur.fetchone()[0]
-            finally:
-                conn.close()
 
             report.success = True
 
@@ -583,8 +1176,7 @@ class MPPImporter:
                 report.timings_ms = timings
                 
                 # Conecta novamente para salvar o erro
-                conn = self._connect()
-                try:
+                with self._connection() as conn:
                     with conn.cursor() as cur:
                         cur.execute(
                             """
@@ -621,8 +1213,6 @@ class MPPImporter:
                             ),
                         )
                         report.import_log_id = cur.fetchone()[0]
-                finally:
-                    conn.close()
             except Exception as db_error:
                 # Se falhar ao salvar no banco, apenas loga
                 print(f"Erro ao salvar log de importação no banco: {db_error}")
@@ -718,7 +1308,6 @@ class MPPImporter:
 
         # Prepara linhas de calendários para bulk insert
         calendar_rows: List[Tuple[Any, ...]] = []
-        valid_external_ids: List[str] = []
         parent_updates: List[Tuple[int, str]] = []  # (calendar_id, parent_external_id)
         
         for cal in calendars:
@@ -734,13 +1323,13 @@ class MPPImporter:
                 name,
                 self.created_by,
             ))
-            valid_external_ids.append(external_id)
         
         if not calendar_rows:
             return 0
         
-        # Bulk insert de calendários
-        cur.executemany(
+        # Bulk insert de calendários (IDs vêm do RETURNING, sem SELECT extra)
+        returned = _executemany_returning(
+            cur,
             """
             INSERT INTO pm.calendar (
                 masterplan_id, external_id, name, created_by
@@ -753,24 +1342,11 @@ class MPPImporter:
                 name = EXCLUDED.name,
                 updated_by = EXCLUDED.created_by,
                 updated_at = CURRENT_TIMESTAMP
+            RETURNING id, external_id
             """,
             calendar_rows,
         )
-        
-        # Busca todos os IDs com um único SELECT
-        cur.execute(
-            """
-            SELECT id, external_id FROM pm.calendar
-            WHERE masterplan_id = %s AND external_id = ANY(%s) AND deleted_at IS NULL
-            """,
-            (masterplan_id, valid_external_ids),
-        )
-        
-        external_to_db_id: Dict[str, int] = {}
-        for row in cur.fetchall():
-            calendar_id, external_id = row
-            if external_id:
-                external_to_db_id[external_id] = calendar_id
+        external_to_db_id: Dict[str, int] = {external_id: calendar_id for calendar_id, external_id in returned}
         
         # Prepara updates de parent_calendar_id
         parent_update_rows: List[Tuple[int, int]] = []
@@ -839,12 +1415,12 @@ class MPPImporter:
             
             # Prepara exceptions (expandindo range de datas)
             for exc in cal.get("exceptions", []):
-                from_date_str = exc.get("from_date")
-                to_date_str = exc.get("to_date") or from_date_str
+                from_date_value = exc.get("from_date")
+                to_date_value = exc.get("to_date") or from_date_value
                 is_working = exc.get("working", False)
                 times = exc.get("times", [])
                 
-                if not from_date_str:
+                if not from_date_value:
                     continue
                 
                 # Pega o primeiro horário de trabalho da exceção (se houver)
@@ -857,8 +1433,8 @@ class MPPImporter:
                 
                 # Expande range de datas (from_date até to_date)
                 try:
-                    from_date = datetime.strptime(from_date_str[:10], "%Y-%m-%d").date()
-                    to_date = datetime.strptime(to_date_str[:10], "%Y-%m-%d").date()
+                    from_date = _as_date(from_date_value)
+                    to_date = _as_date(to_date_value)
                     
                     current_date = from_date
                     while current_date <= to_date:
@@ -875,7 +1451,7 @@ class MPPImporter:
                     # Fallback: só insere from_date
                     exception_rows.append((
                         calendar_id,
-                        from_date_str,
+                        from_date_value,
                         is_working,
                         start_time,
                         end_time,
@@ -952,20 +1528,23 @@ class MPPImporter:
         cur,
         masterplan_id: int,
         resources: List[Dict[str, Any]],
-    ) -> Tuple[int, Dict[str, int]]:
-        """Importa recursos do projeto usando bulk insert (otimizado).
+        load_engine: str = "executemany",
+        changes: Optional[Dict[str, int]] = None,
+    ) -> Dict[str, int]:
+        """Importa um lote de recursos do projeto usando bulk insert (otimizado).
+        
+        A marcação dos recursos ausentes do arquivo é feita uma vez, após todos os
+        lotes (_soft_delete_missing). Só recursos novos ou com content_hash
+        diferente do banco são gravados; `changes` acumula as contagens.
         
         Returns:
-            Tuple com:
-            - Número de recursos importados/atualizados
-            - Mapa de external_id -> resource_id (do banco)
+            Mapa de external_id -> resource_id (do banco) dos recursos do lote
         """
         if not resources:
-            return 0, {}
+            return {}
 
         # Prepara todas as linhas em memória
         rows: List[Tuple[Any, ...]] = []
-        valid_external_ids: List[str] = []
         
         for res in resources:
             external_id = res.get("external_id")
@@ -974,9 +1553,7 @@ class MPPImporter:
             if not name or not external_id:
                 continue
             
-            rows.append((
-                masterplan_id,
-                external_id,
+            content = (
                 name,
                 res.get("email"),
                 res.get("type"),
@@ -985,25 +1562,42 @@ class MPPImporter:
                 res.get("standard_rate"),
                 res.get("cost"),
                 res.get("notes"),
-                json.dumps(res.get("custom_fields", {})),
-                self.created_by,
-            ))
-            valid_external_ids.append(external_id)
+                _custom_fields_json(res.get("custom_fields")),
+            )
+            rows.append((masterplan_id, external_id, *content, _content_hash(content), self.created_by))
         
         if not rows:
-            return 0, {}
+            return {}
         
-        # Bulk insert com executemany
+        # Linhas com o mesmo fingerprint no banco não são reescritas
+        rows, external_to_db_id = self._split_unchanged(cur, "pm.resource", masterplan_id, rows, changes)
+        if not rows:
+            return external_to_db_id
+        
+        if load_engine == "copy":
+            returned = self._copy_merge(
+                cur, "pm.resource", _RESOURCE_COLUMNS, rows,
+                key_columns=("masterplan_id", "external_id"),
+                conflict_where="deleted_at IS NULL AND external_id IS NOT NULL",
+                update_columns=_RESOURCE_COLUMNS[2:-1],
+                update_where=_CONTENT_CHANGED.format(table="pm.resource"),
+            )
+            external_to_db_id.update({external_id: resource_id for resource_id, external_id in returned})
+            return external_to_db_id
+        
+        # Bulk insert com executemany;
+        # os IDs das linhas novas e alteradas vêm do RETURNING
         chunk_size = 5000
         for i in range(0, len(rows), chunk_size):
             chunk = rows[i:i + chunk_size]
-            cur.executemany(
+            returned = _executemany_returning(
+                cur,
                 """
                 INSERT INTO pm.resource (
                     masterplan_id, external_id, name, email, type, "group",
-                    max_units, standard_rate, cost, notes, custom_fields, created_by
+                    max_units, standard_rate, cost, notes, custom_fields, content_hash, created_by
                 ) VALUES (
-                    %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
+                    %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
                 )
                 ON CONFLICT (masterplan_id, external_id)
                 WHERE deleted_at IS NULL AND external_id IS NOT NULL
@@ -1017,79 +1611,40 @@ class MPPImporter:
                     cost = EXCLUDED.cost,
                     notes = EXCLUDED.notes,
                     custom_fields = EXCLUDED.custom_fields,
+                    content_hash = EXCLUDED.content_hash,
                     updated_by = EXCLUDED.created_by,
                     updated_at = CURRENT_TIMESTAMP
+                WHERE pm.resource.content_hash IS DISTINCT FROM EXCLUDED.content_hash
+                RETURNING id, external_id
                 """,
                 chunk,
             )
-        
-        # Busca todos os IDs com um único SELECT
-        cur.execute(
-            """
-            SELECT id, external_id FROM pm.resource
-            WHERE masterplan_id = %s AND external_id = ANY(%s) AND deleted_at IS NULL
-            """,
-            (masterplan_id, valid_external_ids),
-        )
-        
-        external_to_db_id: Dict[str, int] = {}
-        for row in cur.fetchall():
-            resource_id, external_id = row
-            if external_id:
-                external_to_db_id[external_id] = resource_id
+            external_to_db_id.update({external_id: resource_id for resource_id, external_id in returned})
 
-        # Marca como deletados os resources que não estão mais no arquivo
-        if valid_external_ids:
-            cur.execute(
-                """
-                UPDATE pm.resource
-                SET deleted_at = CURRENT_TIMESTAMP,
-                    deleted_by = %s,
-                    updated_at = CURRENT_TIMESTAMP
-                WHERE masterplan_id = %s
-                    AND deleted_at IS NULL
-                    AND external_id IS NOT NULL
-                    AND external_id != ALL(%s)
-                """,
-                (self.created_by, masterplan_id, valid_external_ids),
-            )
-            deleted_count = cur.rowcount
-            if deleted_count > 0:
-                # Restaura resources que foram deletados mas voltaram no arquivo
-                cur.execute(
-                    """
-                    UPDATE pm.resource
-                    SET deleted_at = NULL,
-                        deleted_by = NULL,
-                        updated_at = CURRENT_TIMESTAMP
-                    WHERE masterplan_id = %s
-                        AND deleted_at IS NOT NULL
-                        AND external_id = ANY(%s)
-                    """,
-                    (masterplan_id, valid_external_ids),
-                )
-
-        return len(external_to_db_id), external_to_db_id
+        return external_to_db_id
 
     def _import_tasks(
         self,
         cur,
         masterplan_id: int,
         tasks: List[Dict[str, Any]],
-    ) -> Tuple[int, Dict[str, int]]:
-        """Importa tarefas do projeto usando bulk insert (otimizado).
+        load_engine: str = "executemany",
+        changes: Optional[Dict[str, int]] = None,
+    ) -> Dict[str, int]:
+        """Importa um lote de tarefas do projeto usando bulk insert (otimizado).
+        
+        A marcação das tarefas ausentes do arquivo é feita uma vez, após todos os
+        lotes (_soft_delete_missing). Só tarefas novas ou com content_hash
+        diferente do banco são gravadas; `changes` acumula as contagens.
         
         Returns:
-            Tuple com:
-            - Número de tarefas importadas/atualizadas
-            - Mapa de external_id -> task_id (do banco)
+            Mapa de external_id -> task_id (do banco) das tarefas do lote
         """
         if not tasks:
-            return 0, {}
+            return {}
 
         # Prepara todas as linhas em memória
         rows: List[Tuple[Any, ...]] = []
-        valid_external_ids: List[str] = []
         
         for task in tasks:
             external_id = task.get("external_id")
@@ -1098,12 +1653,10 @@ class MPPImporter:
             if not name or not external_id:
                 continue
             
-            rows.append((
-                masterplan_id,
-                external_id,
+            content = (
                 name,
-                parse_iso_datetime(task.get("start")),
-                parse_iso_datetime(task.get("finish")),
+                task.get("start"),
+                task.get("finish"),
                 task.get("duration"),
                 task.get("work"),
                 task.get("percent_complete", 0),
@@ -1113,26 +1666,43 @@ class MPPImporter:
                 task.get("outline_level", 0),
                 task.get("milestone", False),
                 task.get("summary", False),
-                json.dumps(task.get("custom_fields", {})),
-                self.created_by,
-            ))
-            valid_external_ids.append(external_id)
+                _custom_fields_json(task.get("custom_fields")),
+            )
+            rows.append((masterplan_id, external_id, *content, _content_hash(content), self.created_by))
         
         if not rows:
-            return 0, {}
+            return {}
+        
+        # Linhas com o mesmo fingerprint no banco não são reescritas
+        rows, external_to_db_id = self._split_unchanged(cur, "pm.task", masterplan_id, rows, changes)
+        if not rows:
+            return external_to_db_id
+        
+        if load_engine == "copy":
+            returned = self._copy_merge(
+                cur, "pm.task", _TASK_COLUMNS, rows,
+                key_columns=("masterplan_id", "external_id"),
+                conflict_where="deleted_at IS NULL AND external_id IS NOT NULL",
+                update_columns=_TASK_COLUMNS[2:-1],
+                update_where=_CONTENT_CHANGED.format(table="pm.task"),
+            )
+            external_to_db_id.update({external_id: task_id for task_id, external_id in returned})
+            return external_to_db_id
         
-        # Bulk insert com executemany (chunking para evitar SQL muito grande)
+        # Bulk insert com executemany (chunking para evitar SQL muito grande);
+        # os IDs das linhas novas e alteradas vêm do RETURNING
         chunk_size = 5000
         for i in range(0, len(rows), chunk_size):
             chunk = rows[i:i + chunk_size]
-            cur.executemany(
+            returned = _executemany_returning(
+                cur,
                 """
                 INSERT INTO pm.task (
                     masterplan_id, external_id, name, start_date, finish_date,
                     duration, work, percent_complete, priority, notes, wbs,
-                    outline_level, milestone, summary, custom_fields, created_by
+                    outline_level, milestone, summary, custom_fields, content_hash, created_by
                 ) VALUES (
-                    %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
+                    %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
                 )
                 ON CONFLICT (masterplan_id, external_id)
                 WHERE deleted_at IS NULL AND external_id IS NOT NULL
@@ -1150,59 +1720,17 @@ class MPPImporter:
                     milestone = EXCLUDED.milestone,
                     summary = EXCLUDED.summary,
                     custom_fields = EXCLUDED.custom_fields,
+                    content_hash = EXCLUDED.content_hash,
                     updated_by = EXCLUDED.created_by,
                     updated_at = CURRENT_TIMESTAMP
+                WHERE pm.task.content_hash IS DISTINCT FROM EXCLUDED.content_hash
+                RETURNING id, external_id
                 """,
                 chunk,
             )
-        
-        # Busca todos os IDs com um único SELECT
-        cur.execute(
-            """
-            SELECT id, external_id FROM pm.task
-            WHERE masterplan_id = %s AND external_id = ANY(%s) AND deleted_at IS NULL
-            """,
-            (masterplan_id, valid_external_ids),
-        )
-        
-        external_to_db_id: Dict[str, int] = {}
-        for row in cur.fetchall():
-            task_id, external_id = row
-            if external_id:
-                external_to_db_id[external_id] = task_id
-
-        # Marca como deletadas as tasks que não estão mais no arquivo
-        if valid_external_ids:
-            cur.execute(
-                """
-                UPDATE pm.task
-                SET deleted_at = CURRENT_TIMESTAMP,
-                    deleted_by = %s,
-                    updated_at = CURRENT_TIMESTAMP
-                WHERE masterplan_id = %s
-                    AND deleted_at IS NULL
-                    AND external_id IS NOT NULL
-                    AND external_id != ALL(%s)
-                """,
-                (self.created_by, masterplan_id, valid_external_ids),
-            )
-            deleted_count = cur.rowcount
-            if deleted_count > 0:
-                # Restaura tasks que foram deletadas mas voltaram no arquivo
-                cur.execute(
-                    """
-                    UPDATE pm.task
-                    SET deleted_at = NULL,
-                        deleted_by = NULL,
-                        updated_at = CURRENT_TIMESTAMP
-                    WHERE masterplan_id = %s
-                        AND deleted_at IS NOT NULL
-                        AND external_id = ANY(%s)
-                    """,
-                    (masterplan_id, valid_external_ids),
-                )
+            external_to_db_id.update({external_id: task_id for task_id, external_id in returned})
 
-        return len(external_to_db_id), external_to_db_id
+        return external_to_db_id
 
     def _import_assignments(
         self,
@@ -1211,25 +1739,31 @@ class MPPImporter:
         assignments: List[Dict[str, Any]],
         task_id_map: Dict[str, int],
         resource_id_map: Dict[str, int],
-    ) -> int:
-        """Importa assignments usando bulk insert (otimizado).
+        load_engine: str = "executemany",
+        changes: Optional[Dict[str, int]] = None,
+    ) -> Dict[str, int]:
+        """Importa um lote de assignments usando bulk insert (otimizado).
+        
+        Só assignments novos ou com content_hash diferente do banco são gravados.
         
         Args:
             cur: Cursor do banco
             masterplan_id: ID do projeto
-            assignments: Lista de assignments extraídos do .mpp
+            assignments: Lote de assignments extraídos do .mpp
             task_id_map: Mapa de external_id -> task_id (do banco)
             resource_id_map: Mapa de external_id -> resource_id (do banco)
+            load_engine: "executemany" ou "copy" (ver LOAD_ENGINES)
+            changes: Contadores inserted/updated/unchanged acumulados entre lotes
         
         Returns:
-            Número de assignments importados/atualizados
+            Mapa de external_id -> assignment_id (do banco) dos assignments do lote
+            (gravados ou inalterados)
         """
         if not assignments:
-            return 0
+            return {}
 
         # Prepara todas as linhas em memória
         rows: List[Tuple[Any, ...]] = []
-        valid_external_ids: List[str] = []
         
         for assignment in assignments:
             external_id = assignment.get("external_id")
@@ -1242,49 +1776,51 @@ class MPPImporter:
             if not task_id or not resource_id or not external_id:
                 continue
             
-            rows.append((
-                masterplan_id,
-                external_id,
+            content = (
                 task_id,
                 resource_id,
                 assignment.get("work"),
                 assignment.get("cost"),
-                parse_iso_datetime(assignment.get("start")),
-                parse_iso_datetime(assignment.get("finish")),
+                assignment.get("start"),
+                assignment.get("finish"),
                 assignment.get("units"),
                 assignment.get("percent_complete", 0),
-                json.dumps(assignment.get("custom_fields", {})),
-                self.created_by,
-            ))
-            valid_external_ids.append(external_id)
+                _custom_fields_json(assignment.get("custom_fields")),
+            )
+            rows.append((masterplan_id, external_id, *content, _content_hash(content), self.created_by))
         
         if not rows:
-            # Se não há assignments no arquivo, marca todos como deletados
-            cur.execute(
-                """
-                UPDATE pm.assignment
-                SET deleted_at = CURRENT_TIMESTAMP,
-                    deleted_by = %s,
-                    updated_at = CURRENT_TIMESTAMP
-                WHERE masterplan_id = %s
-                    AND deleted_at IS NULL
-                """,
-                (self.created_by, masterplan_id),
+            return {}
+        
+        # Linhas com o mesmo fingerprint no banco não são reescritas
+        rows, external_to_db_id = self._split_unchanged(cur, "pm.assignment", masterplan_id, rows, changes)
+        if not rows:
+            return external_to_db_id
+        
+        if load_engine == "copy":
+            returned = self._copy_merge(
+                cur, "pm.assignment", _ASSIGNMENT_COLUMNS, rows,
+                key_columns=("masterplan_id", "external_id"),
+                conflict_where="deleted_at IS NULL AND external_id IS NOT NULL",
+                update_columns=_ASSIGNMENT_COLUMNS[2:-1],
+                update_where=_CONTENT_CHANGED.format(table="pm.assignment"),
             )
-            return 0
+            external_to_db_id.update({external_id: assignment_id for assignment_id, external_id in returned})
+            return external_to_db_id
         
-        # Bulk insert com executemany
+        # Bulk insert com executemany; os IDs das linhas novas e alteradas vêm do RETURNING
         chunk_size = 5000
         for i in range(0, len(rows), chunk_size):
             chunk = rows[i:i + chunk_size]
-            cur.executemany(
+            returned = _executemany_returning(
+                cur,
                 """
                 INSERT INTO pm.assignment (
                     masterplan_id, external_id, task_id, resource_id,
                     work, cost, start_date, finish_date, units,
-                    percent_complete, custom_fields, created_by
+                    percent_complete, custom_fields, content_hash, created_by
                 ) VALUES (
-                    %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
+                    %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
                 )
                 ON CONFLICT (masterplan_id, external_id)
                 WHERE deleted_at IS NULL AND external_id IS NOT NULL
@@ -1298,42 +1834,248 @@ class MPPImporter:
                     units = EXCLUDED.units,
                     percent_complete = EXCLUDED.percent_complete,
                     custom_fields = EXCLUDED.custom_fields,
+                    content_hash = EXCLUDED.content_hash,
                     updated_by = EXCLUDED.created_by,
                     updated_at = CURRENT_TIMESTAMP
+                WHERE pm.assignment.content_hash IS DISTINCT FROM EXCLUDED.content_hash
+                RETURNING id, external_id
                 """,
                 chunk,
             )
+            external_to_db_id.update({external_id: assignment_id for assignment_id, external_id in returned})
+
+        return external_to_db_id
+
+    def _split_unchanged(
+        self,
+        cur,
+        table: str,
+        masterplan_id: int,
+        rows: List[Tuple[Any, ...]],
+        changes: Optional[Dict[str, int]] = None,
+    ) -> Tuple[List[Tuple[Any, ...]], Dict[str, int]]:
+        """Restaura as linhas do lote que voltaram ao arquivo e separa as inalteradas.
+        
+        As linhas seguem o layout (masterplan_id, external_id, ..., content_hash,
+        created_by). Antes do upsert, a última versão deletada de cada external_id
+        do lote sem linha ativa é restaurada (o upsert só enxerga linhas ativas e
+        criaria uma linha nova). Depois, um SELECT pelo índice (masterplan_id,
+        external_id) lê o id e o fingerprint das linhas ativas do lote.
+        
+        Returns:
+            (linhas a gravar: novas ou alteradas, mapa external_id -> id das linhas
+            que já existem no banco)
+        """
+        external_ids = [row[1] for row in rows]
+        cur.execute(
+            f"""
+            UPDATE {table} t
+            SET deleted_at = NULL,
+                deleted_by = NULL,
+                updated_by = %s,
+                updated_at = CURRENT_TIMESTAMP
+            FROM (
+                SELECT DISTINCT ON (d.external_id) d.id
+                FROM {table} d
+                JOIN unnest(%s::varchar[]) AS f(external_id) ON f.external_id = d.external_id
+                WHERE d.masterplan_id = %s
+                    AND d.deleted_at IS NOT NULL
+                    AND NOT EXISTS (
+                        SELECT 1 FROM {table} a
+                        WHERE a.masterplan_id = d.masterplan_id
+                            AND a.external_id = d.external_id
+                            AND a.deleted_at IS NULL
+                    )
+                ORDER BY d.external_id, d.deleted_at DESC, d.id DESC
+            ) AS latest
+            WHERE t.id = latest.id
+            RETURNING t.external_id
+            """,
+            (self.created_by, external_ids, masterplan_id),
+        )
+        restored_ids = {external_id for (external_id,) in cur.fetchall()}
+
+        cur.execute(
+            f"""
+            SELECT external_id, id, content_hash FROM {table}
+            WHERE masterplan_id = %s AND external_id = ANY(%s) AND deleted_at IS NULL
+            """,
+            (masterplan_id, external_ids),
+        )
+        existing = {external_id: (row_id, content_hash) for external_id, row_id, content_hash in cur.fetchall()}
+
+        pending: List[Tuple[Any, ...]] = []
+        existing_ids: Dict[str, int] = {}
+        inserted = updated = restored = unchanged = 0
+        for row in rows:
+            current = existing.get(row[1])
+            if current is None:
+                inserted += 1
+                pending.append(row)
+                continue
+            existing_ids[row[1]] = current[0]
+            if row[1] in restored_ids:
+                restored += 1
+            elif current[1] == row[-2]:
+                unchanged += 1
+            else:
+                updated += 1
+            if current[1] != row[-2]:
+                pending.append(row)
+
+        if changes is not None:
+            changes["inserted"] = changes.get("inserted", 0) + inserted
+            changes["updated"] = changes.get("updated", 0) + updated
+            changes["restored"] = changes.get("restored", 0) + restored
+            changes["unchanged"] = changes.get("unchanged", 0) + unchanged
+        return pending, existing_ids
+
+    def _copy_merge(
+        self,
+        cur,
+        table: str,
+        columns: Tuple[str, ...],
+        rows: List[Tuple[Any, ...]],
+        key_columns: Tuple[str, ...],
+        conflict_where: str,
+        update_columns: Tuple[str, ...],
+        update_where: Optional[str] = None,
+    ) -> List[Tuple[Any, Any]]:
+        """Carga via COPY em staging temporária + merge set-based (engine "copy").
+        
+        As linhas vão por COPY para uma tabela TEMP (ON COMMIT DROP, criada uma vez
+        por transação e truncada a cada lote) e entram em `table` com um único
+        INSERT ... SELECT ... ON CONFLICT DO UPDATE. Linhas repetidas na mesma chave
+        ficam com a última ocorrência (mesma semântica do executemany).
+        `update_where` restringe o DO UPDATE (ex.: só linhas com content_hash diferente).
+        
+        Returns:
+            Linhas (id, external_id) inseridas/atualizadas (vazio para tabelas sem
+            external_id, como pm.task_dependency)
+        """
+        stage = self._copy_to_stage(cur, table, columns, rows)
+        column_list = ", ".join(columns)
+        key_list = ", ".join(key_columns)
+        update_list = ",\n".join(f"{col} = EXCLUDED.{col}" for col in update_columns)
+        returning = "RETURNING id, external_id" if "external_id" in columns else ""
+        update_filter = f"WHERE {update_where}" if update_where else ""
+
+        cur.execute(
+            f"""
+            INSERT INTO {table} ({column_list})
+            SELECT {column_list} FROM (
+                SELECT DISTINCT ON ({key_list}) *
+                FROM {stage}
+                ORDER BY {key_list}, stage_ord DESC
+            ) AS staged
+            ON CONFLICT ({key_list})
+            WHERE {conflict_where}
+            DO UPDATE SET
+                {update_list},
+                updated_by = EXCLUDED.created_by,
+                updated_at = CURRENT_TIMESTAMP
+            {update_filter}
+            {returning}
+            """
+        )
+        return cur.fetchall() if returning else []
+
+    def _copy_to_stage(
+        self,
+        cur,
+        table: str,
+        columns: Tuple[str, ...],
+        rows: List[Tuple[Any, ...]],
+    ) -> str:
+        """Carrega `rows` via COPY na tabela TEMP de staging de `table`.
+        
+        A staging (ON COMMIT DROP) é criada uma vez por transação com os mesmos
+        tipos de `table` mais a coluna stage_ord (ordem das linhas no lote) e é
+        truncada a cada carga.
+        
+        Returns:
+            Nome da tabela de staging
+        """
+        stage = "_stage_" + table.split(".")[-1]
+        column_list = ", ".join(columns)
+
+        cur.execute(
+            f"""
+            CREATE TEMP TABLE IF NOT EXISTS {stage} ON COMMIT DROP AS
+            SELECT {column_list}, 0::bigint AS stage_ord FROM {table} WITH NO DATA
+            """
+        )
+        cur.execute(f"TRUNCATE {stage}")
+
+        with cur.copy(f"COPY {stage} ({column_list}, stage_ord) FROM STDIN") as copy:
+            for ordinal, row in enumerate(rows):
+                copy.write_row((*row, ordinal))
+        return stage
+
+    def _soft_delete_missing(
+        self,
+        cur,
+        table: str,
+        masterplan_id: int,
+        valid_external_ids: List[str],
+        delete_all_if_empty: bool = False,
+    ) -> int:
+        """Marca como deletadas as linhas de `table` que não estão mais no arquivo.
+        
+        Chamado uma vez por entidade, depois que todos os lotes foram gravados (as
+        linhas que voltaram ao arquivo já foram restauradas lote a lote em
+        _split_unchanged). Os external_ids vão como array e o filtro é um anti-join
+        (NOT EXISTS sobre unnest), que o Postgres resolve com hash anti-join em
+        tempo linear, em vez de `external_id != ALL(...)` comparado linha a linha.
         
-        # Marca como deletados os assignments que não estão mais no arquivo
-        if valid_external_ids:
+        Args:
+            cur: Cursor do banco
+            table: Tabela (pm.resource, pm.task ou pm.assignment)
+            masterplan_id: ID do projeto
+            valid_external_ids: external_ids presentes no arquivo (todos os lotes)
+            delete_all_if_empty: Se True e o arquivo não tiver nenhuma linha,
+                marca todas como deletadas
+        
+        Returns:
+            Número de linhas marcadas como deletadas
+        """
+        if table not in _SOFT_DELETE_TABLES:
+            raise ValueError(f"Tabela sem soft delete por external_id: {table}")
+
+        if not valid_external_ids:
+            if not delete_all_if_empty:
+                return 0
+            # Se não há linhas no arquivo, marca todas como deletadas
             cur.execute(
-                """
-                UPDATE pm.assignment
+                f"""
+                UPDATE {table}
                 SET deleted_at = CURRENT_TIMESTAMP,
                     deleted_by = %s,
                     updated_at = CURRENT_TIMESTAMP
                 WHERE masterplan_id = %s
                     AND deleted_at IS NULL
-                    AND external_id IS NOT NULL
-                    AND external_id != ALL(%s)
                 """,
-                (self.created_by, masterplan_id, valid_external_ids),
-            )
-            # Restaura assignments que foram deletados mas voltaram no arquivo
-            cur.execute(
-                """
-                UPDATE pm.assignment
-                SET deleted_at = NULL,
-                    deleted_by = NULL,
-                    updated_at = CURRENT_TIMESTAMP
-                WHERE masterplan_id = %s
-                    AND deleted_at IS NOT NULL
-                    AND external_id = ANY(%s)
-                """,
-                (masterplan_id, valid_external_ids),
+                (self.created_by, masterplan_id),
             )
+            return cur.rowcount
 
-        return len(rows)
+        cur.execute(
+            f"""
+            UPDATE {table} t
+            SET deleted_at = CURRENT_TIMESTAMP,
+                deleted_by = %s,
+                updated_at = CURRENT_TIMESTAMP
+            WHERE t.masterplan_id = %s
+                AND t.deleted_at IS NULL
+                AND t.external_id IS NOT NULL
+                AND NOT EXISTS (
+                    SELECT 1 FROM unnest(%s::varchar[]) AS f(external_id)
+                    WHERE f.external_id = t.external_id
+                )
+            """,
+            (self.created_by, masterplan_id, valid_external_ids),
+        )
+        return cur.rowcount
 
     def _import_dependencies(
         self,
@@ -1341,24 +2083,33 @@ class MPPImporter:
         masterplan_id: int,
         dependencies: List[Dict[str, Any]],
         task_id_map: Dict[str, int],
+        load_engine: str = "executemany",
+        changes: Optional[Dict[str, int]] = None,
     ) -> int:
-        """Importa dependências usando bulk insert (otimizado).
+        """Reconcilia as dependências do masterplan com as do arquivo em um único statement.
+        
+        Os pares (predecessor, successor) do arquivo chegam como arrays (unnest) no
+        engine executemany ou por COPY na staging no engine copy. Um único statement
+        com CTEs de escrita faz quatro coisas:
+        - marca como deletados os pares que sumiram do arquivo (anti-join);
+        - atualiza os pares ativos cujo tipo ou lag mudou;
+        - restaura a última versão deletada dos pares que voltaram ao arquivo;
+        - insere os pares novos.
+        Pares que não mudaram não são tocados.
         
         Args:
             cur: Cursor do banco
             masterplan_id: ID do projeto
             dependencies: Lista de dependências extraídas do .mpp
             task_id_map: Mapa de external_id -> task_id (do banco)
+            load_engine: "executemany" ou "copy" (ver LOAD_ENGINES)
+            changes: Contadores inserted/updated/restored/unchanged/deleted
         
         Returns:
-            Número de dependências importadas/atualizadas
+            Número de dependências do arquivo gravadas no masterplan
         """
-        if not dependencies:
-            return 0
-
         # Prepara todas as linhas em memória
         rows: List[Tuple[Any, ...]] = []
-        dependency_pairs: List[Tuple[int, int]] = []  # Lista de (predecessor_id, successor_id)
         
         for dep in dependencies:
             predecessor_external_id = dep.get("predecessor_external_id")
@@ -1382,85 +2133,112 @@ class MPPImporter:
                 dep.get("lag"),
                 self.created_by,
             ))
-            dependency_pairs.append((predecessor_task_id, successor_task_id))
         
-        if not rows:
-            # Se não há dependencies no arquivo, marca todas como deletadas
-            cur.execute(
-                """
-                UPDATE pm.task_dependency
+        params: Dict[str, Any] = {"masterplan_id": masterplan_id, "user_id": self.created_by}
+        if load_engine == "copy":
+            stage = self._copy_to_stage(cur, "pm.task_dependency", _DEPENDENCY_COLUMNS, rows)
+            source = f"{stage} AS staged"
+        else:
+            source = """unnest(
+                    %(predecessors)s::int4[], %(successors)s::int4[],
+                    %(types)s::varchar[], %(lags)s::numeric(10, 2)[]
+                ) WITH ORDINALITY AS staged(
+                    predecessor_task_id, successor_task_id, dependency_type, lag, stage_ord
+                )"""
+            params.update(
+                predecessors=[row[1] for row in rows],
+                successors=[row[2] for row in rows],
+                types=[row[3] for row in rows],
+                lags=[row[4] for row in rows],
+            )
+
+        # Pares repetidos no arquivo ficam com a última ocorrência (mesma semântica do upsert)
+        cur.execute(
+            f"""
+            WITH incoming AS (
+                SELECT DISTINCT ON (predecessor_task_id, successor_task_id)
+                    predecessor_task_id, successor_task_id, dependency_type, lag
+                FROM {source}
+                ORDER BY predecessor_task_id, successor_task_id, stage_ord DESC
+            ),
+            existing AS (
+                -- Linha atual de cada par do arquivo: a ativa ou, se não houver, a última deletada
+                SELECT DISTINCT ON (d.predecessor_task_id, d.successor_task_id)
+                    d.id, d.predecessor_task_id, d.successor_task_id,
+                    d.dependency_type, d.lag, d.deleted_at
+                FROM pm.task_dependency d
+                JOIN incoming i
+                    ON i.predecessor_task_id = d.predecessor_task_id
+                    AND i.successor_task_id = d.successor_task_id
+                WHERE d.masterplan_id = %(masterplan_id)s
+                ORDER BY d.predecessor_task_id, d.successor_task_id, d.deleted_at IS NULL DESC, d.id DESC
+            ),
+            deleted AS (
+                UPDATE pm.task_dependency d
                 SET deleted_at = CURRENT_TIMESTAMP,
-                    deleted_by = %s,
+                    deleted_by = %(user_id)s,
                     updated_at = CURRENT_TIMESTAMP
-                WHERE masterplan_id = %s
-                    AND deleted_at IS NULL
-                """,
-                (self.created_by, masterplan_id),
-            )
-            return 0
-        
-        # Bulk insert com executemany
-        chunk_size = 5000
-        for i in range(0, len(rows), chunk_size):
-            chunk = rows[i:i + chunk_size]
-            cur.executemany(
-                """
+                WHERE d.masterplan_id = %(masterplan_id)s
+                    AND d.deleted_at IS NULL
+                    AND NOT EXISTS (
+                        SELECT 1 FROM incoming i
+                        WHERE i.predecessor_task_id = d.predecessor_task_id
+                            AND i.successor_task_id = d.successor_task_id
+                    )
+                RETURNING d.id
+            ),
+            changed AS (
+                UPDATE pm.task_dependency d
+                SET dependency_type = i.dependency_type,
+                    lag = i.lag,
+                    deleted_at = NULL,
+                    deleted_by = NULL,
+                    updated_by = %(user_id)s,
+                    updated_at = CURRENT_TIMESTAMP
+                FROM existing e
+                JOIN incoming i
+                    ON i.predecessor_task_id = e.predecessor_task_id
+                    AND i.successor_task_id = e.successor_task_id
+                WHERE d.id = e.id
+                    AND (
+                        e.deleted_at IS NOT NULL
+                        OR (e.dependency_type, e.lag) IS DISTINCT FROM (i.dependency_type, i.lag)
+                    )
+                RETURNING e.deleted_at IS NOT NULL AS restored
+            ),
+            inserted AS (
                 INSERT INTO pm.task_dependency (
                     masterplan_id, predecessor_task_id, successor_task_id,
                     dependency_type, lag, created_by
-                ) VALUES (
-                    %s, %s, %s, %s, %s, %s
                 )
-                ON CONFLICT (predecessor_task_id, successor_task_id)
-                WHERE deleted_at IS NULL
-                DO UPDATE SET
-                    dependency_type = EXCLUDED.dependency_type,
-                    lag = EXCLUDED.lag,
-                    updated_by = EXCLUDED.created_by,
-                    updated_at = CURRENT_TIMESTAMP
-                """,
-                chunk,
-            )
-        
-        # Marca como deletadas as dependencies que não estão mais no arquivo
-        if dependency_pairs:
-            # Abordagem: marca todas como deletadas primeiro, depois restaura apenas as que estão na lista
-            # Isso evita problemas com tipos compostos no psycopg
-            
-            # Primeiro, marca todas as dependencies do masterplan como deletadas
-            cur.execute(
-                """
-                UPDATE pm.task_dependency
-                SET deleted_at = CURRENT_TIMESTAMP,
-                    deleted_by = %s,
-                    updated_at = CURRENT_TIMESTAMP
-                WHERE masterplan_id = %s
-                    AND deleted_at IS NULL
-                """,
-                (self.created_by, masterplan_id),
+                SELECT %(masterplan_id)s, i.predecessor_task_id, i.successor_task_id,
+                    i.dependency_type, i.lag, %(user_id)s
+                FROM incoming i
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM existing e
+                    WHERE e.predecessor_task_id = i.predecessor_task_id
+                        AND e.successor_task_id = i.successor_task_id
+                )
+                RETURNING id
             )
-            
-            # Depois, restaura apenas as que estão na lista de dependency_pairs
-            # Usa executemany para atualizar cada par individualmente
-            restore_rows = [(masterplan_id, pred_id, succ_id) for pred_id, succ_id in dependency_pairs]
-            if restore_rows:
-                chunk_size = 1000
-                for i in range(0, len(restore_rows), chunk_size):
-                    chunk = restore_rows[i:i + chunk_size]
-                    cur.executemany(
-                        """
-                        UPDATE pm.task_dependency
-                        SET deleted_at = NULL,
-                            deleted_by = NULL,
-                            updated_at = CURRENT_TIMESTAMP
-                        WHERE masterplan_id = %s
-                            AND predecessor_task_id = %s
-                            AND successor_task_id = %s
-                        """,
-                        chunk,
-                    )
+            SELECT
+                (SELECT count(*) FROM incoming),
+                (SELECT count(*) FROM inserted),
+                (SELECT count(*) FROM changed WHERE NOT restored),
+                (SELECT count(*) FROM changed WHERE restored),
+                (SELECT count(*) FROM deleted)
+            """,
+            params,
+        )
+        incoming, inserted, updated, restored, deleted = cur.fetchone()
 
-        return len(rows)
+        if changes is not None:
+            changes["inserted"] = changes.get("inserted", 0) + inserted
+            changes["updated"] = changes.get("updated", 0) + updated
+            changes["restored"] = changes.get("restored", 0) + restored
+            changes["unchanged"] = changes.get("unchanged", 0) + incoming - inserted - updated - restored
+            changes["deleted"] = changes.get("deleted", 0) + deleted
+        return incoming
 
     def _import_baselines(
         self,
@@ -1483,7 +2261,6 @@ class MPPImporter:
 
         # Prepara linhas para bulk insert
         baseline_rows: List[Tuple[Any, ...]] = []
-        valid_external_ids: List[str] = []
         
         for baseline_meta in baselines_meta:
             external_id = baseline_meta.get("external_id")
@@ -1498,13 +2275,13 @@ class MPPImporter:
                 name,
                 self.created_by,
             ))
-            valid_external_ids.append(external_id)
         
         if not baseline_rows:
             return {}
         
-        # Bulk insert de baselines
-        cur.executemany(
+        # Bulk insert de baselines (IDs vêm do RETURNING, sem SELECT extra)
+        returned = _executemany_returning(
+            cur,
             """
             INSERT INTO pm.baseline (
                 masterplan_id, external_id, name, created_by
@@ -1517,26 +2294,37 @@ class MPPImporter:
                 name = EXCLUDED.name,
                 updated_by = EXCLUDED.created_by,
                 updated_at = CURRENT_TIMESTAMP
+            RETURNING id, external_id
             """,
             baseline_rows,
         )
+        return {external_id: baseline_id for baseline_id, external_id in returned}
+
+    def _clear_baseline_values(self, cur, baseline_id_map: Dict[str, int]) -> None:
+        """Remove os valores de baseline (task/resource) das baselines deste import.
         
-        # Busca todos os IDs com um único SELECT
+        Feito uma vez antes dos lotes; cada lote só insere (delete em massa + bulk
+        insert é muito mais rápido que milhares de UPSERTs).
+        """
+        baseline_ids = list({bid for bid in baseline_id_map.values() if bid is not None})
+        if not baseline_ids:
+            return
+
+        # Remove tudo das baselines deste import (hard delete)
         cur.execute(
             """
-            SELECT id, external_id FROM pm.baseline
-            WHERE masterplan_id = %s AND external_id = ANY(%s) AND deleted_at IS NULL
+            DELETE FROM pm.task_baseline
+            WHERE baseline_id = ANY(%s)
             """,
-            (masterplan_id, valid_external_ids),
+            (baseline_ids,),
+        )
+        cur.execute(
+            """
+            DELETE FROM pm.resource_baseline
+            WHERE baseline_id = ANY(%s)
+            """,
+            (baseline_ids,),
         )
-        
-        external_to_db_id: Dict[str, int] = {}
-        for row in cur.fetchall():
-            baseline_id, external_id = row
-            if external_id:
-                external_to_db_id[external_id] = baseline_id
-
-        return external_to_db_id
 
     def _import_task_baselines(
         self,
@@ -1545,7 +2333,7 @@ class MPPImporter:
         task_id_map: Dict[str, int],
         task_baselines: List[Dict[str, Any]],
     ) -> int:
-        """Importa valores de baseline para tasks.
+        """Importa valores de baseline para tasks (um lote; ver _clear_baseline_values).
         
         Args:
             cur: Cursor do banco
@@ -1559,20 +2347,6 @@ class MPPImporter:
         if not task_baselines or not baseline_id_map:
             return 0
 
-        # Otimização: delete em massa + bulk insert (muito mais rápido que milhares de UPSERTs)
-        baseline_ids = list({bid for bid in baseline_id_map.values() if bid is not None})
-        if not baseline_ids:
-            return 0
-
-        # Remove tudo das baselines deste import (hard delete)
-        cur.execute(
-            """
-            DELETE FROM pm.task_baseline
-            WHERE baseline_id = ANY(%s)
-            """,
-            (baseline_ids,),
-        )
-
         rows: list[tuple[Any, ...]] = []
         for tb in task_baselines:
             task_external_id = tb.get("task_external_id")
@@ -1589,8 +2363,8 @@ class MPPImporter:
                 (
                     baseline_id,
                     task_id,
-                    parse_iso_datetime(tb.get("start_date")),
-                    parse_iso_datetime(tb.get("finish_date")),
+                    tb.get("start_date"),
+                    tb.get("finish_date"),
                     tb.get("duration"),
                     tb.get("work"),
                     tb.get("cost"),
@@ -1626,7 +2400,7 @@ class MPPImporter:
         resource_id_map: Dict[str, int],
         resource_baselines: List[Dict[str, Any]],
     ) -> int:
-        """Importa valores de baseline para resources.
+        """Importa valores de baseline para resources (um lote; ver _clear_baseline_values).
         
         Args:
             cur: Cursor do banco
@@ -1640,19 +2414,6 @@ class MPPImporter:
         if not resource_baselines or not baseline_id_map:
             return 0
 
-        baseline_ids = list({bid for bid in baseline_id_map.values() if bid is not None})
-        if not baseline_ids:
-            return 0
-
-        # Remove tudo das baselines deste import (hard delete)
-        cur.execute(
-            """
-            DELETE FROM pm.resource_baseline
-            WHERE baseline_id = ANY(%s)
-            """,
-            (baseline_ids,),
-        )
-
         rows: list[tuple[Any, ...]] = []
         for rb in resource_baselines:
             resource_external_id = rb.get("resource_external_id")
@@ -1695,18 +2456,21 @@ class MPPImporter:
 
         return len(rows)
 
-    def _import_assignment_timephased(
+    def _copy_assignment_timephased(
         self,
         cur,
-        masterplan_id: int,
-        timephased_data: List[Dict[str, Any]],
+        entries: List[Tuple[str, List[Tuple[Any, ...]], List[Tuple[Any, ...]]]],
+        assignment_map: Dict[str, int],
     ) -> Tuple[int, int, int]:
-        """Importa dados timephased (planned e complete) de assignments.
+        """Importa um lote timephased com COPY binário (engine "copy").
+        
+        Consome as linhas de MPPReader.iter_assignment_timephased_rows direto no
+        COPY FROM STDIN (FORMAT BINARY), sem dicts nem strings ISO.
         
         Args:
             cur: Cursor do banco
-            masterplan_id: ID do projeto
-            timephased_data: Lista de timephased data extraída do .mpp
+            entries: Lote de (assignment_external_id, planned_rows, complete_rows)
+            assignment_map: Mapa de external_id -> assignment_id (de _import_assignments)
         
         Returns:
             Tuple com:
@@ -1714,23 +2478,86 @@ class MPPImporter:
             - Número de linhas complete importadas
             - Número de assignments com dados timephased
         """
-        if not timephased_data:
+        resolved: List[Tuple[int, List[Tuple[Any, ...]], List[Tuple[Any, ...]]]] = []
+        for assignment_external_id, planned_rows, complete_rows in entries:
+            assignment_id = assignment_map.get(assignment_external_id) if assignment_external_id else None
+            if assignment_id and (planned_rows or complete_rows):
+                resolved.append((assignment_id, planned_rows, complete_rows))
+
+        if not resolved:
             return 0, 0, 0
 
-        # Constrói mapa de assignment_external_id -> assignment_id
-        # Busca todos os assignments do projeto
+        assignment_ids = [assignment_id for assignment_id, _, _ in resolved]
+
+        # Delete físico em massa dos dados antigos
+        cur.execute(
+            """
+            DELETE FROM pm.assignment_timephased_planned
+            WHERE assignment_id = ANY(%s) AND deleted_at IS NULL
+            """,
+            (assignment_ids,),
+        )
         cur.execute(
             """
-            SELECT id, external_id FROM pm.assignment
-            WHERE masterplan_id = %s AND deleted_at IS NULL
+            DELETE FROM pm.assignment_timephased_complete
+            WHERE assignment_id = ANY(%s) AND deleted_at IS NULL
             """,
-            (masterplan_id,),
+            (assignment_ids,),
         )
-        assignment_map: Dict[str, int] = {}
-        for row in cur.fetchall():
-            assignment_id, external_id = row
-            if external_id:
-                assignment_map[external_id] = assignment_id
+
+        counts = []
+        for table, position in (
+            ("pm.assignment_timephased_planned", 1),
+            ("pm.assignment_timephased_complete", 2),
+        ):
+            count = 0
+            with cur.copy(
+                f"""
+                COPY {table} (
+                    assignment_id, period_start, period_end,
+                    work, cost, units, created_by
+                ) FROM STDIN (FORMAT BINARY)
+                """
+            ) as copy:
+                copy.set_types(_TIMEPHASED_COPY_TYPES)
+                for entry in resolved:
+                    assignment_id = entry[0]
+                    for period_start, period_end, work, cost, units in entry[position]:
+                        copy.write_row((
+                            assignment_id,
+                            period_start,
+                            period_end,
+                            _to_numeric(work),
+                            _to_numeric(cost),
+                            _to_numeric(units),
+                            self.created_by,
+                        ))
+                        count += 1
+            counts.append(count)
+
+        return counts[0], counts[1], len(resolved)
+
+    def _import_assignment_timephased(
+        self,
+        cur,
+        timephased_data: List[Dict[str, Any]],
+        assignment_map: Dict[str, int],
+    ) -> Tuple[int, int, int]:
+        """Importa um lote de dados timephased (planned e complete) de assignments.
+        
+        Args:
+            cur: Cursor do banco
+            timephased_data: Lote de timephased data extraída do .mpp
+            assignment_map: Mapa de external_id -> assignment_id (de _import_assignments)
+        
+        Returns:
+            Tuple com:
+            - Número de linhas planned importadas
+            - Número de linhas complete importadas
+            - Número de assignments com dados timephased
+        """
+        if not timephased_data:
+            return 0, 0, 0
 
         # Coleta assignment_ids que têm dados timephased
         assignment_ids_to_process: List[int] = []
@@ -1756,8 +2583,8 @@ class MPPImporter:
             for period in planned_periods:
                 planned_rows_data.append((
                     assignment_id,
-                    parse_iso_datetime(period.get("period_start")),
-                    parse_iso_datetime(period.get("period_end")),
+                    period.get("period_start"),
+                    period.get("period_end"),
                     period.get("work"),
                     period.get("cost"),
                     period.get("units"),
@@ -1768,8 +2595,8 @@ class MPPImporter:
             for period in complete_periods:
                 complete_rows_data.append((
                     assignment_id,
-                    parse_iso_datetime(period.get("period_start")),
-                    parse_iso_datetime(period.get("period_end")),
+                    period.get("period_start"),
+                    period.get("period_end"),
                     period.get("work"),
                     period.get("cost"),
                     period.get("units"),
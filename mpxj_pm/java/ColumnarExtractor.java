@@ -0,0 +1,322 @@
+package mpxjpm;
+
+import java.time.LocalDateTime;
+import java.time.ZoneOffset;
+import java.util.ArrayList;
+import java.util.List;
+
+import org.mpxj.Duration;
+import org.mpxj.ProjectCalendar;
+import org.mpxj.ProjectFile;
+import org.mpxj.ProjectProperties;
+import org.mpxj.Rate;
+import org.mpxj.Relation;
+import org.mpxj.Resource;
+import org.mpxj.ResourceAssignment;
+import org.mpxj.Task;
+import org.mpxj.TimeUnit;
+import org.mpxj.TimeUnitDefaultsContainer;
+
+/**
+ * Extração colunar do ProjectFile para o MPPColumnarReader (mpxj_pm/mpp.py).
+ *
+ * Percorre tasks/resources/assignments uma única vez e devolve um array primitivo
+ * por campo, de modo que o Python faz uma travessia JPype por coluna em vez de uma
+ * por getter/entidade.
+ *
+ * Convenções de nulos: datas = Long.MIN_VALUE, inteiros = Integer.MIN_VALUE,
+ * doubles = NaN. Datas são milissegundos "wall clock" desde 1970 (LocalDateTime
+ * em UTC), sem conversão de fuso. Strings são concatenadas com '\0' em uma única
+ * String por coluna (null vira "").
+ *
+ * Durações saem em segundos inteiros, com a mesma normalização do JsonWriter
+ * (zero vira NaN; dias/semanas convertidos pelo calendário efetivo da task ou
+ * pelas ProjectProperties). O Python converte para dias/horas.
+ */
+public final class ColumnarExtractor
+{
+   public static final long NULL_DATE = Long.MIN_VALUE;
+   public static final int NULL_INT = Integer.MIN_VALUE;
+   public static final String SEPARATOR = "\0";
+
+   private ColumnarExtractor()
+   {
+   }
+
+   public static final class TaskColumns
+   {
+      public int count;
+      public int[] uniqueId;
+      public int[] id;
+      public String name;
+      public long[] start;
+      public long[] finish;
+      public double[] duration;
+      public double[] work;
+      public double[] percentComplete;
+      public int[] priority;
+      public String notes;
+      public String wbs;
+      public int[] outlineLevel;
+      public boolean[] milestone;
+      public boolean[] summary;
+
+      // Relações (predecessoras) achatadas: uma linha por Relation
+      public int relationCount;
+      public int[] relationPredecessorUniqueId;
+      public int[] relationSuccessorUniqueId;
+      public String relationType;
+      public double[] relationLag;
+   }
+
+   public static final class ResourceColumns
+   {
+      public int count;
+      public int[] uniqueId;
+      public int[] id;
+      public String name;
+      public String email;
+      public String type;
+      public String group;
+      public double[] maxUnits;
+      public double[] standardRate;
+      public double[] cost;
+      public String notes;
+   }
+
+   public static final class AssignmentColumns
+   {
+      public int count;
+      public int[] uniqueId;
+      public int[] taskUniqueId;
+      public int[] resourceUniqueId;
+      public double[] work;
+      public double[] cost;
+      public long[] start;
+      public long[] finish;
+      public double[] units;
+      public double[] percentWorkComplete;
+   }
+
+   public static TaskColumns tasks(ProjectFile project)
+   {
+      List<Task> tasks = new ArrayList<>();
+      for (Task task : project.getTasks())
+      {
+         if (task != null && task.getUniqueID() != null)
+         {
+            tasks.add(task);
+         }
+      }
+
+      int n = tasks.size();
+      TaskColumns c = new TaskColumns();
+      c.count = n;
+      c.uniqueId = new int[n];
+      c.id = new int[n];
+      c.start = new long[n];
+      c.finish = new long[n];
+      c.duration = new double[n];
+      c.work = new double[n];
+      c.percentComplete = new double[n];
+      c.priority = new int[n];
+      c.outlineLevel = new int[n];
+      c.milestone = new boolean[n];
+      c.summary = new boolean[n];
+      StringBuilder name = new StringBuilder();
+      StringBuilder notes = new StringBuilder();
+      StringBuilder wbs = new StringBuilder();
+
+      List<int[]> relationIds = new ArrayList<>();
+      List<String> relationTypes = new ArrayList<>();
+      List<Double> relationLags = new ArrayList<>();
+      ProjectProperties properties = project.getProjectProperties();
+
+      for (int i = 0; i < n; i++)
+      {
+         Task task = tasks.get(i);
+         ProjectCalendar calendar = task.getEffectiveCalendar();
+         TimeUnitDefaultsContainer defaults = calendar == null ? properties : calendar;
+         c.uniqueId[i] = task.getUniqueID().intValue();
+         c.id[i] = intValue(task.getID());
+         append(name, i, task.getName());
+         c.start[i] = epochMillis(task.getStart());
+         c.finish[i] = epochMillis(task.getFinish());
+         c.duration[i] = durationSeconds(task.getDuration(), defaults);
+         c.work[i] = durationSeconds(task.getWork(), defaults);
+         c.percentComplete[i] = doubleValue(task.getPercentageComplete());
+         c.priority[i] = task.getPriority() == null ? NULL_INT : task.getPriority().getValue();
+         append(notes, i, task.getNotes());
+         append(wbs, i, task.getWBS());
+         c.outlineLevel[i] = intValue(task.getOutlineLevel());
+         c.milestone[i] = task.getMilestone();
+         c.summary[i] = task.getSummary();
+
+         List<Relation> predecessors = task.getPredecessors();
+         if (predecessors != null)
+         {
+            for (Relation relation : predecessors)
+            {
+               Task predecessor = relation.getPredecessorTask();
+               if (predecessor == null || predecessor.getUniqueID() == null)
+               {
+                  continue;
+               }
+               relationIds.add(new int[] {predecessor.getUniqueID().intValue(), c.uniqueId[i]});
+               relationTypes.add(relation.getType() == null ? "" : relation.getType().toString());
+               relationLags.add(Double.valueOf(durationSeconds(relation.getLag(), properties)));
+            }
+         }
+      }
+
+      c.name = name.toString();
+      c.notes = notes.toString();
+      c.wbs = wbs.toString();
+
+      int r = relationIds.size();
+      c.relationCount = r;
+      c.relationPredecessorUniqueId = new int[r];
+      c.relationSuccessorUniqueId = new int[r];
+      c.relationLag = new double[r];
+      StringBuilder relationType = new StringBuilder();
+      for (int i = 0; i < r; i++)
+      {
+         c.relationPredecessorUniqueId[i] = relationIds.get(i)[0];
+         c.relationSuccessorUniqueId[i] = relationIds.get(i)[1];
+         c.relationLag[i] = relationLags.get(i).doubleValue();
+         append(relationType, i, relationTypes.get(i));
+      }
+      c.relationType = relationType.toString();
+
+      return c;
+   }
+
+   public static ResourceColumns resources(ProjectFile project)
+   {
+      List<Resource> resources = new ArrayList<>();
+      for (Resource resource : project.getResources())
+      {
+         if (resource != null && resource.getUniqueID() != null)
+         {
+            resources.add(resource);
+         }
+      }
+
+      int n = resources.size();
+      ResourceColumns c = new ResourceColumns();
+      c.count = n;
+      c.uniqueId = new int[n];
+      c.id = new int[n];
+      c.maxUnits = new double[n];
+      c.standardRate = new double[n];
+      c.cost = new double[n];
+      StringBuilder name = new StringBuilder();
+      StringBuilder email = new StringBuilder();
+      StringBuilder type = new StringBuilder();
+      StringBuilder group = new StringBuilder();
+      StringBuilder notes = new StringBuilder();
+
+      for (int i = 0; i < n; i++)
+      {
+         Resource resource = resources.get(i);
+         c.uniqueId[i] = resource.getUniqueID().intValue();
+         c.id[i] = intValue(resource.getID());
+         append(name, i, resource.getName());
+         append(email, i, resource.getEmailAddress());
+         append(type, i, resource.getType() == null ? null : resource.getType().toString());
+         append(group, i, resource.getGroup());
+         c.maxUnits[i] = doubleValue(resource.getMaxUnits());
+         Rate rate = resource.getStandardRate();
+         c.standardRate[i] = rate == null ? Double.NaN : rate.getAmount();
+         c.cost[i] = doubleValue(resource.getCost());
+         append(notes, i, resource.getNotes());
+      }
+
+      c.name = name.toString();
+      c.email = email.toString();
+      c.type = type.toString();
+      c.group = group.toString();
+      c.notes = notes.toString();
+      return c;
+   }
+
+   public static AssignmentColumns assignments(ProjectFile project)
+   {
+      List<ResourceAssignment> assignments = new ArrayList<>();
+      for (ResourceAssignment assignment : project.getResourceAssignments())
+      {
+         if (assignment != null)
+         {
+            assignments.add(assignment);
+         }
+      }
+
+      int n = assignments.size();
+      AssignmentColumns c = new AssignmentColumns();
+      c.count = n;
+      c.uniqueId = new int[n];
+      c.taskUniqueId = new int[n];
+      c.resourceUniqueId = new int[n];
+      c.work = new double[n];
+      c.cost = new double[n];
+      c.start = new long[n];
+      c.finish = new long[n];
+      c.units = new double[n];
+      c.percentWorkComplete = new double[n];
+      ProjectProperties properties = project.getProjectProperties();
+
+      for (int i = 0; i < n; i++)
+      {
+         ResourceAssignment assignment = assignments.get(i);
+         c.uniqueId[i] = intValue(assignment.getUniqueID());
+         Task task = assignment.getTask();
+         c.taskUniqueId[i] = task == null ? NULL_INT : intValue(task.getUniqueID());
+         Resource resource = assignment.getResource();
+         c.resourceUniqueId[i] = resource == null ? NULL_INT : intValue(resource.getUniqueID());
+         c.work[i] = durationSeconds(assignment.getWork(), properties);
+         c.cost[i] = doubleValue(assignment.getCost());
+         c.start[i] = epochMillis(assignment.getStart());
+         c.finish[i] = epochMillis(assignment.getFinish());
+         c.units[i] = doubleValue(assignment.getUnits());
+         c.percentWorkComplete[i] = doubleValue(assignment.getPercentageWorkComplete());
+      }
+
+      return c;
+   }
+
+   private static void append(StringBuilder builder, int index, String value)
+   {
+      if (index > 0)
+      {
+         builder.append(SEPARATOR);
+      }
+      if (value != null)
+      {
+         builder.append(value.replace(SEPARATOR, ""));
+      }
+   }
+
+   private static long epochMillis(LocalDateTime value)
+   {
+      return value == null ? NULL_DATE : value.toInstant(ZoneOffset.UTC).toEpochMilli();
+   }
+
+   private static int intValue(Number value)
+   {
+      return value == null ? NULL_INT : value.intValue();
+   }
+
+   private static double doubleValue(Number value)
+   {
+      return value == null ? Double.NaN : value.doubleValue();
+   }
+
+   private static double durationSeconds(Duration value, TimeUnitDefaultsContainer defaults)
+   {
+      if (value == null || value.getDuration() == 0)
+      {
+         return Double.NaN;
+      }
+      return (long) (value.convertUnits(TimeUnit.MINUTES, defaults).getDuration() * 60.0);
+   }
+}
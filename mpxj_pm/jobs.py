@@ -0,0 +1,334 @@
+"""Fila de imports assíncronos em Postgres (tabela pm.import_job).
+
+Fluxo:
+- A API grava o .mpp no S3 e chama `enqueue_job` (status "queued"), respondendo
+  202 com o id do job.
+- Workers (scripts/import_worker.py, um ou mais por task ECS) chamam
+  `claim_next_job`, que pega o job mais antigo com FOR UPDATE SKIP LOCKED: vários
+  workers consomem a fila sem disputar a mesma linha.
+- `run_job` baixa o arquivo, roda MPPImporter.import_project e grava a fase atual
+  (nomes dos Timers do importer) e os timings em `phase`/`progress`, que o
+  `GET /imports/{id}` devolve.
+
+Um job "running" sem heartbeat há JOB_STALE_SECONDS (worker morto no meio do
+import) volta a ser elegível no claim, até JOB_MAX_ATTEMPTS tentativas; depois
+disso é marcado como "failed".
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+from .db import coerce_float, coerce_int
+from .importer import ImportReport, MPPImporter
+
+JOB_STATUSES = ("queued", "running", "completed", "failed")
+
+# Parâmetros de import_project aceitos em pm.import_job.options
+JOB_OPTIONS = ("engine", "pipelined", "parallel_threads", "load_engine", "force")
+
+# Segundos sem heartbeat para considerar o worker morto (job volta para a fila)
+JOB_STALE_SECONDS = coerce_float(os.getenv("IMPORT_JOB_STALE_SECONDS")) or 300.0
+# Tentativas por job (a primeira conta) antes de marcá-lo como failed
+JOB_MAX_ATTEMPTS = coerce_int(os.getenv("IMPORT_JOB_MAX_ATTEMPTS")) or 3
+# Intervalo do heartbeat enquanto o job roda (fases longas não atualizam progresso)
+JOB_HEARTBEAT_SECONDS = coerce_float(os.getenv("IMPORT_JOB_HEARTBEAT_SECONDS")) or 30.0
+# Intervalo mínimo entre gravações de progresso dentro da mesma fase
+JOB_PROGRESS_MIN_INTERVAL = 2.0
+
+# Baixa file_storage_path (ex.: s3://bucket/key) para o caminho local informado
+Downloader = Callable[[str, str], None]
+
+_JOB_COLUMNS = """
+    id, status, source_file, file_storage_path, file_hash, masterplan_external_id,
+    options, phase, progress, worker_id, attempts, heartbeat_at, started_at, finished_at,
+    masterplan_id, import_log_id, result, error_message, created_at, created_by
+"""
+
+
+@dataclass
+class ImportJob:
+    """Job de import retirado da fila por um worker."""
+
+    id: int
+    source_file: str
+    file_storage_path: str
+    file_hash: Optional[str]
+    masterplan_external_id: Optional[str]
+    created_by: int
+    attempts: int = 0
+    options: Dict[str, Any] = field(default_factory=dict)
+
+
+def default_worker_id() -> str:
+    """Identifica o worker nos jobs (host:pid)."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def enqueue_job(
+    pool,
+    source_file: str,
+    file_storage_path: str,
+    created_by: int,
+    file_hash: Optional[str] = None,
+    masterplan_external_id: Optional[str] = None,
+    options: Optional[Dict[str, Any]] = None,
+) -> int:
+    """Cria um job "queued" e retorna o id."""
+    options = {k: v for k, v in (options or {}).items() if k in JOB_OPTIONS}
+    with pool.connection() as conn:
+        row = conn.execute(
+            """
+            INSERT INTO pm.import_job (
+                source_file, file_storage_path, file_hash, masterplan_external_id,
+                options, created_by
+            ) VALUES (%s, %s, %s, %s, %s, %s)
+            RETURNING id
+            """,
+            (source_file, file_storage_path, file_hash, masterplan_external_id, json.dumps(options), created_by),
+        ).fetchone()
+    return row[0]
+
+
+def claim_next_job(pool, worker_id: str) -> Optional[ImportJob]:
+    """Pega o próximo job da fila (ou um "running" abandonado) para este worker.
+
+    O SELECT ... FOR UPDATE SKIP LOCKED e o UPDATE para "running" rodam em uma
+    transação curta: o lock só vale até o commit, depois disso o status e o
+    heartbeat é que afastam os outros workers.
+    """
+    with pool.connection() as conn:
+        # Abandonados que já esgotaram as tentativas não voltam para a fila
+        conn.execute(
+            """
+            UPDATE pm.import_job
+            SET status = 'failed', finished_at = CURRENT_TIMESTAMP,
+                error_message = 'Worker interrompido durante o import (tentativas esgotadas)'
+            WHERE status = 'running' AND attempts >= %s
+                AND heartbeat_at < CURRENT_TIMESTAMP - make_interval(secs => %s)
+            """,
+            (JOB_MAX_ATTEMPTS, JOB_STALE_SECONDS),
+        )
+        row = conn.execute(
+            """
+            UPDATE pm.import_job j
+            SET status = 'running', worker_id = %s, attempts = j.attempts + 1,
+                phase = NULL, progress = NULL, error_message = NULL,
+                started_at = CURRENT_TIMESTAMP, heartbeat_at = CURRENT_TIMESTAMP
+            WHERE j.id = (
+                SELECT id FROM pm.import_job
+                WHERE status = 'queued'
+                    OR (status = 'running' AND attempts < %s
+                        AND heartbeat_at < CURRENT_TIMESTAMP - make_interval(secs => %s))
+                ORDER BY id
+                LIMIT 1
+                FOR UPDATE SKIP LOCKED
+            )
+            RETURNING j.id, j.source_file, j.file_storage_path, j.file_hash,
+                j.masterplan_external_id, j.created_by, j.attempts, j.options
+            """,
+            (worker_id, JOB_MAX_ATTEMPTS, JOB_STALE_SECONDS),
+        ).fetchone()
+    if not row:
+        return None
+    return ImportJob(*row[:7], options=row[7] or {})
+
+
+def heartbeat(pool, job_id: int, worker_id: str) -> None:
+    """Renova o heartbeat do job (só se ele ainda pertence a este worker)."""
+    with pool.connection() as conn:
+        conn.execute(
+            """
+            UPDATE pm.import_job SET heartbeat_at = CURRENT_TIMESTAMP
+            WHERE id = %s AND worker_id = %s AND status = 'running'
+            """,
+            (job_id, worker_id),
+        )
+
+
+def update_progress(pool, job_id: int, worker_id: str, phase: str, timings: Dict[str, float]) -> None:
+    """Grava a fase atual e os timings já medidos (também vale como heartbeat).
+
+    Mesma guarda do heartbeat: um worker que perdeu o job (reenfileirado e pego
+    por outro) não sobrescreve o progresso nem mantém o job vivo.
+    """
+    with pool.connection() as conn:
+        conn.execute(
+            """
+            UPDATE pm.import_job
+            SET phase = %s, progress = %s, heartbeat_at = CURRENT_TIMESTAMP
+            WHERE id = %s AND worker_id = %s AND status = 'running'
+            """,
+            (phase, json.dumps(timings), job_id, worker_id),
+        )
+
+
+def progress_callback(pool, job_id: int, worker_id: str, min_interval: float = JOB_PROGRESS_MIN_INTERVAL):
+    """Callback para import_project(progress=...) que grava o progresso do job.
+
+    Grava sempre que a fase muda; dentro da mesma fase (Timers acumulados lote a
+    lote) no máximo a cada `min_interval` segundos. A gravação usa outra conexão
+    do pool, fora da transação do import, para ficar visível no GET /imports/{id}.
+    """
+    last = {"phase": None, "at": 0.0}
+
+    def progress(phase: str, timings: Dict[str, float]) -> None:
+        now = time.monotonic()
+        if phase == last["phase"] and now - last["at"] < min_interval:
+            return
+        last["phase"], last["at"] = phase, now
+        update_progress(pool, job_id, worker_id, phase, timings)
+
+    return progress
+
+
+def finish_job(pool, job_id: int, worker_id: str, report: ImportReport) -> bool:
+    """Grava o resultado do import: "completed" ou "failed" conforme report.success.
+
+    Só vale enquanto o job ainda é deste worker e está "running" (como o heartbeat):
+    um job reenfileirado e pego por outro worker não é sobrescrito. Retorna False
+    nesse caso.
+    """
+    with pool.connection() as conn:
+        cur = conn.execute(
+            """
+            UPDATE pm.import_job
+            SET status = %s, phase = NULL, progress = %s, result = %s, error_message = %s,
+                masterplan_id = %s, import_log_id = %s, finished_at = CURRENT_TIMESTAMP
+            WHERE id = %s AND worker_id = %s AND status = 'running'
+            """,
+            (
+                "completed" if report.success else "failed",
+                json.dumps(report.timings_ms),
+                json.dumps(report.to_dict()),
+                report.error_message,
+                report.masterplan_id,
+                report.import_log_id,
+                job_id,
+                worker_id,
+            ),
+        )
+        return cur.rowcount == 1
+
+
+def fail_job(pool, job_id: int, worker_id: str, error: str) -> bool:
+    """Marca o job como "failed" por erro fora do import (download, configuração).
+
+    Mesma guarda de finish_job (worker e status "running"); retorna False se o job
+    já não é deste worker.
+    """
+    with pool.connection() as conn:
+        cur = conn.execute(
+            """
+            UPDATE pm.import_job
+            SET status = 'failed', error_message = %s, finished_at = CURRENT_TIMESTAMP
+            WHERE id = %s AND worker_id = %s AND status = 'running'
+            """,
+            (error, job_id, worker_id),
+        )
+        return cur.rowcount == 1
+
+
+def get_job(pool, job_id: int) -> Optional[Dict[str, Any]]:
+    """Estado do job para o GET /imports/{id} (None se não existe)."""
+    with pool.connection() as conn:
+        cur = conn.execute(f"SELECT {_JOB_COLUMNS} FROM pm.import_job WHERE id = %s", (job_id,))
+        row = cur.fetchone()
+        if not row:
+            return None
+        job = dict(zip((d.name for d in cur.description), row))
+    for key in ("heartbeat_at", "started_at", "finished_at", "created_at"):
+        if job[key] is not None:
+            job[key] = job[key].isoformat()
+    return job
+
+
+def run_job(pool, job: ImportJob, download: Downloader, worker_id: str) -> ImportReport:
+    """Baixa o arquivo do job, importa e grava o resultado em pm.import_job.
+
+    Um heartbeat em thread própria mantém o job vivo durante fases longas (ex.:
+    read_mpp_file de arquivos grandes), que não disparam callbacks de progresso.
+    """
+    stop = threading.Event()
+
+    def beat() -> None:
+        while not stop.wait(JOB_HEARTBEAT_SECONDS):
+            try:
+                heartbeat(pool, job.id, worker_id)
+            except Exception as e:
+                print(f"Aviso: Erro no heartbeat do job {job.id}: {e}")
+
+    beater = threading.Thread(target=beat, name=f"import-job-{job.id}-heartbeat", daemon=True)
+    beater.start()
+    fd, tmp_path = tempfile.mkstemp(suffix=".mpp")
+    os.close(fd)
+    try:
+        update_progress(pool, job.id, worker_id, "download", {})
+        download(job.file_storage_path, tmp_path)
+
+        importer = MPPImporter(created_by=job.created_by, pool=pool)
+        report = importer.import_project(
+            tmp_path,
+            source_file=job.source_file,
+            file_storage_path=job.file_storage_path,
+            file_hash=job.file_hash,
+            masterplan_external_id=job.masterplan_external_id,
+            progress=progress_callback(pool, job.id, worker_id),
+            **{k: v for k, v in job.options.items() if k in JOB_OPTIONS},
+        )
+        if not finish_job(pool, job.id, worker_id, report):
+            print(f"Aviso: Job {job.id} não pertence mais a {worker_id}; resultado descartado")
+        return report
+    except Exception as e:
+        if not fail_job(pool, job.id, worker_id, str(e)):
+            print(f"Aviso: Job {job.id} não pertence mais a {worker_id}; erro descartado")
+        raise
+    finally:
+        stop.set()
+        beater.join()
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def run_worker(
+    pool,
+    download: Downloader,
+    worker_id: Optional[str] = None,
+    poll_interval: float = 5.0,
+    stop: Optional[threading.Event] = None,
+    once: bool = False,
+) -> int:
+    """Consome a fila até `stop` ser sinalizado; retorna quantos jobs processou.
+
+    O job em andamento sempre termina antes de sair (o sinal só é checado entre
+    jobs). Com once=True processa no máximo um job e retorna.
+    """
+    worker_id = worker_id or default_worker_id()
+    stop = stop or threading.Event()
+    processed = 0
+    while not stop.is_set():
+        job = claim_next_job(pool, worker_id)
+        if job is None:
+            if once:
+                break
+            stop.wait(poll_interval)
+            continue
+
+        print(f"[{worker_id}] Job {job.id} ({job.source_file}, tentativa {job.attempts})")
+        try:
+            report = run_job(pool, job, download, worker_id)
+            status = "ok" if report.success else f"falhou: {report.error_message}"
+            print(f"[{worker_id}] Job {job.id} {status} ({report.total_time_seconds():.2f}s)")
+        except Exception as e:
+            print(f"[{worker_id}] Job {job.id} falhou: {e}")
+        processed += 1
+        if once:
+            break
+    return processed
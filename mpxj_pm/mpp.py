@@ -2,21 +2,55 @@
 
 from __future__ import annotations
 
+import array
+import io
+import json
+import math
+import os
 import sys
-from datetime import datetime
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, BinaryIO, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
+try:
+    import numpy as np  # opcional: colunas do engine "columnar" viram ndarrays
+except ImportError:  # pragma: no cover
+    np = None
+
+try:
+    # Decoder JSON rápido (opcional); cai para o json da stdlib se ausente
+    import orjson
+
+    def _json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+except ImportError:  # pragma: no cover
+    def _json_loads(data: bytes) -> Any:
+        return json.loads(data)
 
 # Cache global para classes Java (evita lookup repetido)
 _java_classes: Dict[str, Any] = {}
 
+# Diretório dos helpers Java empacotados (mpxj_pm/java/*.jar)
+_HELPERS_DIR = str(Path(__file__).resolve().parent / "java")
+
+# Cronograma pequeno (MSPDI) usado no warm-up do JIT
+WARMUP_SAMPLE = str(Path(__file__).resolve().parent / "samples" / "warmup.xml")
+
 
 def _find_jvm_path() -> Optional[str]:
-    """Encontra o caminho do jvm.dll/libjvm.so."""
+    """Encontra o caminho do jvm.dll/libjvm.so (MPXJ_JVM_PATH tem precedência sobre JAVA_HOME)."""
     import os
     import sys
     
+    explicit = os.environ.get("MPXJ_JVM_PATH")
+    if explicit:
+        return explicit
+    
     java_home = os.environ.get("JAVA_HOME")
     if not java_home:
         return None
@@ -44,6 +78,33 @@ def _find_jvm_path() -> Optional[str]:
     return None
 
 
+def _jvm_options() -> List[str]:
+    """Opções extras da JVM, lidas do ambiente.
+
+    - MPXJ_JVM_OPTIONS: opções separadas por espaço (ex: "-Xmx2g -XX:TieredStopAtLevel=1")
+    - MPXJ_CDS_ARCHIVE: archive AppCDS gerado por scripts/build_cds_archive.py; as
+      classes do MPXJ/POI saem do archive em vez de serem carregadas e verificadas
+      jar a jar. Ignorado (com aviso) se o arquivo não existe; se não bate com o
+      JDK/classpath atual, a JVM o descarta sozinha (-Xshare:auto)
+    - MPXJ_CDS_DUMP: grava um archive dinâmico nesse caminho quando a JVM termina
+      (usado na execução de treino do build)
+    """
+    import os
+    import shlex
+
+    options = shlex.split(os.environ.get("MPXJ_JVM_OPTIONS", ""))
+    dump_path = os.environ.get("MPXJ_CDS_DUMP")
+    archive = os.environ.get("MPXJ_CDS_ARCHIVE")
+    if dump_path:
+        options.append(f"-XX:ArchiveClassesAtExit={dump_path}")
+    elif archive:
+        if os.path.exists(archive):
+            options += [f"-XX:SharedArchiveFile={archive}", "-Xshare:auto"]
+        else:
+            print(f"Aviso: MPXJ_CDS_ARCHIVE não encontrado: {archive} (JVM sem AppCDS)")
+    return options
+
+
 def _init_mpxj():
     try:
         import glob
@@ -54,18 +115,25 @@ def _init_mpxj():
 
         if not mpxj.isJVMStarted():
             lib_dir = mpxj.mpxj_dir
-            jar_files = glob.glob(os.path.join(lib_dir, "*.jar"))
+            # Ordem estável: o archive AppCDS só vale para o mesmo classpath do treino
+            jar_files = sorted(glob.glob(os.path.join(lib_dir, "*.jar")))
+            # Helpers Java do próprio pacote (ex: ColumnarExtractor), compilados no build
+            jar_files += sorted(glob.glob(os.path.join(_HELPERS_DIR, "*.jar")))
             for jar in jar_files:
                 try:
                     mpxj.addClassPath(jar)
                 except Exception:
                     pass
             
+            options = _jvm_options()
             # Tenta encontrar o JVM explicitamente se o automático falhar
             jvm_path = _find_jvm_path()
             if jvm_path:
                 print(f"Using JVM: {jvm_path}")
-                jpype.startJVM(jvm_path, classpath=jar_files)
+                jpype.startJVM(jvm_path, *options, classpath=jar_files)
+            elif options:
+                # JVM padrão do JPype, com as opções do ambiente
+                jpype.startJVM(*options, classpath=jar_files)
             else:
                 # Fallback para detecção automática
                 mpxj.startJVM()
@@ -83,7 +151,75 @@ def _init_mpxj():
         raise
 
 
-UniversalProjectReader = _init_mpxj()
+# A JVM sobe na primeira leitura (ou em start_jvm, chamado em background pela API),
+# e não no import do módulo: quem só importa o pacote não espera a JVM.
+_jvm_lock = threading.Lock()
+_universal_project_reader: Optional[Any] = None
+
+# Tempos (ms) da inicialização: "jvm_start" e "warmup" (ver start_jvm/warm_up)
+startup_timings: Dict[str, float] = {}
+
+
+def start_jvm() -> Any:
+    """Inicia a JVM com o MPXJ uma vez por processo e retorna a classe UniversalProjectReader.
+
+    Thread-safe: chamadas concorrentes (warm-up em background, primeiro import,
+    initializer do executor) esperam a mesma inicialização.
+    """
+    global _universal_project_reader
+    if _universal_project_reader is None:
+        with _jvm_lock:
+            if _universal_project_reader is None:
+                start = time.perf_counter()
+                reader_class = _init_mpxj()
+                startup_timings["jvm_start"] = round((time.perf_counter() - start) * 1000, 2)
+                _universal_project_reader = reader_class
+    return _universal_project_reader
+
+
+def jvm_started() -> bool:
+    """True se start_jvm já concluiu (não inicia a JVM)."""
+    return _universal_project_reader is not None
+
+
+def universal_project_reader() -> Any:
+    """Factory: nova instância de UniversalProjectReader (inicia a JVM se preciso)."""
+    return start_jvm()()
+
+
+def warm_up(
+    sample_path: str = WARMUP_SAMPLE,
+    engines: Iterable[str] = ("jpype",),
+    rounds: int = 1,
+) -> Dict[str, float]:
+    """Inicia a JVM e aquece o JIT lendo e extraindo um cronograma pequeno.
+
+    Cada engine percorre o mesmo caminho de um import (read, custom fields,
+    resources, tasks, assignments, timephased), então as classes do MPXJ e os
+    accessors já estão carregados e resolvidos no primeiro import real. Falha de
+    um engine (ex.: jar do columnar ausente) é logada e não interrompe os demais.
+    Retorna e registra em startup_timings os tempos (ms) por etapa.
+    """
+    start_jvm()
+    start = time.perf_counter()
+    for engine in engines:
+        engine_start = time.perf_counter()
+        try:
+            for _ in range(rounds):
+                reader = create_reader(sample_path, engine=engine, native_dates=True)
+                reader.read()
+                reader.get_project_info()
+                _, fields_by_class = reader.get_custom_field_definitions()
+                reader.get_calendars()
+                reader.extract_resources_bundle(fields_by_class.get("RESOURCE", []))
+                reader.extract_tasks_bundle(fields_by_class.get("TASK", []))
+                reader.get_assignments(fields_by_class.get("ASSIGNMENT", []))
+                reader.get_assignment_timephased()
+        except Exception as e:
+            print(f"Aviso: Warm-up do engine {engine} falhou: {e}")
+        startup_timings[f"warmup_{engine}"] = round((time.perf_counter() - engine_start) * 1000, 2)
+    startup_timings["warmup"] = round((time.perf_counter() - start) * 1000, 2)
+    return dict(startup_timings)
 
 
 def _get_java_class(class_name: str) -> Any:
@@ -98,23 +234,315 @@ def _get_java_class(class_name: str) -> Any:
     return _java_classes[class_name]
 
 
+def attach_jvm_thread() -> None:
+    """Anexa a thread atual à JVM (threads criadas em Python, ex: produtor do pipeline).
+
+    Anexa como daemon para não segurar o shutdown da JVM. Inicia a JVM se ainda
+    não subiu (ex.: initializer do executor antes do fim do warm-up).
+    """
+    start_jvm()
+    import jpype
+    from jpype.types import JClass
+
+    if jpype.isThreadAttachedToJVM():
+        return
+    Thread = JClass("java.lang.Thread")
+    if hasattr(Thread, "attachAsDaemon"):
+        Thread.attachAsDaemon()
+    else:
+        jpype.attachThreadToJVM()
+
+
+def detach_jvm_thread() -> None:
+    """Desanexa a thread atual da JVM (par de attach_jvm_thread)."""
+    import jpype
+
+    if jpype.isThreadAttachedToJVM():
+        jpype.detachThreadFromJVM()
+
+
+# Registro de accessors resolvidos por classe Java: (classe, nomes candidatos) -> método.
+# A classe JPype identifica o tipo concreto carregado (e portanto a versão do MPXJ no
+# classpath), então cada combinação é resolvida uma única vez por processo.
+_accessor_cache: Dict[Tuple[type, Tuple[str, ...]], Optional[Any]] = {}
+
+
+def _resolve_accessor(obj: Any, *names: str) -> Optional[Any]:
+    """Resolve o primeiro método existente em `names` para a classe de `obj` (com cache).
+
+    Retorna o método não-vinculado (chamar com `accessor(obj)`) ou None se a classe
+    não tiver nenhum dos métodos. Substitui a sondagem com hasattr por entidade.
+    """
+    key = (type(obj), names)
+    try:
+        return _accessor_cache[key]
+    except KeyError:
+        pass
+
+    accessor = None
+    cls = type(obj)
+    for name in names:
+        method = getattr(cls, name, None)
+        if method is not None:
+            accessor = method
+            break
+    _accessor_cache[key] = accessor
+    return accessor
+
+
+def _call_accessor(obj: Any, *names: str) -> Any:
+    """Chama o accessor resolvido para `obj` (None se obj for None ou sem método)."""
+    if obj is None:
+        return None
+    accessor = _resolve_accessor(obj, *names)
+    return accessor(obj) if accessor is not None else None
+
+
 def _get_field_type_class() -> Any:
     """Retorna enum FieldTypeClass do MPXJ."""
     return _get_java_class("FieldTypeClass")
 
 
+@dataclass(frozen=True)
+class CustomFieldPlan:
+    """Plano compilado de um CustomField (resolvido uma única vez por campo).
+
+    Evita reavaliar getFieldType()/getAlias()/getDataType() e a cadeia de hasattr
+    para cada entidade × campo durante a extração.
+    """
+
+    key: str  # alias ou nome do field (chave em custom_fields)
+    field_type: Any  # handle Java FieldType (argumento de getCachedValue)
+    field_class: str
+    data_type: str
+    json_name: str  # nome do campo no documento do JsonWriter
+    convert: Callable[[Any], Any]
+
+
+def _convert_custom_int(value) -> Optional[int]:
+    return int(value) if value else None
+
+
+def _convert_custom_string(value) -> Optional[str]:
+    return str(value) if value else None
+
+
+def _round_number(value: Any) -> Optional[float]:
+    """Número como o JsonWriter grava: 4 casas (Math.round) e zero tratado como ausente.
+
+    Todos os engines passam custos/unidades por aqui para produzir os mesmos valores.
+    """
+    if value is None:
+        return None
+    number = float(value)
+    if not number or number != number:
+        return None
+    return math.floor(number * 10000.0 + 0.5) / 10000.0
+
+
+def _rate_amount(value: Any) -> Optional[float]:
+    """Valor de uma taxa serializada pelo JsonWriter ("100.0/h"); zero vira None."""
+    if isinstance(value, str):
+        value = value.split("/", 1)[0]
+    try:
+        return float(value) or None
+    except (TypeError, ValueError):
+        return None
+
+
+# Accessor da task predecessora em Relation (o nome muda entre versões do MPXJ)
+_RELATION_TARGET_ACCESSORS = ("getTargetTask", "getPredecessorTask", "getSourceTask")
+
+
+# Accessors de períodos timephased (TimephasedWork/TimephasedCost; nomes variam por versão)
+_TIMEPHASED_END = ("getEnd", "getFinish")
+_TIMEPHASED_PLANNED_WORK = ("getAmount", "getTotalAmount", "getWork", "getValue")
+_TIMEPHASED_PLANNED_COST = ("getCost",)
+_TIMEPHASED_ACTUAL_WORK = ("getAmount", "getTotalAmount", "getWork", "getActualWork", "getValue")
+_TIMEPHASED_ACTUAL_COST = ("getCost", "getActualCost")
+
+
+# Ordem dos campos de um período timephased nas linhas de iter_assignment_timephased_rows
+TIMEPHASED_PERIOD_FIELDS = ("period_start", "period_end", "work", "cost", "units")
+
+# Tamanho padrão dos lotes dos iteradores iter_* (entidades por lote; períodos no timephased)
+ITER_BATCH_SIZE = 5000
+ITER_TIMEPHASED_BATCH_ROWS = 10000
+
+
+# Entidades por shard na extração paralela (MPPReader com parallel_threads > 1)
+PARALLEL_SHARD_SIZE = 1000
+
+# Executores da extração paralela, um por número de threads (threads anexadas à JVM
+# uma vez e reaproveitadas entre imports, como o executor de imports da API)
+_extraction_executors: Dict[int, ThreadPoolExecutor] = {}
+_extraction_executors_lock = threading.Lock()
+
+
+def _extraction_executor(threads: int) -> ThreadPoolExecutor:
+    with _extraction_executors_lock:
+        executor = _extraction_executors.get(threads)
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=threads,
+                thread_name_prefix=f"mpp-extract-{threads}",
+                initializer=attach_jvm_thread,
+            )
+            _extraction_executors[threads] = executor
+        return executor
+
+
+def _rebatch(parts: Iterable[Tuple[List[Any], ...]], batch_size: int):
+    """Junta resultados de shards (tuplas de listas, na ordem) em lotes de até `batch_size`.
+
+    O tamanho do lote é contado pela primeira lista; as demais (dependências,
+    baselines) acompanham as entidades do próprio shard. Um shard nunca é dividido:
+    o lote fecha antes do shard que o faria passar de `batch_size`.
+    """
+    merged: Optional[Tuple[List[Any], ...]] = None
+    for part in parts:
+        if merged is not None and merged[0] and len(merged[0]) + len(part[0]) > batch_size:
+            yield merged
+            merged = None
+        if merged is None:
+            merged = tuple([] for _ in part)
+        for acc, items in zip(merged, part):
+            acc.extend(items)
+    if merged is not None and any(merged):
+        yield merged
+
+
+def _slice_batches(batch_size: int, primary: List[Any], *related: List[Any]):
+    """Fatia listas já materializadas em lotes (engines que extraem o projeto de uma vez).
+
+    A lista `primary` define os cortes; as listas relacionadas (dependências,
+    baselines) saem inteiras no primeiro lote.
+    """
+    if not primary:
+        if any(related):
+            yield ([], *related) if related else []
+        return
+    for i in range(0, len(primary), batch_size):
+        chunk = primary[i:i + batch_size]
+        if not related:
+            yield chunk
+        elif i == 0:
+            yield (chunk, *related)
+        else:
+            yield (chunk, *([] for _ in related))
+
+
+# Fonte de um reader: caminho local, conteúdo em memória ou arquivo binário aberto
+ReaderSource = Union[str, "os.PathLike[str]", bytes, bytearray, memoryview, BinaryIO]
+
+# Nome usado nos relatórios quando a fonte não tem caminho (bytes em memória)
+IN_MEMORY_SOURCE_NAME = "(em memória)"
+
+
+def source_bytes(source: ReaderSource) -> Optional[Union[bytes, bytearray, memoryview]]:
+    """Conteúdo de uma fonte em memória ou arquivo aberto; None se `source` é um caminho.
+
+    Arquivos abertos são lidos até o fim (io.BytesIO sem cópia, via getbuffer).
+    """
+    if isinstance(source, memoryview):
+        return source if source.format in ("B", "b") else source.cast("B")
+    if isinstance(source, (bytes, bytearray)):
+        return source
+    if isinstance(source, io.BytesIO):
+        return source.getbuffer()
+    if hasattr(source, "read"):
+        return source.read()
+    return None
+
+
+def source_name(source: ReaderSource) -> str:
+    """Nome do arquivo da fonte (basename do caminho ou do arquivo aberto)."""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return IN_MEMORY_SOURCE_NAME
+    name = getattr(source, "name", source) if hasattr(source, "read") else source
+    if isinstance(name, (str, os.PathLike)):
+        return os.path.basename(os.fspath(name))
+    return IN_MEMORY_SOURCE_NAME
+
+
+def _java_input_stream(data: Union[bytes, bytearray, memoryview]) -> Any:
+    """ByteArrayInputStream sobre uma cópia de `data` em um byte[] Java (sem disco)."""
+    import jpype
+    from jpype.types import JClass
+
+    return JClass("java.io.ByteArrayInputStream")(jpype.JArray(jpype.JByte)(data))
+
+
 class MPPReader:
-    """Classe para ler e processar arquivos Microsoft Project"""
+    """Classe para ler e processar arquivos Microsoft Project
+
+    Args:
+        mpp_file_path: Caminho do arquivo .mpp, ou o conteúdo já em memória (bytes,
+            bytearray, memoryview) ou um arquivo binário aberto (lido até o fim).
+            Conteúdo em memória vai para o MPXJ por um ByteArrayInputStream, sem
+            arquivo temporário.
+        native_dates: Se True, datas saem como datetime nativo (consumido direto pelo
+            psycopg, sem ida e volta por string ISO). Se False (padrão), strings ISO,
+            usadas pela API JSON read_mpp.
+        parallel_threads: Se > 1 (opt-in), tasks, resources, assignments e timephased
+            são extraídos em shards de PARALLEL_SHARD_SIZE entidades (faixas de índice
+            da lista Java) em threads anexadas à JVM; o JPype solta o GIL durante as
+            chamadas Java, então a parte Java da extração roda em paralelo. Os
+            resultados são juntados na ordem dos shards: mesma saída, na mesma ordem,
+            da extração sequencial. Só afeta o engine jpype.
+
+    Os métodos iter_* (iter_tasks_bundle, iter_resources_bundle, iter_assignments,
+    iter_assignment_timephased) produzem os mesmos dados em lotes de tamanho fixo,
+    sem montar a lista completa; os métodos extract_*/get_* equivalentes acumulam
+    os lotes.
+    """
 
-    def __init__(self, mpp_file_path: str):
-        self.mpp_file_path = Path(mpp_file_path)
-        if not self.mpp_file_path.exists():
-            raise FileNotFoundError(f"Arquivo não encontrado: {mpp_file_path}")
+    def __init__(self, mpp_file_path: ReaderSource, native_dates: bool = False, parallel_threads: int = 1):
+        self.native_dates = native_dates
+        self.parallel_threads = max(1, parallel_threads)
+        self.data = source_bytes(mpp_file_path)
+        self.mpp_file_path: Optional[Path] = None
+        if self.data is None:
+            self.mpp_file_path = Path(mpp_file_path)
+            if not self.mpp_file_path.exists():
+                raise FileNotFoundError(f"Arquivo não encontrado: {mpp_file_path}")
+        elif not len(self.data):
+            raise ValueError("Conteúdo vazio: nada para ler")
         self.project = None
+        # Padrões de conversão de durações (ProjectProperties), resolvidos sob demanda
+        self._project_properties = None
+        self._minutes_per_day = 480.0
+
+    def _materializes(self, method_name: str) -> bool:
+        """True se o engine sobrescreve `method_name` extraindo tudo de uma vez.
+
+        Nesse caso (engines json/columnar) o iter_* correspondente só fatia o resultado.
+        """
+        return getattr(type(self), method_name) is not getattr(MPPReader, method_name)
+
+    def _iter_shards(self, entities, extract_shard: Callable[[Any], Any], shard_size: int = PARALLEL_SHARD_SIZE):
+        """Aplica `extract_shard` a faixas contíguas de `entities` (lista Java) em paralelo.
+
+        Devolve os resultados na ordem das faixas, com no máximo 2 shards por thread
+        em andamento (memória limitada, como nos iter_* sequenciais).
+        """
+        executor = _extraction_executor(self.parallel_threads)
+        size = entities.size()
+        pending = deque()
+        for start in range(0, size, shard_size):
+            shard = entities.subList(start, min(start + shard_size, size))
+            pending.append(executor.submit(extract_shard, shard))
+            if len(pending) >= self.parallel_threads * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
 
     def read(self):
-        reader = UniversalProjectReader()
-        self.project = reader.read(str(self.mpp_file_path))
+        reader = universal_project_reader()
+        if self.data is not None:
+            self.project = reader.read(_java_input_stream(self.data))
+        else:
+            self.project = reader.read(str(self.mpp_file_path))
         return self.project
 
     def get_project_info(self) -> Dict[str, Any]:
@@ -156,11 +584,11 @@ class MPPReader:
             ),
         }
 
-    def get_tasks(self, task_custom_fields: Optional[List[Any]] = None) -> List[Dict[str, Any]]:
+    def get_tasks(self, task_custom_fields: Optional[List[CustomFieldPlan]] = None) -> List[Dict[str, Any]]:
         """Retorna lista de tasks do projeto.
         
         Args:
-            task_custom_fields: Lista opcional de CustomField objects para extrair valores.
+            task_custom_fields: Lista opcional de CustomFieldPlan para extrair valores.
                                 Obtida via get_custom_field_definitions()[1]["TASK"]
         """
         if not self.project:
@@ -180,8 +608,8 @@ class MPPReader:
                 "name": str(task.getName()) if task.getName() else None,
                 "start": self._convert_date(task.getStart()),
                 "finish": self._convert_date(task.getFinish()),
-                "duration": self._convert_duration(task.getDuration()),
-                "work": self._convert_duration(task.getWork()),
+                "duration": self._convert_duration(task.getDuration(), task),
+                "work": self._convert_work(task.getWork(), task),
                 "percent_complete": int(task.getPercentageComplete()) if task.getPercentageComplete() else 0,
                 "priority": self._convert_priority(task.getPriority()),
                 "notes": str(task.getNotes()) if task.getNotes() else None,
@@ -200,11 +628,11 @@ class MPPReader:
 
         return tasks
 
-    def get_resources(self, resource_custom_fields: Optional[List[Any]] = None) -> List[Dict[str, Any]]:
+    def get_resources(self, resource_custom_fields: Optional[List[CustomFieldPlan]] = None) -> List[Dict[str, Any]]:
         """Retorna lista de resources do projeto.
         
         Args:
-            resource_custom_fields: Lista opcional de CustomField objects para extrair valores.
+            resource_custom_fields: Lista opcional de CustomFieldPlan para extrair valores.
                                     Obtida via get_custom_field_definitions()[1]["RESOURCE"]
         """
         if not self.project:
@@ -225,9 +653,9 @@ class MPPReader:
                 "email": str(resource.getEmailAddress()) if resource.getEmailAddress() else None,
                 "type": str(resource.getType()) if resource.getType() else None,
                 "group": str(resource.getGroup()) if resource.getGroup() else None,
-                "max_units": float(resource.getMaxUnits()) if resource.getMaxUnits() else None,
+                "max_units": _round_number(resource.getMaxUnits()),
                 "standard_rate": self._convert_rate(resource.getStandardRate()),
-                "cost": self._convert_rate(resource.getCost()),
+                "cost": self._convert_cost(resource.getCost()),
                 "notes": str(resource.getNotes()) if resource.getNotes() else None,
                 "custom_fields": {},
             }
@@ -240,58 +668,93 @@ class MPPReader:
 
         return resources
 
-    def get_assignments(self, assignment_custom_fields: Optional[List[Any]] = None) -> List[Dict[str, Any]]:
+    def get_assignments(self, assignment_custom_fields: Optional[List[CustomFieldPlan]] = None) -> List[Dict[str, Any]]:
         """Retorna lista de resource assignments do projeto.
         
         Args:
-            assignment_custom_fields: Lista opcional de CustomField objects para extrair valores.
+            assignment_custom_fields: Lista opcional de CustomFieldPlan para extrair valores.
                                       Obtida via get_custom_field_definitions()[1]["ASSIGNMENT"]
         """
-        if not self.project:
-            self.read()
-
         assignments: List[Dict[str, Any]] = []
-        for assignment in self.project.getResourceAssignments():
-            if assignment is None:
-                continue
+        for batch in self.iter_assignments(assignment_custom_fields):
+            assignments.extend(batch)
+        return assignments
 
-            task = assignment.getTask()
-            resource = assignment.getResource()
+    def iter_assignments(
+        self,
+        assignment_custom_fields: Optional[List[CustomFieldPlan]] = None,
+        batch_size: int = ITER_BATCH_SIZE,
+    ):
+        """Gera lotes de até `batch_size` assignments (mesmo formato de get_assignments)."""
+        if self._materializes("get_assignments"):
+            yield from _slice_batches(batch_size, self.get_assignments(assignment_custom_fields))
+            return
 
-            # UniqueID do assignment é estável entre versões
-            unique_id = assignment.getUniqueID() if hasattr(assignment, "getUniqueID") else None
+        if not self.project:
+            self.read()
 
-            assignment_data = {
-                "external_id": str(unique_id) if unique_id else None,
-                # Referências por UniqueID (external_id) das entidades relacionadas
-                "task_external_id": str(task.getUniqueID()) if task and task.getUniqueID() else None,
-                "task_id": str(task.getID()) if task and task.getID() else None,
-                "task_name": str(task.getName()) if task and task.getName() else None,
-                "resource_external_id": str(resource.getUniqueID()) if resource and resource.getUniqueID() else None,
-                "resource_id": str(resource.getID()) if resource and resource.getID() else None,
-                "resource_name": str(resource.getName()) if resource and resource.getName() else None,
-                "work": self._convert_duration(assignment.getWork()),
-                "cost": self._convert_rate(assignment.getCost()),
-                "start": self._convert_date(assignment.getStart()),
-                "finish": self._convert_date(assignment.getFinish()),
-                "units": float(assignment.getUnits()) if assignment.getUnits() else None,
-                "percent_complete": int(assignment.getPercentageWorkComplete())
-                if hasattr(assignment, "getPercentageWorkComplete") and assignment.getPercentageWorkComplete()
-                else (
-                    int(assignment.getPercentageComplete())
-                    if hasattr(assignment, "getPercentageComplete") and assignment.getPercentageComplete()
-                    else 0
+        if self.parallel_threads > 1:
+            def extract_shard(shard):
+                return ([
+                    self._build_assignment(assignment, assignment_custom_fields)
+                    for assignment in shard
+                    if assignment is not None
+                ],)
+
+            for (batch,) in _rebatch(
+                self._iter_shards(
+                    self.project.getResourceAssignments(), extract_shard, min(PARALLEL_SHARD_SIZE, batch_size)
                 ),
-                "custom_fields": {},
-            }
+                batch_size,
+            ):
+                yield batch
+            return
 
-            # Extrai custom fields se fornecidos
-            if assignment_custom_fields:
-                assignment_data["custom_fields"] = self._extract_custom_field_values(assignment, assignment_custom_fields)
+        batch: List[Dict[str, Any]] = []
+        for assignment in self.project.getResourceAssignments():
+            if assignment is None:
+                continue
+            batch.append(self._build_assignment(assignment, assignment_custom_fields))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+
+        if batch:
+            yield batch
+
+    def _build_assignment(self, assignment, assignment_custom_fields: Optional[List[CustomFieldPlan]]) -> Dict[str, Any]:
+        """Monta o dict de um resource assignment."""
+        task = assignment.getTask()
+        resource = assignment.getResource()
+
+        # UniqueID do assignment é estável entre versões
+        unique_id = _call_accessor(assignment, "getUniqueID")
+        percent_work_complete = _call_accessor(assignment, "getPercentageWorkComplete")
+        percent_complete = percent_work_complete or _call_accessor(assignment, "getPercentageComplete")
+
+        assignment_data = {
+            "external_id": str(unique_id) if unique_id else None,
+            # Referências por UniqueID (external_id) das entidades relacionadas
+            "task_external_id": str(task.getUniqueID()) if task and task.getUniqueID() else None,
+            "task_id": str(task.getID()) if task and task.getID() else None,
+            "task_name": str(task.getName()) if task and task.getName() else None,
+            "resource_external_id": str(resource.getUniqueID()) if resource and resource.getUniqueID() else None,
+            "resource_id": str(resource.getID()) if resource and resource.getID() else None,
+            "resource_name": str(resource.getName()) if resource and resource.getName() else None,
+            "work": self._convert_work(assignment.getWork()),
+            "cost": self._convert_cost(assignment.getCost()),
+            "start": self._convert_date(assignment.getStart()),
+            "finish": self._convert_date(assignment.getFinish()),
+            "units": _round_number(assignment.getUnits()),
+            "percent_complete": int(percent_complete) if percent_complete else 0,
+            "custom_fields": {},
+        }
 
-            assignments.append(assignment_data)
+        # Extrai custom fields se fornecidos
+        if assignment_custom_fields:
+            assignment_data["custom_fields"] = self._extract_custom_field_values(assignment, assignment_custom_fields)
 
-        return assignments
+        return assignment_data
 
     def get_dependencies(self) -> List[Dict[str, Any]]:
         if not self.project:
@@ -307,13 +770,8 @@ class MPPReader:
                 continue
 
             for predecessor in predecessors:
-                target_task = None
-                if hasattr(predecessor, "getTargetTask"):
-                    target_task = predecessor.getTargetTask()
-                elif hasattr(predecessor, "getPredecessorTask"):
-                    target_task = predecessor.getPredecessorTask()
-                elif hasattr(predecessor, "getSourceTask"):
-                    target_task = predecessor.getSourceTask()
+                target_task = _call_accessor(predecessor, *_RELATION_TARGET_ACCESSORS)
+                relation_type = _call_accessor(predecessor, "getType")
 
                 dependencies.append(
                     {
@@ -324,8 +782,8 @@ class MPPReader:
                         "successor_external_id": str(task.getUniqueID()) if task.getUniqueID() else None,
                         "successor_id": str(task.getID()) if task.getID() else None,
                         "successor_name": str(task.getName()) if task.getName() else None,
-                        "type": str(predecessor.getType()) if hasattr(predecessor, "getType") and predecessor.getType() else None,
-                        "lag": self._convert_duration(predecessor.getLag() if hasattr(predecessor, "getLag") else None),
+                        "type": str(relation_type) if relation_type else None,
+                        "lag": self._convert_duration(_call_accessor(predecessor, "getLag")),
                     }
                 )
 
@@ -367,17 +825,13 @@ class MPPReader:
             if calendar is None:
                 continue
 
-            parent = calendar.getParent() if hasattr(calendar, "getParent") else None
+            parent = _call_accessor(calendar, "getParent")
             
             # UniqueID é estável entre versões do arquivo
-            unique_id = None
-            if hasattr(calendar, "getUniqueID"):
-                unique_id = calendar.getUniqueID()
-
-            parent_external_id = None
-            if parent is not None:
-                if hasattr(parent, "getUniqueID"):
-                    parent_external_id = parent.getUniqueID()
+            unique_id = _call_accessor(calendar, "getUniqueID")
+            parent_external_id = _call_accessor(parent, "getUniqueID")
+            is_working_day = _resolve_accessor(calendar, "isWorkingDay")
+            get_calendar_hours = _resolve_accessor(calendar, "getCalendarHours")
 
             # Extrai dias da semana e horários de trabalho
             weekdays = []
@@ -392,9 +846,7 @@ class MPPReader:
                         continue
                     
                     # Verifica se é dia de trabalho
-                    is_working = False
-                    if hasattr(calendar, "isWorkingDay"):
-                        is_working = bool(calendar.isWorkingDay(day))
+                    is_working = bool(is_working_day(calendar, day)) if is_working_day else False
                     
                     weekdays.append({
                         "day_of_week": day_number,
@@ -402,14 +854,14 @@ class MPPReader:
                     })
                     
                     # Obtém horários de trabalho para este dia
-                    if is_working and hasattr(calendar, "getCalendarHours"):
-                        hours = calendar.getCalendarHours(day)
+                    if is_working and get_calendar_hours:
+                        hours = get_calendar_hours(calendar, day)
                         if hours:
                             for time_range in hours:
                                 if time_range is None:
                                     continue
-                                start = time_range.getStart() if hasattr(time_range, "getStart") else None
-                                end = time_range.getEnd() if hasattr(time_range, "getEnd") else None
+                                start = _call_accessor(time_range, "getStart")
+                                end = _call_accessor(time_range, "getEnd")
                                 
                                 if start and end:
                                     working_times.append({
@@ -422,14 +874,15 @@ class MPPReader:
 
             # Extrai exceções do calendário (feriados, dias especiais)
             exceptions = []
-            if hasattr(calendar, "getCalendarExceptions"):
-                for exc in calendar.getCalendarExceptions():
+            calendar_exceptions = _call_accessor(calendar, "getCalendarExceptions")
+            if calendar_exceptions:
+                for exc in calendar_exceptions:
                     if exc is None:
                         continue
                     try:
-                        from_date = exc.getFromDate() if hasattr(exc, "getFromDate") else None
-                        to_date = exc.getToDate() if hasattr(exc, "getToDate") else None
-                        is_working = bool(exc.getWorking()) if hasattr(exc, "getWorking") else False
+                        from_date = _call_accessor(exc, "getFromDate")
+                        to_date = _call_accessor(exc, "getToDate")
+                        is_working = bool(_call_accessor(exc, "getWorking"))
                         
                         # Para exceções de múltiplos dias, cria uma entrada para cada
                         if from_date:
@@ -438,11 +891,12 @@ class MPPReader:
                             
                             # Horários de trabalho da exceção (se houver)
                             exc_times = []
-                            if is_working and hasattr(exc, "getCalendarHours"):
-                                for time_range in exc.getCalendarHours():
+                            exc_hours = _call_accessor(exc, "getCalendarHours") if is_working else None
+                            if exc_hours:
+                                for time_range in exc_hours:
                                     if time_range:
-                                        start = time_range.getStart() if hasattr(time_range, "getStart") else None
-                                        end = time_range.getEnd() if hasattr(time_range, "getEnd") else None
+                                        start = _call_accessor(time_range, "getStart")
+                                        end = _call_accessor(time_range, "getEnd")
                                         if start and end:
                                             exc_times.append({
                                                 "start_time": self._convert_time(start),
@@ -458,9 +912,10 @@ class MPPReader:
                     except Exception:
                         continue
 
+            calendar_name = _call_accessor(calendar, "getName")
             calendars.append({
                 "external_id": str(unique_id) if unique_id else None,
-                "name": str(calendar.getName()) if hasattr(calendar, "getName") and calendar.getName() else None,
+                "name": str(calendar_name) if calendar_name else None,
                 "parent_external_id": str(parent_external_id) if parent_external_id else None,
                 "weekdays": weekdays,
                 "working_times": working_times,
@@ -503,21 +958,26 @@ class MPPReader:
         except Exception:
             return None
 
-    def get_custom_field_definitions(self) -> Tuple[List[Dict[str, Any]], Dict[str, List[Any]]]:
-        """Retorna definições de campos customizados e cache por classe.
+    def get_custom_field_definitions(
+        self,
+        prune_empty: bool = True,
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, List[CustomFieldPlan]]]:
+        """Retorna definições de campos customizados e planos compilados por classe.
+        
+        Args:
+            prune_empty: Se True, remove dos planos os campos sem nenhum valor não-nulo
+                no projeto (as definições continuam sendo retornadas)
         
         Returns:
             Tuple com:
             - Lista de definições (field_type, field_class, alias, data_type)
-            - Dict mapeando field_class -> lista de CustomField objects (para uso em get_tasks, etc.)
+            - Dict mapeando field_class -> lista de CustomFieldPlan (para uso em get_tasks, etc.)
         """
         if not self.project:
             self.read()
 
-        FieldTypeClass = _get_field_type_class()
-
         definitions: List[Dict[str, Any]] = []
-        fields_by_class: Dict[str, List[Any]] = {
+        fields_by_class: Dict[str, List[CustomFieldPlan]] = {
             "TASK": [],
             "RESOURCE": [],
             "ASSIGNMENT": [],
@@ -535,15 +995,21 @@ class MPPReader:
             field_class_enum = field_type.getFieldTypeClass()
             field_class = str(field_class_enum) if field_class_enum else "UNKNOWN"
             
-            # Extrai data type
+            # Extrai data type; sem data type declarado, o conversor genérico
+            # identifica cada valor pelo tipo Java (datas, durações, números...)
             data_type = "STRING"
-            if hasattr(field_type, "getDataType") and field_type.getDataType():
-                data_type = str(field_type.getDataType())
+            java_data_type = field_type.getDataType() if hasattr(field_type, "getDataType") else None
+            if java_data_type:
+                data_type = str(java_data_type)
+                convert = self._custom_value_converter(data_type.upper())
+            else:
+                convert = self._convert_custom_value
 
             alias = str(field.getAlias()) if field.getAlias() else None
+            field_type_name = str(field_type)
 
             definitions.append({
-                "field_type": str(field_type),
+                "field_type": field_type_name,
                 "field_class": field_class,
                 "alias": alias,
                 "data_type": data_type,
@@ -551,72 +1017,106 @@ class MPPReader:
 
             # Agrupa por classe para uso posterior
             if field_class in fields_by_class:
-                fields_by_class[field_class].append(field)
+                fields_by_class[field_class].append(CustomFieldPlan(
+                    key=alias or field_type_name,
+                    field_type=field_type,
+                    field_class=field_class,
+                    data_type=data_type.upper(),
+                    json_name=(str(field_type.name()) if hasattr(field_type, "name") else field_type_name).lower(),
+                    convert=convert,
+                ))
+
+        if prune_empty:
+            entities_by_class = {
+                "TASK": self.project.getTasks,
+                "RESOURCE": self.project.getResources,
+                "ASSIGNMENT": self.project.getResourceAssignments,
+            }
+            for field_class, get_entities in entities_by_class.items():
+                if fields_by_class[field_class]:
+                    fields_by_class[field_class] = self._prune_empty_plans(
+                        get_entities(), fields_by_class[field_class]
+                    )
 
         return definitions, fields_by_class
 
-    def _extract_custom_field_values(self, entity, custom_fields: List[Any]) -> Dict[str, Any]:
+    def _prune_empty_plans(self, entities, plans: List[CustomFieldPlan]) -> List[CustomFieldPlan]:
+        """Mantém só os planos com ao menos um valor não-nulo (para na 1ª ocorrência de cada)."""
+        pending = list(plans)
+        found: set[int] = set()
+        for entity in entities:
+            if entity is None:
+                continue
+            still_pending = []
+            for plan in pending:
+                try:
+                    has_value = entity.getCachedValue(plan.field_type) is not None
+                except Exception:
+                    has_value = False
+                if has_value:
+                    found.add(id(plan))
+                else:
+                    still_pending.append(plan)
+            pending = still_pending
+            if not pending:
+                break
+        return [plan for plan in plans if id(plan) in found]
+
+    def _custom_value_converter(self, data_type: str) -> Callable[[Any], Any]:
+        """Escolhe o conversor especializado para o data type do field."""
+        if data_type in ("DATE", "DATE_TIME"):
+            return self._convert_date
+        if data_type == "DURATION":
+            return self._convert_duration
+        if data_type in ("CURRENCY", "NUMERIC", "RATE"):
+            return self._convert_rate
+        if data_type == "BOOLEAN":
+            return bool
+        if data_type in ("INTEGER", "SHORT"):
+            return _convert_custom_int
+        if data_type == "STRING":
+            return _convert_custom_string
+        return self._convert_custom_value
+
+    def _extract_custom_field_values(self, entity, custom_fields: List[CustomFieldPlan]) -> Dict[str, Any]:
         """Extrai valores de campos customizados de uma entidade (task, resource, assignment)."""
         result: Dict[str, Any] = {}
+        get_cached_value = entity.getCachedValue
 
-        for field in custom_fields:
-            field_type = field.getFieldType()
-            if field_type is None:
+        for plan in custom_fields:
+            try:
+                value = get_cached_value(plan.field_type)
+            except Exception:
+                continue
+            if value is None:
                 continue
 
             try:
-                value = entity.getCachedValue(field_type)
-                if value is None:
-                    continue
-
-                # Usa alias como key se disponível, senão usa o nome do field
-                key = str(field.getAlias()) if field.getAlias() else str(field_type)
-                
-                # Converte valor baseado no tipo
-                converted = self._convert_custom_value(value, field_type)
-                if converted is not None:
-                    result[key] = converted
-
+                converted = plan.convert(value)
             except Exception:
-                continue
+                converted = str(value)
+            if converted is not None:
+                result[plan.key] = converted
 
         return result
 
-    def _convert_custom_value(self, value, field_type) -> Any:
-        """Converte valor de custom field para tipo Python serializável."""
+    def _convert_custom_value(self, value) -> Any:
+        """Conversor genérico (data type desconhecido): identifica pelo tipo Java do valor."""
         if value is None:
             return None
 
         try:
-            # Tenta identificar o tipo pelo data type do field
-            data_type = None
-            if hasattr(field_type, "getDataType") and field_type.getDataType():
-                data_type = str(field_type.getDataType()).upper()
-
-            # Conversão baseada no data type
-            if data_type in ("DATE", "DATE_TIME"):
-                return self._convert_date(value)
-            elif data_type == "DURATION":
-                return self._convert_duration(value)
-            elif data_type in ("CURRENCY", "NUMERIC", "RATE"):
-                return self._convert_rate(value)
-            elif data_type == "BOOLEAN":
-                return bool(value)
-            elif data_type in ("INTEGER", "SHORT"):
-                return int(value) if value else None
-
-            # Fallback: tenta conversões baseadas no tipo Java do valor
-            if hasattr(value, "getTime"):
+            if _resolve_accessor(value, "getTime"):
                 return self._convert_date(value)
-            if hasattr(value, "getDuration"):
+            if _resolve_accessor(value, "getDuration"):
                 return self._convert_duration(value)
-            if hasattr(value, "getAmount"):
+            if _resolve_accessor(value, "getAmount"):
                 return self._convert_rate(value)
-            if hasattr(value, "booleanValue"):
+            if _resolve_accessor(value, "booleanValue"):
                 return bool(value.booleanValue())
-            if hasattr(value, "intValue"):
+            if _resolve_accessor(value, "intValue"):
                 return int(value.intValue())
-            if hasattr(value, "doubleValue"):
+            if _resolve_accessor(value, "doubleValue"):
                 return float(value.doubleValue())
 
             # Default: converte para string
@@ -628,36 +1128,96 @@ class MPPReader:
             except Exception:
                 return None
 
-    def _convert_date(self, date_obj) -> Optional[str]:
+    def _convert_date(self, date_obj) -> Any:
+        """Converte data Java para datetime nativo (native_dates) ou string ISO."""
         if date_obj is None:
             return None
         try:
-            if hasattr(date_obj, "getTime"):
-                timestamp = date_obj.getTime() / 1000.0
-                return datetime.fromtimestamp(timestamp).isoformat()
             if isinstance(date_obj, datetime):
-                return date_obj.isoformat()
-            return str(date_obj)
+                value = date_obj
+            elif (get_time := _resolve_accessor(date_obj, "getTime")) is not None:
+                value = datetime.fromtimestamp(get_time(date_obj) / 1000.0)
+            else:
+                # java.time.LocalDateTime (MPXJ 12+): toString() já é ISO-8601
+                text = str(date_obj)
+                if not self.native_dates:
+                    return text
+                value = datetime.fromisoformat(text)
+            return value if self.native_dates else value.isoformat()
         except Exception:
             return None
 
-    def _convert_duration(self, duration_obj) -> Optional[float]:
+    def _time_unit_defaults(self, owner=None):
+        """TimeUnitDefaultsContainer para converter durações de `owner`.
+
+        Mesmo critério do JsonWriter: task usa o calendário efetivo, resource o próprio
+        calendário; sem calendário (ou sem owner: assignments, lags, timephased) valem
+        as ProjectProperties.
+        """
+        calendar = _call_accessor(owner, "getEffectiveCalendar", "getCalendar") if owner is not None else None
+        if calendar is not None:
+            return calendar
+        if self._project_properties is None:
+            if not self.project:
+                self.read()
+            properties = self.project.getProjectProperties()
+            minutes_per_day = properties.getMinutesPerDay()
+            if minutes_per_day:
+                self._minutes_per_day = float(minutes_per_day.doubleValue())
+            self._project_properties = properties
+        return self._project_properties
+
+    def _duration_seconds(self, duration_obj, owner=None) -> Optional[int]:
+        """Duração em segundos inteiros, como o JsonWriter grava (None se ausente ou zero).
+
+        Minutos e horas não dependem de calendário; as demais unidades (dias, semanas...)
+        são convertidas com o calendário de `owner` (ver _time_unit_defaults).
+        """
         if duration_obj is None:
             return None
         try:
-            if hasattr(duration_obj, "getDuration"):
-                return float(duration_obj.getDuration())
-            return float(duration_obj)
+            amount = float(_call_accessor(duration_obj, "getDuration"))
+            if not amount:
+                return None
+            TimeUnit = _get_java_class("TimeUnit")
+            units = _call_accessor(duration_obj, "getUnits")
+            if units != TimeUnit.MINUTES:
+                calendar_owner = owner
+                if units == TimeUnit.HOURS or _call_accessor(units, "isElapsed"):
+                    calendar_owner = None
+                defaults = self._time_unit_defaults(calendar_owner)
+                amount = float(duration_obj.convertUnits(TimeUnit.MINUTES, defaults).getDuration())
+            return int(amount * 60.0) or None
         except Exception:
             return None
 
+    def _seconds_to_days(self, seconds: Optional[float]) -> Optional[float]:
+        """Segundos -> dias de trabalho (minutos por dia do projeto)."""
+        if not seconds:
+            return None
+        self._time_unit_defaults()
+        return seconds / (self._minutes_per_day * 60.0)
+
+    @staticmethod
+    def _seconds_to_hours(seconds: Optional[float]) -> Optional[float]:
+        return seconds / 3600.0 if seconds else None
+
+    def _convert_duration(self, duration_obj, owner=None) -> Optional[float]:
+        """Duração (duration, lag, custom DURATION) em dias; None se ausente ou zero."""
+        return self._seconds_to_days(self._duration_seconds(duration_obj, owner))
+
+    def _convert_work(self, work_obj, owner=None) -> Optional[float]:
+        """Trabalho (work, baseline work, timephased) em horas; None se ausente ou zero."""
+        return self._seconds_to_hours(self._duration_seconds(work_obj, owner))
+
     def _convert_rate(self, rate_obj) -> Optional[float]:
         if rate_obj is None:
             return None
         try:
-            if hasattr(rate_obj, "getAmount"):
-                return float(rate_obj.getAmount())
-            return float(rate_obj)
+            get_amount = _resolve_accessor(rate_obj, "getAmount")
+            if get_amount is not None:
+                return float(get_amount(rate_obj)) or None
+            return _round_number(rate_obj)
         except Exception:
             return None
 
@@ -665,10 +1225,9 @@ class MPPReader:
         if priority_obj is None:
             return None
         try:
-            if hasattr(priority_obj, "getValue"):
-                return int(priority_obj.getValue())
-            if hasattr(priority_obj, "intValue"):
-                return int(priority_obj.intValue())
+            get_value = _resolve_accessor(priority_obj, "getValue", "intValue")
+            if get_value is not None:
+                return int(get_value(priority_obj))
             return int(priority_obj)
         except Exception:
             return None
@@ -678,11 +1237,10 @@ class MPPReader:
         if cost_obj is None:
             return None
         try:
-            if hasattr(cost_obj, "getAmount"):
-                return float(cost_obj.getAmount())
-            if hasattr(cost_obj, "getValue"):
-                return float(cost_obj.getValue())
-            return float(cost_obj)
+            get_amount = _resolve_accessor(cost_obj, "getAmount", "getValue")
+            if get_amount is not None:
+                return _round_number(get_amount(cost_obj))
+            return _round_number(cost_obj)
         except Exception:
             return None
 
@@ -741,7 +1299,7 @@ class MPPReader:
         for task in self.project.getTasks():
             if task is None:
                 continue
-            if not hasattr(task, "get"):
+            if _resolve_accessor(task, "get") is None:
                 continue
 
             seen += 1
@@ -823,11 +1381,14 @@ class MPPReader:
                         continue
                     
                     # Extrai valores usando get() genérico
-                    start_val = task.get(start_field) if hasattr(task, "get") else None
-                    finish_val = task.get(finish_field) if finish_field and hasattr(task, "get") else None
-                    duration_val = task.get(duration_field) if duration_field and hasattr(task, "get") else None
-                    work_val = task.get(work_field) if work_field and hasattr(task, "get") else None
-                    cost_val = task.get(cost_field) if cost_field and hasattr(task, "get") else None
+                    task_get = _resolve_accessor(task, "get")
+                    if task_get is None:
+                        continue
+                    start_val = task_get(task, start_field)
+                    finish_val = task_get(task, finish_field) if finish_field else None
+                    duration_val = task_get(task, duration_field) if duration_field else None
+                    work_val = task_get(task, work_field) if work_field else None
+                    cost_val = task_get(task, cost_field) if cost_field else None
                     
                     # Só adiciona se houver pelo menos um valor
                     if start_val or finish_val or duration_val or work_val or cost_val:
@@ -836,8 +1397,8 @@ class MPPReader:
                             "baseline_index": baseline_idx,
                             "start_date": self._convert_date(start_val),
                             "finish_date": self._convert_date(finish_val),
-                            "duration": self._convert_duration(duration_val),
-                            "work": self._convert_duration(work_val),
+                            "duration": self._convert_duration(duration_val, task),
+                            "work": self._convert_work(work_val, task),
                             "cost": self._convert_cost(cost_val),
                         })
                 except Exception:
@@ -847,55 +1408,94 @@ class MPPReader:
 
     def extract_tasks_bundle(
         self,
-        task_custom_fields: Optional[List[Any]] = None,
+        task_custom_fields: Optional[List[CustomFieldPlan]] = None,
         baseline_indices: Optional[List[int]] = None,
     ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
         """Extrai tasks, dependencies e task baselines em um único loop (otimização).
         
         Args:
-            task_custom_fields: Lista opcional de CustomField objects para tasks
+            task_custom_fields: Lista opcional de CustomFieldPlan para tasks
             baseline_indices: Lista de índices de baseline a extrair (None = não extrair)
         
         Returns:
             Tuple com (tasks, dependencies, task_baselines)
         """
+        tasks: List[Dict[str, Any]] = []
+        dependencies: List[Dict[str, Any]] = []
+        task_baselines: List[Dict[str, Any]] = []
+        for batch_tasks, batch_dependencies, batch_baselines in self.iter_tasks_bundle(
+            task_custom_fields, baseline_indices
+        ):
+            tasks.extend(batch_tasks)
+            dependencies.extend(batch_dependencies)
+            task_baselines.extend(batch_baselines)
+        return tasks, dependencies, task_baselines
+
+    def iter_tasks_bundle(
+        self,
+        task_custom_fields: Optional[List[CustomFieldPlan]] = None,
+        baseline_indices: Optional[List[int]] = None,
+        batch_size: int = ITER_BATCH_SIZE,
+    ):
+        """Gera lotes (tasks, dependencies, task_baselines) de até `batch_size` tasks.
+
+        Dependencies e baselines de um lote são as das tasks do próprio lote
+        (as predecessoras podem estar em lotes anteriores ou posteriores).
+        """
+        if self._materializes("extract_tasks_bundle"):
+            yield from _slice_batches(
+                batch_size, *self.extract_tasks_bundle(task_custom_fields, baseline_indices)
+            )
+            return
+
         if not self.project:
             self.read()
 
+        # Pre-computa campos baseline por índice (evita getattr repetido)
+        baseline_fields_by_idx = self._task_baseline_fields(baseline_indices)
+
+        if self.parallel_threads > 1:
+            def extract_shard(shard):
+                shard_tasks, shard_dependencies, shard_baselines = [], [], []
+                for task_data, task_dependencies, baselines in self._iter_task_rows(
+                    shard, task_custom_fields, baseline_fields_by_idx
+                ):
+                    shard_tasks.append(task_data)
+                    shard_dependencies.extend(task_dependencies)
+                    shard_baselines.extend(baselines)
+                return shard_tasks, shard_dependencies, shard_baselines
+
+            yield from _rebatch(
+                self._iter_shards(self.project.getTasks(), extract_shard, min(PARALLEL_SHARD_SIZE, batch_size)), batch_size
+            )
+            return
+
         tasks: List[Dict[str, Any]] = []
         dependencies: List[Dict[str, Any]] = []
         task_baselines: List[Dict[str, Any]] = []
         
-        TaskField = None
-        if baseline_indices:
-            try:
-                TaskField = _get_java_class("TaskField")
-            except Exception:
-                pass
-        
-        # Pre-computa campos baseline por índice (evita getattr repetido)
-        baseline_fields_by_idx: Dict[int, Dict[str, Any]] = {}
-        if TaskField and baseline_indices:
-            for idx in baseline_indices:
-                if idx == 0:
-                    baseline_fields_by_idx[idx] = {
-                        "start": TaskField.BASELINE_START,
-                        "finish": TaskField.BASELINE_FINISH,
-                        "duration": TaskField.BASELINE_DURATION,
-                        "work": TaskField.BASELINE_WORK,
-                        "cost": TaskField.BASELINE_COST,
-                    }
-                else:
-                    baseline_fields_by_idx[idx] = {
-                        "start": getattr(TaskField, f"BASELINE{idx}_START", None),
-                        "finish": getattr(TaskField, f"BASELINE{idx}_FINISH", None),
-                        "duration": getattr(TaskField, f"BASELINE{idx}_DURATION", None),
-                        "work": getattr(TaskField, f"BASELINE{idx}_WORK", None),
-                        "cost": getattr(TaskField, f"BASELINE{idx}_COST", None),
-                    }
-        
-        # Único loop sobre tasks
-        for task in self.project.getTasks():
+        for task_data, task_dependencies, baselines in self._iter_task_rows(
+            self.project.getTasks(), task_custom_fields, baseline_fields_by_idx
+        ):
+            tasks.append(task_data)
+            dependencies.extend(task_dependencies)
+            task_baselines.extend(baselines)
+
+            if len(tasks) >= batch_size:
+                yield tasks, dependencies, task_baselines
+                tasks, dependencies, task_baselines = [], [], []
+
+        if tasks or dependencies or task_baselines:
+            yield tasks, dependencies, task_baselines
+
+    def _iter_task_rows(
+        self,
+        tasks,
+        task_custom_fields: Optional[List[CustomFieldPlan]],
+        baseline_fields_by_idx: Dict[int, Dict[str, Any]],
+    ):
+        """Único loop sobre `tasks` (lista Java ou shard): (task, dependencies, baselines) por task."""
+        for task in tasks:
             if task is None:
                 continue
 
@@ -905,130 +1505,222 @@ class MPPReader:
             if not task_external_id:
                 continue
             
-            # Extrai task core
-            task_data = {
-                "external_id": task_external_id,
-                "id": str(task.getID()) if task.getID() else None,
-                "name": str(task.getName()) if task.getName() else None,
-                "start": self._convert_date(task.getStart()),
-                "finish": self._convert_date(task.getFinish()),
-                "duration": self._convert_duration(task.getDuration()),
-                "work": self._convert_duration(task.getWork()),
-                "percent_complete": int(task.getPercentageComplete()) if task.getPercentageComplete() else 0,
-                "priority": self._convert_priority(task.getPriority()),
-                "notes": str(task.getNotes()) if task.getNotes() else None,
-                "wbs": str(task.getWBS()) if task.getWBS() else None,
-                "outline_level": int(task.getOutlineLevel()) if task.getOutlineLevel() else 0,
-                "milestone": bool(task.getMilestone()) if task.getMilestone() else False,
-                "summary": bool(task.getSummary()) if task.getSummary() else False,
-                "custom_fields": {},
-            }
-
-            if task_custom_fields:
-                task_data["custom_fields"] = self._extract_custom_field_values(task, task_custom_fields)
+            task_data = self._build_task(task, task_external_id, task_custom_fields)
             
-            tasks.append(task_data)
+            # Extrai dependencies (predecessors) e task baselines no mesmo loop
+            baselines = (
+                self._extract_task_baselines(task, task_external_id, baseline_fields_by_idx)
+                if baseline_fields_by_idx
+                else []
+            )
+            yield task_data, self._extract_task_dependencies(task, task_data), baselines
+
+    def _build_task(
+        self,
+        task,
+        task_external_id: str,
+        task_custom_fields: Optional[List[CustomFieldPlan]],
+    ) -> Dict[str, Any]:
+        """Monta o dict core de uma task."""
+        task_data = {
+            "external_id": task_external_id,
+            "id": str(task.getID()) if task.getID() else None,
+            "name": str(task.getName()) if task.getName() else None,
+            "start": self._convert_date(task.getStart()),
+            "finish": self._convert_date(task.getFinish()),
+            "duration": self._convert_duration(task.getDuration(), task),
+            "work": self._convert_work(task.getWork(), task),
+            "percent_complete": int(task.getPercentageComplete()) if task.getPercentageComplete() else 0,
+            "priority": self._convert_priority(task.getPriority()),
+            "notes": str(task.getNotes()) if task.getNotes() else None,
+            "wbs": str(task.getWBS()) if task.getWBS() else None,
+            "outline_level": int(task.getOutlineLevel()) if task.getOutlineLevel() else 0,
+            "milestone": bool(task.getMilestone()) if task.getMilestone() else False,
+            "summary": bool(task.getSummary()) if task.getSummary() else False,
+            "custom_fields": {},
+        }
+
+        if task_custom_fields:
+            task_data["custom_fields"] = self._extract_custom_field_values(task, task_custom_fields)
+
+        return task_data
+
+    def _extract_task_dependencies(self, task, task_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Extrai as dependências (predecessoras) de uma task."""
+        dependencies: List[Dict[str, Any]] = []
+        try:
+            predecessors = task.getPredecessors()
+            if predecessors:
+                for predecessor in predecessors:
+                    target_task = _call_accessor(predecessor, *_RELATION_TARGET_ACCESSORS)
+                    target_unique_id = target_task.getUniqueID() if target_task else None
+
+                    if target_unique_id:
+                        target_id = target_task.getID()
+                        target_name = target_task.getName()
+                        relation_type = _call_accessor(predecessor, "getType")
+                        dependencies.append({
+                            "predecessor_external_id": str(target_unique_id),
+                            "predecessor_id": str(target_id) if target_id else None,
+                            "predecessor_name": str(target_name) if target_name else None,
+                            "successor_external_id": task_data["external_id"],
+                            "successor_id": task_data["id"],
+                            "successor_name": task_data["name"],
+                            "type": str(relation_type) if relation_type else None,
+                            "lag": self._convert_duration(_call_accessor(predecessor, "getLag")),
+                        })
+        except Exception:
+            pass
+        return dependencies
+
+    def _task_baseline_fields(self, baseline_indices: Optional[List[int]]) -> Dict[int, Dict[str, Any]]:
+        """Resolve os TaskField de baseline por índice (uma vez por extração)."""
+        baseline_fields_by_idx: Dict[int, Dict[str, Any]] = {}
+        if not baseline_indices:
+            return baseline_fields_by_idx
+
+        try:
+            TaskField = _get_java_class("TaskField")
+        except Exception:
+            return baseline_fields_by_idx
+
+        for idx in baseline_indices:
+            if idx == 0:
+                baseline_fields_by_idx[idx] = {
+                    "start": TaskField.BASELINE_START,
+                    "finish": TaskField.BASELINE_FINISH,
+                    "duration": TaskField.BASELINE_DURATION,
+                    "work": TaskField.BASELINE_WORK,
+                    "cost": TaskField.BASELINE_COST,
+                }
+            else:
+                baseline_fields_by_idx[idx] = {
+                    "start": getattr(TaskField, f"BASELINE{idx}_START", None),
+                    "finish": getattr(TaskField, f"BASELINE{idx}_FINISH", None),
+                    "duration": getattr(TaskField, f"BASELINE{idx}_DURATION", None),
+                    "work": getattr(TaskField, f"BASELINE{idx}_WORK", None),
+                    "cost": getattr(TaskField, f"BASELINE{idx}_COST", None),
+                }
+        return baseline_fields_by_idx
+
+    def _extract_task_baselines(
+        self,
+        task,
+        task_external_id: str,
+        baseline_fields_by_idx: Dict[int, Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """Extrai os valores de baseline de uma task (campos já resolvidos)."""
+        task_baselines: List[Dict[str, Any]] = []
+        if _resolve_accessor(task, "get") is None:
+            return task_baselines
+
+        for baseline_idx, fields in baseline_fields_by_idx.items():
+            if not fields.get("start"):
+                continue
             
-            # Extrai dependencies (predecessors) no mesmo loop
             try:
-                predecessors = task.getPredecessors()
-                if predecessors:
-                    for predecessor in predecessors:
-                        target_task = None
-                        if hasattr(predecessor, "getTargetTask"):
-                            target_task = predecessor.getTargetTask()
-                        elif hasattr(predecessor, "getPredecessorTask"):
-                            target_task = predecessor.getPredecessorTask()
-                        elif hasattr(predecessor, "getSourceTask"):
-                            target_task = predecessor.getSourceTask()
-
-                        if target_task and target_task.getUniqueID():
-                            dependencies.append({
-                                "predecessor_external_id": str(target_task.getUniqueID()),
-                                "predecessor_id": str(target_task.getID()) if target_task.getID() else None,
-                                "predecessor_name": str(target_task.getName()) if target_task.getName() else None,
-                                "successor_external_id": task_external_id,
-                                "successor_id": task_data["id"],
-                                "successor_name": task_data["name"],
-                                "type": str(predecessor.getType()) if hasattr(predecessor, "getType") and predecessor.getType() else None,
-                                "lag": self._convert_duration(predecessor.getLag() if hasattr(predecessor, "getLag") else None),
-                            })
+                start_val = task.get(fields["start"])
+                finish_val = task.get(fields["finish"]) if fields.get("finish") else None
+                duration_val = task.get(fields["duration"]) if fields.get("duration") else None
+                work_val = task.get(fields["work"]) if fields.get("work") else None
+                cost_val = task.get(fields["cost"]) if fields.get("cost") else None
+                
+                if start_val or finish_val or duration_val or work_val or cost_val:
+                    task_baselines.append({
+                        "task_external_id": task_external_id,
+                        "baseline_index": baseline_idx,
+                        "start_date": self._convert_date(start_val),
+                        "finish_date": self._convert_date(finish_val),
+                        "duration": self._convert_duration(duration_val, task),
+                        "work": self._convert_work(work_val, task),
+                        "cost": self._convert_cost(cost_val),
+                    })
             except Exception:
-                pass
-            
-            # Extrai task baselines no mesmo loop
-            if TaskField and baseline_indices and hasattr(task, "get"):
-                for baseline_idx in baseline_indices:
-                    fields = baseline_fields_by_idx.get(baseline_idx)
-                    if not fields or not fields.get("start"):
-                        continue
-                    
-                    try:
-                        start_val = task.get(fields["start"])
-                        finish_val = task.get(fields["finish"]) if fields.get("finish") else None
-                        duration_val = task.get(fields["duration"]) if fields.get("duration") else None
-                        work_val = task.get(fields["work"]) if fields.get("work") else None
-                        cost_val = task.get(fields["cost"]) if fields.get("cost") else None
-                        
-                        if start_val or finish_val or duration_val or work_val or cost_val:
-                            task_baselines.append({
-                                "task_external_id": task_external_id,
-                                "baseline_index": baseline_idx,
-                                "start_date": self._convert_date(start_val),
-                                "finish_date": self._convert_date(finish_val),
-                                "duration": self._convert_duration(duration_val),
-                                "work": self._convert_duration(work_val),
-                                "cost": self._convert_cost(cost_val),
-                            })
-                    except Exception:
-                        continue
+                continue
 
-        return tasks, dependencies, task_baselines
+        return task_baselines
 
     def extract_resources_bundle(
         self,
-        resource_custom_fields: Optional[List[Any]] = None,
+        resource_custom_fields: Optional[List[CustomFieldPlan]] = None,
         baseline_indices: Optional[List[int]] = None,
     ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
         """Extrai resources e resource baselines em um único loop (otimização).
         
         Args:
-            resource_custom_fields: Lista opcional de CustomField objects para resources
+            resource_custom_fields: Lista opcional de CustomFieldPlan para resources
             baseline_indices: Lista de índices de baseline a extrair (None = não extrair)
         
         Returns:
             Tuple com (resources, resource_baselines)
         """
-        if not self.project:
-            self.read()
-
         resources: List[Dict[str, Any]] = []
         resource_baselines: List[Dict[str, Any]] = []
-        
-        ResourceField = None
-        if baseline_indices:
-            try:
-                ResourceField = _get_java_class("ResourceField")
-            except Exception:
-                pass
-        
+        for batch_resources, batch_baselines in self.iter_resources_bundle(
+            resource_custom_fields, baseline_indices
+        ):
+            resources.extend(batch_resources)
+            resource_baselines.extend(batch_baselines)
+        return resources, resource_baselines
+
+    def iter_resources_bundle(
+        self,
+        resource_custom_fields: Optional[List[CustomFieldPlan]] = None,
+        baseline_indices: Optional[List[int]] = None,
+        batch_size: int = ITER_BATCH_SIZE,
+    ):
+        """Gera lotes (resources, resource_baselines) de até `batch_size` resources."""
+        if self._materializes("extract_resources_bundle"):
+            yield from _slice_batches(
+                batch_size, *self.extract_resources_bundle(resource_custom_fields, baseline_indices)
+            )
+            return
+
+        if not self.project:
+            self.read()
+
         # Pre-computa campos baseline por índice
-        baseline_fields_by_idx: Dict[int, Dict[str, Any]] = {}
-        if ResourceField and baseline_indices:
-            for idx in baseline_indices:
-                if idx == 0:
-                    baseline_fields_by_idx[idx] = {
-                        "work": ResourceField.BASELINE_WORK,
-                        "cost": ResourceField.BASELINE_COST,
-                    }
-                else:
-                    baseline_fields_by_idx[idx] = {
-                        "work": getattr(ResourceField, f"BASELINE{idx}_WORK", None),
-                        "cost": getattr(ResourceField, f"BASELINE{idx}_COST", None),
-                    }
+        baseline_fields_by_idx = self._resource_baseline_fields(baseline_indices)
+
+        if self.parallel_threads > 1:
+            def extract_shard(shard):
+                shard_resources, shard_baselines = [], []
+                for resource_data, baselines in self._iter_resource_rows(
+                    shard, resource_custom_fields, baseline_fields_by_idx
+                ):
+                    shard_resources.append(resource_data)
+                    shard_baselines.extend(baselines)
+                return shard_resources, shard_baselines
+
+            yield from _rebatch(
+                self._iter_shards(self.project.getResources(), extract_shard, min(PARALLEL_SHARD_SIZE, batch_size)), batch_size
+            )
+            return
+
+        resources: List[Dict[str, Any]] = []
+        resource_baselines: List[Dict[str, Any]] = []
         
-        # Único loop sobre resources
-        for resource in self.project.getResources():
+        for resource_data, baselines in self._iter_resource_rows(
+            self.project.getResources(), resource_custom_fields, baseline_fields_by_idx
+        ):
+            resources.append(resource_data)
+            resource_baselines.extend(baselines)
+
+            if len(resources) >= batch_size:
+                yield resources, resource_baselines
+                resources, resource_baselines = [], []
+
+        if resources or resource_baselines:
+            yield resources, resource_baselines
+
+    def _iter_resource_rows(
+        self,
+        resources,
+        resource_custom_fields: Optional[List[CustomFieldPlan]],
+        baseline_fields_by_idx: Dict[int, Dict[str, Any]],
+    ):
+        """Único loop sobre `resources` (lista Java ou shard): (resource, baselines) por resource."""
+        for resource in resources:
             if resource is None:
                 continue
 
@@ -1038,48 +1730,94 @@ class MPPReader:
             if not resource_external_id:
                 continue
             
-            # Extrai resource core
-            resource_data = {
-                "external_id": resource_external_id,
-                "id": str(resource.getID()) if resource.getID() else None,
-                "name": str(resource.getName()) if resource.getName() else None,
-                "email": str(resource.getEmailAddress()) if resource.getEmailAddress() else None,
-                "type": str(resource.getType()) if resource.getType() else None,
-                "group": str(resource.getGroup()) if resource.getGroup() else None,
-                "max_units": float(resource.getMaxUnits()) if resource.getMaxUnits() else None,
-                "standard_rate": self._convert_rate(resource.getStandardRate()),
-                "cost": self._convert_rate(resource.getCost()),
-                "notes": str(resource.getNotes()) if resource.getNotes() else None,
-                "custom_fields": {},
-            }
+            # Extrai resource baselines no mesmo loop
+            baselines = (
+                self._extract_resource_baselines(resource, resource_external_id, baseline_fields_by_idx)
+                if baseline_fields_by_idx
+                else []
+            )
+            yield self._build_resource(resource, resource_external_id, resource_custom_fields), baselines
+
+    def _build_resource(
+        self,
+        resource,
+        resource_external_id: str,
+        resource_custom_fields: Optional[List[CustomFieldPlan]],
+    ) -> Dict[str, Any]:
+        """Monta o dict core de um resource."""
+        resource_data = {
+            "external_id": resource_external_id,
+            "id": str(resource.getID()) if resource.getID() else None,
+            "name": str(resource.getName()) if resource.getName() else None,
+            "email": str(resource.getEmailAddress()) if resource.getEmailAddress() else None,
+            "type": str(resource.getType()) if resource.getType() else None,
+            "group": str(resource.getGroup()) if resource.getGroup() else None,
+            "max_units": _round_number(resource.getMaxUnits()),
+            "standard_rate": self._convert_rate(resource.getStandardRate()),
+            "cost": self._convert_cost(resource.getCost()),
+            "notes": str(resource.getNotes()) if resource.getNotes() else None,
+            "custom_fields": {},
+        }
 
-            if resource_custom_fields:
-                resource_data["custom_fields"] = self._extract_custom_field_values(resource, resource_custom_fields)
-            
-            resources.append(resource_data)
+        if resource_custom_fields:
+            resource_data["custom_fields"] = self._extract_custom_field_values(resource, resource_custom_fields)
+
+        return resource_data
+
+    def _resource_baseline_fields(self, baseline_indices: Optional[List[int]]) -> Dict[int, Dict[str, Any]]:
+        """Resolve os ResourceField de baseline por índice (uma vez por extração)."""
+        baseline_fields_by_idx: Dict[int, Dict[str, Any]] = {}
+        if not baseline_indices:
+            return baseline_fields_by_idx
+
+        try:
+            ResourceField = _get_java_class("ResourceField")
+        except Exception:
+            return baseline_fields_by_idx
+
+        for idx in baseline_indices:
+            if idx == 0:
+                baseline_fields_by_idx[idx] = {
+                    "work": ResourceField.BASELINE_WORK,
+                    "cost": ResourceField.BASELINE_COST,
+                }
+            else:
+                baseline_fields_by_idx[idx] = {
+                    "work": getattr(ResourceField, f"BASELINE{idx}_WORK", None),
+                    "cost": getattr(ResourceField, f"BASELINE{idx}_COST", None),
+                }
+        return baseline_fields_by_idx
+
+    def _extract_resource_baselines(
+        self,
+        resource,
+        resource_external_id: str,
+        baseline_fields_by_idx: Dict[int, Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """Extrai os valores de baseline de um resource (campos já resolvidos)."""
+        resource_baselines: List[Dict[str, Any]] = []
+        if _resolve_accessor(resource, "get") is None:
+            return resource_baselines
+
+        for baseline_idx, fields in baseline_fields_by_idx.items():
+            if not fields.get("work"):
+                continue
             
-            # Extrai resource baselines no mesmo loop
-            if ResourceField and baseline_indices and hasattr(resource, "get"):
-                for baseline_idx in baseline_indices:
-                    fields = baseline_fields_by_idx.get(baseline_idx)
-                    if not fields or not fields.get("work"):
-                        continue
-                    
-                    try:
-                        work_val = resource.get(fields["work"])
-                        cost_val = resource.get(fields["cost"]) if fields.get("cost") else None
-                        
-                        if work_val or cost_val:
-                            resource_baselines.append({
-                                "resource_external_id": resource_external_id,
-                                "baseline_index": baseline_idx,
-                                "work": self._convert_duration(work_val),
-                                "cost": self._convert_cost(cost_val),
-                            })
-                    except Exception:
-                        continue
+            try:
+                work_val = resource.get(fields["work"])
+                cost_val = resource.get(fields["cost"]) if fields.get("cost") else None
+                
+                if work_val or cost_val:
+                    resource_baselines.append({
+                        "resource_external_id": resource_external_id,
+                        "baseline_index": baseline_idx,
+                        "work": self._convert_work(work_val, resource),
+                        "cost": self._convert_cost(cost_val),
+                    })
+            except Exception:
+                continue
 
-        return resources, resource_baselines
+        return resource_baselines
 
     def get_resource_baselines(self, baseline_indices: List[int]) -> List[Dict[str, Any]]:
         """Extrai valores de baseline para todos os resources.
@@ -1122,15 +1860,18 @@ class MPPReader:
                         continue
                     
                     # Extrai valores usando get() genérico
-                    work_val = resource.get(work_field) if hasattr(resource, "get") else None
-                    cost_val = resource.get(cost_field) if cost_field and hasattr(resource, "get") else None
+                    resource_get = _resolve_accessor(resource, "get")
+                    if resource_get is None:
+                        continue
+                    work_val = resource_get(resource, work_field)
+                    cost_val = resource_get(resource, cost_field) if cost_field else None
                     
                     # Só adiciona se houver pelo menos um valor
                     if work_val or cost_val:
                         resource_baselines.append({
                             "resource_external_id": resource_external_id,
                             "baseline_index": baseline_idx,
-                            "work": self._convert_duration(work_val),
+                            "work": self._convert_work(work_val, resource),
                             "cost": self._convert_cost(cost_val),
                         })
                 except Exception:
@@ -1138,28 +1879,83 @@ class MPPReader:
         
         return resource_baselines
 
-    def _convert_datetime(self, datetime_obj) -> Optional[str]:
-        """Converte datetime Java para string ISO (timestamp completo).
+    def _convert_datetime(self, datetime_obj) -> Any:
+        """Converte datetime Java (timestamp completo): datetime nativo ou string ISO.
         
         Reutiliza lógica de _convert_date mas garante que inclui hora.
         """
         return self._convert_date(datetime_obj)
 
     def _convert_timephased_value(self, value_obj) -> Optional[float]:
-        """Converte valor timephased (work, cost, units) para float."""
+        """Converte valor timephased genérico (units) para float; work/cost usam _convert_work/_convert_cost."""
         if value_obj is None:
             return None
         try:
-            if hasattr(value_obj, "getDuration"):
-                return float(value_obj.getDuration())
-            if hasattr(value_obj, "getAmount"):
-                return float(value_obj.getAmount())
-            if hasattr(value_obj, "getValue"):
-                return float(value_obj.getValue())
+            get_value = _resolve_accessor(value_obj, "getDuration", "getAmount", "getValue")
+            if get_value is not None:
+                return float(get_value(value_obj))
             return float(value_obj)
         except Exception:
             return None
 
+    def _extract_timephased_periods(
+        self,
+        periods,
+        work_names: Tuple[str, ...],
+        cost_names: Tuple[str, ...],
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Converte uma lista de períodos timephased em dicts (ver _timephased_period_rows).
+
+        Returns:
+            Tupla (períodos, quantidade de valores negativos de work/cost)
+        """
+        rows, negative_values_count = self._timephased_period_rows(periods, work_names, cost_names)
+        return [dict(zip(TIMEPHASED_PERIOD_FIELDS, row)) for row in rows], negative_values_count
+
+    def _timephased_period_rows(
+        self,
+        periods,
+        work_names: Tuple[str, ...],
+        cost_names: Tuple[str, ...],
+    ) -> Tuple[List[Tuple[Any, ...]], int]:
+        """Converte uma lista de períodos timephased em tuplas (accessors resolvidos por classe).
+
+        Returns:
+            Tupla (linhas na ordem de TIMEPHASED_PERIOD_FIELDS, quantidade de valores
+            negativos de work/cost)
+        """
+        result: List[Tuple[Any, ...]] = []
+        negative_values_count = 0
+        if not periods:
+            return result, negative_values_count
+
+        try:
+            for period in periods:
+                if period is None:
+                    continue
+                try:
+                    period_start = self._convert_datetime(_call_accessor(period, "getStart"))
+                    period_end = self._convert_datetime(_call_accessor(period, *_TIMEPHASED_END))
+                    work_val = self._convert_work(_call_accessor(period, *work_names))
+                    # Tenta extrair cost e units se disponíveis
+                    cost_val = self._convert_cost(_call_accessor(period, *cost_names))
+                    units_val = self._convert_timephased_value(_call_accessor(period, "getUnits"))
+
+                    # Detecta valores negativos (anômalos)
+                    if work_val is not None and work_val < 0:
+                        negative_values_count += 1
+                    if cost_val is not None and cost_val < 0:
+                        negative_values_count += 1
+
+                    if period_start and period_end:
+                        result.append((period_start, period_end, work_val, cost_val, units_val))
+                except Exception:
+                    continue
+        except Exception:
+            pass
+
+        return result, negative_values_count
+
     def get_assignment_timephased(self) -> List[Dict[str, Any]]:
         """Extrai dados timephased (planned e complete) de todos os assignments.
         
@@ -1177,154 +1973,794 @@ class MPPReader:
                 ]
             }
         """
+        timephased_data: List[Dict[str, Any]] = []
+        negative_values_count = 0
+        for batch, batch_negatives in self.iter_assignment_timephased():
+            timephased_data.extend(batch)
+            negative_values_count += batch_negatives
+
+        # Retorna também contagem de valores negativos para telemetria
+        return timephased_data, negative_values_count
+
+    def iter_assignment_timephased(self, batch_rows: int = ITER_TIMEPHASED_BATCH_ROWS):
+        """Gera lotes (timephased_data, negative_values_count) de até ~`batch_rows` períodos.
+
+        O lote fecha quando a soma de períodos planned + complete atinge `batch_rows`
+        (um assignment nunca é dividido entre lotes).
+        """
+        if self._materializes("get_assignment_timephased"):
+            timephased_data, negative_values_count = self.get_assignment_timephased()
+            batch, batch_period_rows = [], 0
+            for entry in timephased_data:
+                batch.append(entry)
+                batch_period_rows += len(entry["planned"]) + len(entry["complete"])
+                if batch_period_rows >= batch_rows:
+                    yield batch, negative_values_count
+                    batch, batch_period_rows, negative_values_count = [], 0, 0
+            if batch or negative_values_count:
+                yield batch, negative_values_count
+            return
+
+        for entries, negative_values_count in self.iter_assignment_timephased_rows(batch_rows):
+            batch = [
+                {
+                    "assignment_external_id": assignment_external_id,
+                    "planned": [dict(zip(TIMEPHASED_PERIOD_FIELDS, row)) for row in planned_rows],
+                    "complete": [dict(zip(TIMEPHASED_PERIOD_FIELDS, row)) for row in complete_rows],
+                }
+                for assignment_external_id, planned_rows, complete_rows in entries
+            ]
+            yield batch, negative_values_count
+
+    def iter_assignment_timephased_rows(self, batch_rows: int = ITER_TIMEPHASED_BATCH_ROWS):
+        """Variante de iter_assignment_timephased sem dicts intermediários (carga via COPY).
+
+        Gera lotes (entries, negative_values_count), em que cada entry é
+        (assignment_external_id, planned_rows, complete_rows) e cada linha é uma
+        tupla na ordem de TIMEPHASED_PERIOD_FIELDS. Use com native_dates=True para
+        receber datetime nativo (sem string ISO).
+        """
+        if self._materializes("get_assignment_timephased"):
+            for batch, negative_values_count in self.iter_assignment_timephased(batch_rows):
+                entries = [
+                    (
+                        entry["assignment_external_id"],
+                        [tuple(period.get(key) for key in TIMEPHASED_PERIOD_FIELDS) for period in entry["planned"]],
+                        [tuple(period.get(key) for key in TIMEPHASED_PERIOD_FIELDS) for period in entry["complete"]],
+                    )
+                    for entry in batch
+                ]
+                yield entries, negative_values_count
+            return
+
         if not self.project:
             self.read()
 
-        timephased_data = []
-        negative_values_count = 0
+        if self.parallel_threads > 1:
+            # Cada shard devolve (entry, negativos) por assignment; o lote fecha como no sequencial
+            def extract_shard(shard):
+                return list(self._iter_timephased_entries(shard))
+
+            rows = (row for shard_rows in self._iter_shards(self.project.getResourceAssignments(), extract_shard)
+                    for row in shard_rows)
+        else:
+            rows = self._iter_timephased_entries(self.project.getResourceAssignments())
+
+        entries: List[Tuple[str, List[Tuple[Any, ...]], List[Tuple[Any, ...]]]] = []
+        batch_period_rows = 0
+        batch_negatives = 0
         
-        for assignment in self.project.getResourceAssignments():
+        for entry, negatives in rows:
+            batch_negatives += negatives
+            
+            # Só adiciona se houver pelo menos um período
+            if entry is not None:
+                entries.append(entry)
+                batch_period_rows += len(entry[1]) + len(entry[2])
+
+            if batch_period_rows >= batch_rows:
+                yield entries, batch_negatives
+                entries, batch_period_rows, batch_negatives = [], 0, 0
+
+        if entries or batch_negatives:
+            yield entries, batch_negatives
+
+    def _iter_timephased_entries(self, assignments):
+        """Loop sobre `assignments` (lista Java ou shard): (entry ou None, valores negativos).
+
+        entry é (assignment_external_id, planned_rows, complete_rows), None quando o
+        assignment não tem nenhum período.
+        """
+        for assignment in assignments:
             if assignment is None:
                 continue
             
             # UniqueID do assignment
-            unique_id = assignment.getUniqueID() if hasattr(assignment, "getUniqueID") else None
+            unique_id = _call_accessor(assignment, "getUniqueID")
             assignment_external_id = str(unique_id) if unique_id else None
             
             if not assignment_external_id:
                 continue
             
-            planned_periods = []
-            complete_periods = []
-            
-            # Extrai planned timephased data
-            try:
-                # Tenta diferentes métodos para planned work
-                planned_work = None
-                if hasattr(assignment, "getTimephasedWork"):
-                    planned_work = assignment.getTimephasedWork()
-                elif hasattr(assignment, "getTimephasedData"):
-                    planned_work = assignment.getTimephasedData()
-                
-                if planned_work:
-                    for period in planned_work:
-                        if period is None:
-                            continue
-                        try:
-                            period_start = None
-                            period_end = None
-                            work_val = None
-                            cost_val = None
-                            units_val = None
-                            
-                            if hasattr(period, "getStart"):
-                                period_start = self._convert_datetime(period.getStart())
-                            if hasattr(period, "getEnd"):
-                                period_end = self._convert_datetime(period.getEnd())
-                            if hasattr(period, "getAmount"):
-                                work_val = self._convert_timephased_value(period.getAmount())
-                            elif hasattr(period, "getWork"):
-                                work_val = self._convert_timephased_value(period.getWork())
-                            elif hasattr(period, "getValue"):
-                                work_val = self._convert_timephased_value(period.getValue())
-                            
-                            # Tenta extrair cost e units se disponíveis
-                            if hasattr(period, "getCost"):
-                                cost_val = self._convert_timephased_value(period.getCost())
-                            if hasattr(period, "getUnits"):
-                                units_val = self._convert_timephased_value(period.getUnits())
-                            
-                            # Detecta valores negativos (anômalos)
-                            if work_val is not None and work_val < 0:
-                                negative_values_count += 1
-                            if cost_val is not None and cost_val < 0:
-                                negative_values_count += 1
-                            
-                            if period_start and period_end:
-                                planned_periods.append({
-                                    "period_start": period_start,
-                                    "period_end": period_end,
-                                    "work": work_val,
-                                    "cost": cost_val,
-                                    "units": units_val,
-                                })
-                        except Exception:
-                            continue
-            except Exception:
-                pass
-            
-            # Extrai complete/actual timephased data
-            try:
-                # Tenta diferentes métodos para actual work
-                actual_work = None
-                if hasattr(assignment, "getTimephasedActualWork"):
-                    actual_work = assignment.getTimephasedActualWork()
-                elif hasattr(assignment, "getTimephasedActualData"):
-                    actual_work = assignment.getTimephasedActualData()
-                
-                if actual_work:
-                    for period in actual_work:
-                        if period is None:
-                            continue
-                        try:
-                            period_start = None
-                            period_end = None
-                            work_val = None
-                            cost_val = None
-                            units_val = None
-                            
-                            if hasattr(period, "getStart"):
-                                period_start = self._convert_datetime(period.getStart())
-                            if hasattr(period, "getEnd"):
-                                period_end = self._convert_datetime(period.getEnd())
-                            if hasattr(period, "getAmount"):
-                                work_val = self._convert_timephased_value(period.getAmount())
-                            elif hasattr(period, "getWork"):
-                                work_val = self._convert_timephased_value(period.getWork())
-                            elif hasattr(period, "getActualWork"):
-                                work_val = self._convert_timephased_value(period.getActualWork())
-                            elif hasattr(period, "getValue"):
-                                work_val = self._convert_timephased_value(period.getValue())
-                            
-                            # Tenta extrair cost e units se disponíveis
-                            if hasattr(period, "getCost"):
-                                cost_val = self._convert_timephased_value(period.getCost())
-                            elif hasattr(period, "getActualCost"):
-                                cost_val = self._convert_timephased_value(period.getActualCost())
-                            if hasattr(period, "getUnits"):
-                                units_val = self._convert_timephased_value(period.getUnits())
-                            
-                            # Detecta valores negativos (anômalos)
-                            if work_val is not None and work_val < 0:
-                                negative_values_count += 1
-                            if cost_val is not None and cost_val < 0:
-                                negative_values_count += 1
-                            
-                            if period_start and period_end:
-                                complete_periods.append({
-                                    "period_start": period_start,
-                                    "period_end": period_end,
-                                    "work": work_val,
-                                    "cost": cost_val,
-                                    "units": units_val,
-                                })
-                        except Exception:
-                            continue
-            except Exception:
-                pass
-            
-            # Só adiciona se houver pelo menos um período
+            # Extrai planned e complete/actual timephased data
+            planned_rows, planned_negatives = self._timephased_period_rows(
+                _call_accessor(assignment, "getTimephasedWork", "getTimephasedData"),
+                _TIMEPHASED_PLANNED_WORK,
+                _TIMEPHASED_PLANNED_COST,
+            )
+            complete_rows, complete_negatives = self._timephased_period_rows(
+                _call_accessor(assignment, "getTimephasedActualWork", "getTimephasedActualData"),
+                _TIMEPHASED_ACTUAL_WORK,
+                _TIMEPHASED_ACTUAL_COST,
+            )
+            entry = (assignment_external_id, planned_rows, complete_rows) if planned_rows or complete_rows else None
+            yield entry, planned_negatives + complete_negatives
+
+
+class MPPJsonReader(MPPReader):
+    """Engine alternativo: serializa o ProjectFile inteiro no Java (JsonWriter do MPXJ).
+
+    O caminho padrão (MPPReader) faz dezenas de chamadas JPype por entidade. Aqui o
+    MPXJ escreve o projeto completo em um buffer de bytes numa única chamada Java e
+    o documento é decodificado em Python, montando as mesmas estruturas de bundle
+    consumidas por MPPImporter.import_project.
+
+    Metadados do projeto, calendários, custom field definitions e descoberta de
+    baselines continuam no caminho JPype (poucas chamadas por projeto).
+
+    Obs: o JsonWriter normaliza durações para segundos e omite campos zerados. Este
+    engine converte de volta para dias (duration, lag) e horas (work) com os mesmos
+    helpers do caminho JPype (_seconds_to_days/_seconds_to_hours), de modo que os
+    dois engines produzem bundles iguais.
+    """
+
+    def __init__(self, mpp_file_path: ReaderSource, native_dates: bool = False, parallel_threads: int = 1):
+        super().__init__(mpp_file_path, native_dates=native_dates, parallel_threads=parallel_threads)
+        self._document: Optional[Dict[str, Any]] = None
+
+    def _load_document(self) -> Dict[str, Any]:
+        """Serializa o projeto via JsonWriter (uma chamada Java) e decodifica o JSON."""
+        if self._document is not None:
+            return self._document
+        if not self.project:
+            self.read()
+
+        from jpype.types import JClass
+
+        JsonWriter = _get_java_class("json.JsonWriter")
+        ByteArrayOutputStream = JClass("java.io.ByteArrayOutputStream")
+
+        writer = JsonWriter()
+        if hasattr(writer, "setWriteTimephasedData"):
+            writer.setWriteTimephasedData(True)
+        stream = ByteArrayOutputStream()
+        writer.write(self.project, stream)
+        self._document = _json_loads(bytes(stream.toByteArray()))
+        return self._document
+
+    def _json_custom_values(self, item: Dict[str, Any], plans: List[CustomFieldPlan]) -> Dict[str, Any]:
+        """Converte os custom fields do documento JSON usando os planos compilados."""
+        result: Dict[str, Any] = {}
+        for plan in plans:
+            value = item.get(plan.json_name)
+            data_type = plan.data_type
+            if value is None:
+                continue
+            if data_type in ("DATE", "DATE_TIME"):
+                converted = self._json_date(value)
+            elif data_type == "DURATION":
+                converted = self._json_days(value)
+            elif data_type in ("CURRENCY", "NUMERIC", "RATE"):
+                converted = _rate_amount(value)
+            elif data_type == "BOOLEAN":
+                converted = bool(value)
+            elif data_type in ("INTEGER", "SHORT"):
+                converted = int(value) if value else None
+            else:
+                converted = value if isinstance(value, (int, float, bool)) else (str(value) if value else None)
+            if converted is not None:
+                result[plan.key] = converted
+        return result
+
+    def _json_date(self, value: Any) -> Any:
+        if not value:
+            return None
+        try:
+            parsed = datetime.fromisoformat(str(value))
+        except ValueError:
+            return None if self.native_dates else str(value)
+        return parsed if self.native_dates else parsed.isoformat()
+
+    def _json_number(self, value: Any) -> Optional[float]:
+        if value is None:
+            return None
+        if isinstance(value, dict):
+            value = value.get("amount", value.get("value"))
+        try:
+            return _round_number(value)
+        except (TypeError, ValueError):
+            return None
+
+    def _json_hours(self, value: Any) -> Optional[float]:
+        return self._seconds_to_hours(self._json_number(value))
+
+    def _json_days(self, value: Any) -> Optional[float]:
+        return self._seconds_to_days(self._json_number(value))
+
+    def extract_tasks_bundle(
+        self,
+        task_custom_fields: Optional[List[CustomFieldPlan]] = None,
+        baseline_indices: Optional[List[int]] = None,
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+        document = self._load_document()
+        plans = task_custom_fields or []
+
+        tasks: List[Dict[str, Any]] = []
+        dependencies: List[Dict[str, Any]] = []
+        task_baselines: List[Dict[str, Any]] = []
+
+        items = document.get("tasks") or []
+        by_unique_id = {item.get("unique_id"): item for item in items}
+
+        for item in items:
+            unique_id = item.get("unique_id")
+            if not unique_id:
+                continue
+            task_external_id = str(unique_id)
+
+            task_data = {
+                "external_id": task_external_id,
+                "id": str(item["id"]) if item.get("id") else None,
+                "name": item.get("name") or None,
+                "start": self._json_date(item.get("start")),
+                "finish": self._json_date(item.get("finish")),
+                "duration": self._json_days(item.get("duration")),
+                "work": self._json_hours(item.get("work")),
+                "percent_complete": int(item.get("percent_complete") or 0),
+                "priority": int(item["priority"]) if item.get("priority") is not None else None,
+                "notes": item.get("notes") or None,
+                "wbs": item.get("wbs") or None,
+                "outline_level": int(item.get("outline_level") or 0),
+                "milestone": bool(item.get("milestone", False)),
+                "summary": bool(item.get("summary", False)),
+                "custom_fields": self._json_custom_values(item, plans) if plans else {},
+            }
+            tasks.append(task_data)
+
+            for relation in item.get("predecessors") or []:
+                predecessor_unique_id = relation.get("predecessor_task_unique_id", relation.get("task_unique_id"))
+                if not predecessor_unique_id:
+                    continue
+                predecessor = by_unique_id.get(predecessor_unique_id) or {}
+                dependencies.append({
+                    "predecessor_external_id": str(predecessor_unique_id),
+                    "predecessor_id": str(predecessor["id"]) if predecessor.get("id") else None,
+                    "predecessor_name": predecessor.get("name") or None,
+                    "successor_external_id": task_external_id,
+                    "successor_id": task_data["id"],
+                    "successor_name": task_data["name"],
+                    "type": relation.get("type") or None,
+                    "lag": self._json_days(relation.get("lag")),
+                })
+
+            for baseline_idx in baseline_indices or []:
+                prefix = "baseline" if baseline_idx == 0 else f"baseline{baseline_idx}"
+                start_val = item.get(f"{prefix}_start")
+                finish_val = item.get(f"{prefix}_finish")
+                duration_val = item.get(f"{prefix}_duration")
+                work_val = item.get(f"{prefix}_work")
+                cost_val = item.get(f"{prefix}_cost")
+                if start_val or finish_val or duration_val or work_val or cost_val:
+                    task_baselines.append({
+                        "task_external_id": task_external_id,
+                        "baseline_index": baseline_idx,
+                        "start_date": self._json_date(start_val),
+                        "finish_date": self._json_date(finish_val),
+                        "duration": self._json_days(duration_val),
+                        "work": self._json_hours(work_val),
+                        "cost": self._json_number(cost_val),
+                    })
+
+        return tasks, dependencies, task_baselines
+
+    def extract_resources_bundle(
+        self,
+        resource_custom_fields: Optional[List[CustomFieldPlan]] = None,
+        baseline_indices: Optional[List[int]] = None,
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        document = self._load_document()
+        plans = resource_custom_fields or []
+
+        resources: List[Dict[str, Any]] = []
+        resource_baselines: List[Dict[str, Any]] = []
+
+        for item in document.get("resources") or []:
+            unique_id = item.get("unique_id")
+            if not unique_id:
+                continue
+            resource_external_id = str(unique_id)
+
+            resources.append({
+                "external_id": resource_external_id,
+                "id": str(item["id"]) if item.get("id") else None,
+                "name": item.get("name") or None,
+                "email": item.get("email_address") or None,
+                # JsonWriter grava o nome do enum (WORK); JPype/columnar usam toString() (Work)
+                "type": str(item["type"]).capitalize() if item.get("type") else None,
+                "group": item.get("group") or None,
+                "max_units": self._json_number(item.get("max_units")),
+                "standard_rate": _rate_amount(item.get("standard_rate")),
+                "cost": self._json_number(item.get("cost")),
+                "notes": item.get("notes") or None,
+                "custom_fields": self._json_custom_values(item, plans) if plans else {},
+            })
+
+            for baseline_idx in baseline_indices or []:
+                prefix = "baseline" if baseline_idx == 0 else f"baseline{baseline_idx}"
+                work_val = item.get(f"{prefix}_work")
+                cost_val = item.get(f"{prefix}_cost")
+                if work_val or cost_val:
+                    resource_baselines.append({
+                        "resource_external_id": resource_external_id,
+                        "baseline_index": baseline_idx,
+                        "work": self._json_hours(work_val),
+                        "cost": self._json_number(cost_val),
+                    })
+
+        return resources, resource_baselines
+
+    def get_assignments(self, assignment_custom_fields: Optional[List[CustomFieldPlan]] = None) -> List[Dict[str, Any]]:
+        document = self._load_document()
+        plans = assignment_custom_fields or []
+
+        tasks_by_unique_id = {item.get("unique_id"): item for item in document.get("tasks") or []}
+        resources_by_unique_id = {item.get("unique_id"): item for item in document.get("resources") or []}
+
+        assignments: List[Dict[str, Any]] = []
+        for item in document.get("assignments") or []:
+            unique_id = item.get("unique_id")
+            task = tasks_by_unique_id.get(item.get("task_unique_id")) or {}
+            resource = resources_by_unique_id.get(item.get("resource_unique_id")) or {}
+
+            assignments.append({
+                "external_id": str(unique_id) if unique_id else None,
+                "task_external_id": str(task["unique_id"]) if task.get("unique_id") else None,
+                "task_id": str(task["id"]) if task.get("id") else None,
+                "task_name": task.get("name") or None,
+                "resource_external_id": str(resource["unique_id"]) if resource.get("unique_id") else None,
+                "resource_id": str(resource["id"]) if resource.get("id") else None,
+                "resource_name": resource.get("name") or None,
+                "work": self._json_hours(item.get("work")),
+                "cost": self._json_number(item.get("cost")),
+                "start": self._json_date(item.get("start")),
+                "finish": self._json_date(item.get("finish")),
+                "units": self._json_number(item.get("assignment_units")),
+                "percent_complete": int(item.get("percent_work_complete") or item.get("percent_complete") or 0),
+                "custom_fields": self._json_custom_values(item, plans) if plans else {},
+            })
+
+        return assignments
+
+    def _json_timephased_periods(self, periods: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], int]:
+        result: List[Dict[str, Any]] = []
+        negative_values_count = 0
+        for period in periods or []:
+            period_start = self._json_date(period.get("start"))
+            period_end = self._json_date(period.get("finish", period.get("end")))
+            work_val = self._json_hours(period.get("total_amount", period.get("amount", period.get("work"))))
+            cost_val = self._json_number(period.get("cost"))
+            units_val = self._json_number(period.get("units"))
+
+            if work_val is not None and work_val < 0:
+                negative_values_count += 1
+            if cost_val is not None and cost_val < 0:
+                negative_values_count += 1
+
+            if period_start and period_end:
+                result.append({
+                    "period_start": period_start,
+                    "period_end": period_end,
+                    "work": work_val,
+                    "cost": cost_val,
+                    "units": units_val,
+                })
+        return result, negative_values_count
+
+    def get_assignment_timephased(self) -> List[Dict[str, Any]]:
+        document = self._load_document()
+
+        timephased_data = []
+        negative_values_count = 0
+
+        for item in document.get("assignments") or []:
+            unique_id = item.get("unique_id")
+            if not unique_id:
+                continue
+
+            # MPXJ 16+ grava os períodos brutos (raw_timephased_*), os mesmos de
+            # getTimephasedWork/getTimephasedActualWork no caminho JPype
+            planned_periods, planned_negative = self._json_timephased_periods(
+                item.get("raw_timephased_remaining_regular_work", item.get("timephased_work"))
+            )
+            complete_periods, complete_negative = self._json_timephased_periods(
+                item.get("raw_timephased_actual_regular_work", item.get("timephased_actual_work"))
+            )
+            negative_values_count += planned_negative + complete_negative
+
             if planned_periods or complete_periods:
                 timephased_data.append({
-                    "assignment_external_id": assignment_external_id,
+                    "assignment_external_id": str(unique_id),
                     "planned": planned_periods,
                     "complete": complete_periods,
                 })
-        
-        # Retorna também contagem de valores negativos para telemetria
+
         return timephased_data, negative_values_count
 
 
+# Sentinelas de nulo usadas pelo ColumnarExtractor (mpxj_pm/java/ColumnarExtractor.java)
+_COLUMNAR_NULL_DATE = -(2 ** 63)
+_COLUMNAR_NULL_INT = -(2 ** 31)
+_COLUMNAR_SEPARATOR = "\x00"
+_COLUMNAR_EPOCH = datetime(1970, 1, 1)
+
+
+def _java_column(values, typecode: str):
+    """Converte array primitivo Java em coluna compacta (uma travessia JPype por coluna).
+
+    Usa ndarray se numpy estiver disponível; caso contrário array.array do typecode dado.
+    """
+    if np is not None:
+        return np.array(values, copy=True)
+    column = array.array(typecode)
+    column.frombytes(memoryview(values).cast("B"))
+    return column
+
+
+def _java_strings(joined, count: int) -> List[Optional[str]]:
+    """Separa uma coluna de strings concatenadas com '\\0' (vazia vira None)."""
+    if not count:
+        return []
+    return [value or None for value in str(joined).split(_COLUMNAR_SEPARATOR)]
+
+
+class MPPColumnarReader(MPPReader):
+    """Engine colunar: helper Java devolve um array primitivo por campo.
+
+    O ColumnarExtractor (jar em mpxj_pm/java, carregado em _init_mpxj/start_jvm) percorre
+    tasks/resources/assignments uma vez no Java. Em Python cada campo vira uma coluna
+    (ndarray ou array.array) com uma única travessia JPype, em vez de uma por
+    getter/entidade. O ganho é só na travessia Java -> Python: os métodos de bundle
+    remontam um dict por entidade a partir das colunas (as mesmas estruturas dos
+    outros engines), porque MPPImporter.import_project trabalha linha a linha
+    (content_hash, diff com o banco, RETURNING). As colunas cruas ficam em
+    extract_*_columns() (durações em segundos, como no JsonWriter).
+
+    Custom fields e baselines continuam pelo caminho JPype (apenas quando solicitados).
+    """
+
+    def __init__(self, mpp_file_path: ReaderSource, native_dates: bool = False, parallel_threads: int = 1):
+        super().__init__(mpp_file_path, native_dates=native_dates, parallel_threads=parallel_threads)
+        self._columns: Dict[str, Dict[str, Any]] = {}
+
+    def _extractor(self):
+        from jpype.types import JClass
+
+        try:
+            return JClass("mpxjpm.ColumnarExtractor")
+        except TypeError as e:
+            raise RuntimeError(
+                "Helper Java mpxjpm.ColumnarExtractor não encontrado no classpath "
+                f"(compile mpxj_pm/java/*.java em um jar dentro de {_HELPERS_DIR})"
+            ) from e
+
+    def _convert_epoch_millis(self, millis: int) -> Any:
+        if millis == _COLUMNAR_NULL_DATE:
+            return None
+        value = _COLUMNAR_EPOCH + timedelta(milliseconds=millis)
+        return value if self.native_dates else value.isoformat()
+
+    def extract_task_columns(self) -> Dict[str, Any]:
+        """Retorna colunas de tasks (e relações) extraídas em uma única chamada Java."""
+        if "tasks" in self._columns:
+            return self._columns["tasks"]
+        if not self.project:
+            self.read()
+
+        c = self._extractor().tasks(self.project)
+        count = int(c.count)
+        relation_count = int(c.relationCount)
+        self._columns["tasks"] = {
+            "count": count,
+            "unique_id": _java_column(c.uniqueId, "i"),
+            "id": _java_column(c.id, "i"),
+            "name": _java_strings(c.name, count),
+            "start": _java_column(c.start, "q"),
+            "finish": _java_column(c.finish, "q"),
+            "duration": _java_column(c.duration, "d"),
+            "work": _java_column(c.work, "d"),
+            "percent_complete": _java_column(c.percentComplete, "d"),
+            "priority": _java_column(c.priority, "i"),
+            "notes": _java_strings(c.notes, count),
+            "wbs": _java_strings(c.wbs, count),
+            "outline_level": _java_column(c.outlineLevel, "i"),
+            "milestone": _java_column(c.milestone, "b"),
+            "summary": _java_column(c.summary, "b"),
+            "relation_count": relation_count,
+            "relation_predecessor_unique_id": _java_column(c.relationPredecessorUniqueId, "i"),
+            "relation_successor_unique_id": _java_column(c.relationSuccessorUniqueId, "i"),
+            "relation_type": _java_strings(c.relationType, relation_count),
+            "relation_lag": _java_column(c.relationLag, "d"),
+        }
+        return self._columns["tasks"]
+
+    def extract_resource_columns(self) -> Dict[str, Any]:
+        """Retorna colunas de resources extraídas em uma única chamada Java."""
+        if "resources" in self._columns:
+            return self._columns["resources"]
+        if not self.project:
+            self.read()
+
+        c = self._extractor().resources(self.project)
+        count = int(c.count)
+        self._columns["resources"] = {
+            "count": count,
+            "unique_id": _java_column(c.uniqueId, "i"),
+            "id": _java_column(c.id, "i"),
+            "name": _java_strings(c.name, count),
+            "email": _java_strings(c.email, count),
+            "type": _java_strings(c.type, count),
+            "group": _java_strings(c.group, count),
+            "max_units": _java_column(c.maxUnits, "d"),
+            "standard_rate": _java_column(c.standardRate, "d"),
+            "cost": _java_column(c.cost, "d"),
+            "notes": _java_strings(c.notes, count),
+        }
+        return self._columns["resources"]
+
+    def extract_assignment_columns(self) -> Dict[str, Any]:
+        """Retorna colunas de assignments extraídas em uma única chamada Java."""
+        if "assignments" in self._columns:
+            return self._columns["assignments"]
+        if not self.project:
+            self.read()
+
+        c = self._extractor().assignments(self.project)
+        self._columns["assignments"] = {
+            "count": int(c.count),
+            "unique_id": _java_column(c.uniqueId, "i"),
+            "task_unique_id": _java_column(c.taskUniqueId, "i"),
+            "resource_unique_id": _java_column(c.resourceUniqueId, "i"),
+            "work": _java_column(c.work, "d"),
+            "cost": _java_column(c.cost, "d"),
+            "start": _java_column(c.start, "q"),
+            "finish": _java_column(c.finish, "q"),
+            "units": _java_column(c.units, "d"),
+            "percent_work_complete": _java_column(c.percentWorkComplete, "d"),
+        }
+        return self._columns["assignments"]
+
+    def extract_tasks_bundle(
+        self,
+        task_custom_fields: Optional[List[CustomFieldPlan]] = None,
+        baseline_indices: Optional[List[int]] = None,
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+        columns = self.extract_task_columns()
+        count = columns["count"]
+
+        unique_ids = columns["unique_id"].tolist()
+        ids = columns["id"].tolist()
+        names = columns["name"]
+        starts = columns["start"].tolist()
+        finishes = columns["finish"].tolist()
+        durations = columns["duration"].tolist()
+        works = columns["work"].tolist()
+        percents = columns["percent_complete"].tolist()
+        priorities = columns["priority"].tolist()
+        notes = columns["notes"]
+        wbs = columns["wbs"]
+        outline_levels = columns["outline_level"].tolist()
+        milestones = columns["milestone"].tolist()
+        summaries = columns["summary"].tolist()
+
+        tasks: List[Dict[str, Any]] = []
+        tasks_by_unique_id: Dict[int, Dict[str, Any]] = {}
+        for i in range(count):
+            task_data = {
+                "external_id": str(unique_ids[i]) if unique_ids[i] else None,
+                "id": str(ids[i]) if ids[i] not in (0, _COLUMNAR_NULL_INT) else None,
+                "name": names[i],
+                "start": self._convert_epoch_millis(starts[i]),
+                "finish": self._convert_epoch_millis(finishes[i]),
+                "duration": self._seconds_to_days(durations[i]) if durations[i] == durations[i] else None,
+                "work": self._seconds_to_hours(works[i]) if works[i] == works[i] else None,
+                "percent_complete": int(percents[i]) if percents[i] == percents[i] else 0,
+                "priority": priorities[i] if priorities[i] != _COLUMNAR_NULL_INT else None,
+                "notes": notes[i],
+                "wbs": wbs[i],
+                "outline_level": outline_levels[i] if outline_levels[i] != _COLUMNAR_NULL_INT else 0,
+                "milestone": bool(milestones[i]),
+                "summary": bool(summaries[i]),
+                "custom_fields": {},
+            }
+            if not task_data["external_id"]:
+                continue
+            tasks.append(task_data)
+            tasks_by_unique_id[unique_ids[i]] = task_data
+
+        dependencies: List[Dict[str, Any]] = []
+        predecessor_ids = columns["relation_predecessor_unique_id"].tolist()
+        successor_ids = columns["relation_successor_unique_id"].tolist()
+        relation_types = columns["relation_type"]
+        relation_lags = columns["relation_lag"].tolist()
+        for i in range(columns["relation_count"]):
+            predecessor = tasks_by_unique_id.get(predecessor_ids[i])
+            successor = tasks_by_unique_id.get(successor_ids[i])
+            if not predecessor or not successor:
+                continue
+            dependencies.append({
+                "predecessor_external_id": predecessor["external_id"],
+                "predecessor_id": predecessor["id"],
+                "predecessor_name": predecessor["name"],
+                "successor_external_id": successor["external_id"],
+                "successor_id": successor["id"],
+                "successor_name": successor["name"],
+                "type": relation_types[i],
+                "lag": self._seconds_to_days(relation_lags[i]) if relation_lags[i] == relation_lags[i] else None,
+            })
+
+        # Custom fields e baselines: caminho JPype, apenas quando solicitados
+        task_baselines: List[Dict[str, Any]] = []
+        baseline_fields_by_idx = self._task_baseline_fields(baseline_indices)
+        if task_custom_fields or baseline_fields_by_idx:
+            for task in self.project.getTasks():
+                if task is None or task.getUniqueID() is None:
+                    continue
+                task_data = tasks_by_unique_id.get(int(task.getUniqueID()))
+                if task_data is None:
+                    continue
+                if task_custom_fields:
+                    task_data["custom_fields"] = self._extract_custom_field_values(task, task_custom_fields)
+                if baseline_fields_by_idx:
+                    task_baselines.extend(
+                        self._extract_task_baselines(task, task_data["external_id"], baseline_fields_by_idx)
+                    )
+
+        return tasks, dependencies, task_baselines
+
+    def extract_resources_bundle(
+        self,
+        resource_custom_fields: Optional[List[CustomFieldPlan]] = None,
+        baseline_indices: Optional[List[int]] = None,
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        columns = self.extract_resource_columns()
+
+        unique_ids = columns["unique_id"].tolist()
+        ids = columns["id"].tolist()
+        max_units = columns["max_units"].tolist()
+        standard_rates = columns["standard_rate"].tolist()
+        costs = columns["cost"].tolist()
+
+        resources: List[Dict[str, Any]] = []
+        resources_by_unique_id: Dict[int, Dict[str, Any]] = {}
+        for i in range(columns["count"]):
+            if not unique_ids[i]:
+                continue
+            resource_data = {
+                "external_id": str(unique_ids[i]),
+                "id": str(ids[i]) if ids[i] not in (0, _COLUMNAR_NULL_INT) else None,
+                "name": columns["name"][i],
+                "email": columns["email"][i],
+                "type": columns["type"][i],
+                "group": columns["group"][i],
+                "max_units": _round_number(max_units[i]),
+                "standard_rate": standard_rates[i] if standard_rates[i] == standard_rates[i] and standard_rates[i] else None,
+                "cost": _round_number(costs[i]),
+                "notes": columns["notes"][i],
+                "custom_fields": {},
+            }
+            resources.append(resource_data)
+            resources_by_unique_id[unique_ids[i]] = resource_data
+
+        # Custom fields e baselines: caminho JPype, apenas quando solicitados
+        resource_baselines: List[Dict[str, Any]] = []
+        baseline_fields_by_idx = self._resource_baseline_fields(baseline_indices)
+        if resource_custom_fields or baseline_fields_by_idx:
+            for resource in self.project.getResources():
+                if resource is None or resource.getUniqueID() is None:
+                    continue
+                resource_data = resources_by_unique_id.get(int(resource.getUniqueID()))
+                if resource_data is None:
+                    continue
+                if resource_custom_fields:
+                    resource_data["custom_fields"] = self._extract_custom_field_values(resource, resource_custom_fields)
+                if baseline_fields_by_idx:
+                    resource_baselines.extend(
+                        self._extract_resource_baselines(resource, resource_data["external_id"], baseline_fields_by_idx)
+                    )
+
+        return resources, resource_baselines
+
+    def get_assignments(self, assignment_custom_fields: Optional[List[CustomFieldPlan]] = None) -> List[Dict[str, Any]]:
+        columns = self.extract_assignment_columns()
+        task_columns = self.extract_task_columns()
+        resource_columns = self.extract_resource_columns()
+
+        task_lookup = {
+            uid: (task_columns["id"][i], task_columns["name"][i])
+            for i, uid in enumerate(task_columns["unique_id"].tolist())
+        }
+        resource_lookup = {
+            uid: (resource_columns["id"][i], resource_columns["name"][i])
+            for i, uid in enumerate(resource_columns["unique_id"].tolist())
+        }
+
+        unique_ids = columns["unique_id"].tolist()
+        task_unique_ids = columns["task_unique_id"].tolist()
+        resource_unique_ids = columns["resource_unique_id"].tolist()
+        works = columns["work"].tolist()
+        costs = columns["cost"].tolist()
+        starts = columns["start"].tolist()
+        finishes = columns["finish"].tolist()
+        units = columns["units"].tolist()
+        percents = columns["percent_work_complete"].tolist()
+
+        assignments: List[Dict[str, Any]] = []
+        for i in range(columns["count"]):
+            task_uid = task_unique_ids[i]
+            resource_uid = resource_unique_ids[i]
+            task_id, task_name = task_lookup.get(task_uid, (None, None))
+            resource_id, resource_name = resource_lookup.get(resource_uid, (None, None))
+            has_task = task_uid not in (0, _COLUMNAR_NULL_INT)
+            has_resource = resource_uid not in (0, _COLUMNAR_NULL_INT)
+
+            assignments.append({
+                "external_id": str(unique_ids[i]) if unique_ids[i] not in (0, _COLUMNAR_NULL_INT) else None,
+                "task_external_id": str(task_uid) if has_task else None,
+                "task_id": str(int(task_id)) if task_id not in (None, 0, _COLUMNAR_NULL_INT) else None,
+                "task_name": task_name,
+                "resource_external_id": str(resource_uid) if has_resource else None,
+                "resource_id": str(int(resource_id)) if resource_id not in (None, 0, _COLUMNAR_NULL_INT) else None,
+                "resource_name": resource_name,
+                "work": self._seconds_to_hours(works[i]) if works[i] == works[i] else None,
+                "cost": _round_number(costs[i]),
+                "start": self._convert_epoch_millis(starts[i]),
+                "finish": self._convert_epoch_millis(finishes[i]),
+                "units": _round_number(units[i]),
+                "percent_complete": int(percents[i]) if percents[i] == percents[i] else 0,
+                "custom_fields": {},
+            })
+
+        if assignment_custom_fields:
+            java_assignments = (a for a in self.project.getResourceAssignments() if a is not None)
+            for row, assignment in zip(assignments, java_assignments):
+                row["custom_fields"] = self._extract_custom_field_values(assignment, assignment_custom_fields)
+
+        return assignments
+
+
+# Engines de extração selecionáveis por importação
+READER_ENGINES: Dict[str, type] = {
+    "jpype": MPPReader,
+    "json": MPPJsonReader,
+    "columnar": MPPColumnarReader,
+}
+
+
+def create_reader(
+    mpp_file_path: ReaderSource,
+    engine: str = "jpype",
+    native_dates: bool = False,
+    parallel_threads: int = 1,
+) -> MPPReader:
+    """Instancia o reader do engine de extração solicitado."""
+    reader_class = READER_ENGINES.get(engine)
+    if reader_class is None:
+        raise ValueError(
+            f"Engine de extração desconhecido: {engine!r} (disponíveis: {', '.join(READER_ENGINES)})"
+        )
+    return reader_class(mpp_file_path, native_dates=native_dates, parallel_threads=parallel_threads)
+
+
 def read_mpp(mpp_path: str, include_custom_fields: bool = True) -> Dict[str, Any]:
     """Convenience: retorna todos os blocos necessários para importação.
     
@@ -1337,7 +2773,7 @@ def read_mpp(mpp_path: str, include_custom_fields: bool = True) -> Dict[str, Any
 
     # Extrai custom fields se solicitado
     custom_field_definitions = []
-    fields_by_class: Dict[str, List[Any]] = {}
+    fields_by_class: Dict[str, List[CustomFieldPlan]] = {}
     
     if include_custom_fields:
         custom_field_definitions, fields_by_class = r.get_custom_field_definitions()
@@ -0,0 +1,497 @@
+"""Pool de processos de parse: N workers, cada um com a própria JVM aquecida.
+
+O JPype permite uma JVM por processo e a extração do lado Python é serializada
+pelo GIL, então um processo só faz um parse por vez em velocidade plena. O
+ParseWorkerPool mantém N processos (spawn) que sobem a JVM, fazem o warm-up e
+ficam esperando arquivos; cada arquivo é lido e extraído inteiro no worker
+(extract_bundle) e volta para o processo pai como um ParsedBundle serializado
+(pickle, linhas em tuplas com as chaves uma vez por entidade). O pai faz a carga
+no banco com um BundleReader, que expõe o bundle com a interface do MPPReader:
+
+    pool = ParseWorkerPool(workers=4)
+    pool.start()
+    importer.import_project(path, reader_factory=pool.open_reader)
+
+Workers são reciclados (processo novo, JVM nova) depois de `max_files_per_worker`
+arquivos ou quando o heap comprometido da JVM passa de `max_heap_mb`, para não
+acumular memória de cronogramas grandes. O processo pai não precisa de JVM.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import pickle
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from multiprocessing.connection import wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .db import coerce_float, coerce_int
+from .mpp import (
+    ITER_TIMEPHASED_BATCH_ROWS,
+    TIMEPHASED_PERIOD_FIELDS,
+    MPPReader,
+    ReaderSource,
+    source_bytes,
+    source_name,
+)
+
+# Arquivos por worker antes de reciclar o processo (0 = nunca)
+_env_max_files = coerce_int(os.getenv("PARSE_WORKER_MAX_FILES"))
+PARSE_WORKER_MAX_FILES = 50 if _env_max_files is None else _env_max_files
+# Heap comprometido da JVM (MiB) a partir do qual o worker é reciclado (0 = sem limite)
+PARSE_WORKER_MAX_HEAP_MB = coerce_float(os.getenv("PARSE_WORKER_MAX_HEAP_MB")) or 0.0
+# Espera máxima (s) pela JVM + warm-up de um worker novo
+PARSE_WORKER_START_TIMEOUT = 300.0
+
+# Valor ausente nas linhas empacotadas (Ellipsis sobrevive ao pickle como singleton)
+_ABSENT = ...
+
+PackedRows = Tuple[Tuple[str, ...], List[Tuple[Any, ...]]]
+
+
+class ParseError(RuntimeError):
+    """Falha ao ler/extrair um arquivo em um worker de parse."""
+
+
+def _pack_rows(rows: List[Dict[str, Any]]) -> PackedRows:
+    """Lista de dicts -> (chaves, tuplas): as chaves não se repetem por linha."""
+    keys = tuple(dict.fromkeys(key for row in rows for key in row))
+    return keys, [tuple(row.get(key, _ABSENT) for key in keys) for row in rows]
+
+
+def _unpack_rows(packed: PackedRows) -> List[Dict[str, Any]]:
+    keys, rows = packed
+    return [{key: value for key, value in zip(keys, row) if value is not _ABSENT} for row in rows]
+
+
+@dataclass
+class ParsedBundle:
+    """Resultado completo do parse de um arquivo (o que o import consome do reader)."""
+
+    # Caminho do arquivo, ou o nome da fonte quando o conteúdo veio em memória
+    source_path: str
+    engine: str
+    project_info: Dict[str, Any]
+    custom_field_definitions: List[Dict[str, Any]]
+    calendars: List[Dict[str, Any]]
+    baselines_meta: List[Dict[str, Any]]
+    resources: PackedRows
+    resource_baselines: PackedRows
+    tasks: PackedRows
+    dependencies: PackedRows
+    task_baselines: PackedRows
+    assignments: PackedRows
+    # (assignment_external_id, planned_rows, complete_rows), linhas em TIMEPHASED_PERIOD_FIELDS
+    timephased: List[Tuple[str, List[Tuple[Any, ...]], List[Tuple[Any, ...]]]]
+    timephased_negative_values: int = 0
+    # Tempos (ms) do parse no worker e dados do transporte (preenchidos no pai)
+    timings_ms: Dict[str, float] = field(default_factory=dict)
+    stats: Dict[str, Any] = field(default_factory=dict)
+
+
+def extract_bundle(path: ReaderSource, engine: str = "jpype", parallel_threads: int = 1) -> ParsedBundle:
+    """Lê e extrai um arquivo inteiro (roda no worker, com a JVM do processo)."""
+    from .mpp import create_reader
+
+    timings: Dict[str, float] = {}
+
+    def mark(name: str, start: float) -> float:
+        now = time.perf_counter()
+        timings[name] = round((now - start) * 1000, 2)
+        return now
+
+    start = time.perf_counter()
+    reader = create_reader(path, engine=engine, native_dates=True, parallel_threads=parallel_threads)
+    reader.read()
+    start = mark("read_mpp_file", start)
+    project_info = reader.get_project_info()
+    definitions, fields_by_class = reader.get_custom_field_definitions()
+    calendars = reader.get_calendars()
+    baselines_meta = reader.get_baseline_indices_and_names()
+    baseline_indices = [b["index"] for b in baselines_meta] or None
+    start = mark("extract_metadata", start)
+    resources, resource_baselines = reader.extract_resources_bundle(
+        fields_by_class.get("RESOURCE", []), baseline_indices
+    )
+    start = mark("extract_resources", start)
+    tasks, dependencies, task_baselines = reader.extract_tasks_bundle(fields_by_class.get("TASK", []), baseline_indices)
+    start = mark("extract_tasks", start)
+    assignments = reader.get_assignments(fields_by_class.get("ASSIGNMENT", []))
+    start = mark("extract_assignments", start)
+    timephased: List[Tuple[str, List[Tuple[Any, ...]], List[Tuple[Any, ...]]]] = []
+    negative_values = 0
+    for entries, batch_negatives in reader.iter_assignment_timephased_rows():
+        timephased.extend(entries)
+        negative_values += batch_negatives
+    mark("extract_timephased", start)
+
+    return ParsedBundle(
+        source_path=str(path) if source_bytes(path) is None else source_name(path),
+        engine=engine,
+        project_info=project_info,
+        custom_field_definitions=definitions,
+        calendars=calendars,
+        baselines_meta=baselines_meta,
+        resources=_pack_rows(resources),
+        resource_baselines=_pack_rows(resource_baselines),
+        tasks=_pack_rows(tasks),
+        dependencies=_pack_rows(dependencies),
+        task_baselines=_pack_rows(task_baselines),
+        assignments=_pack_rows(assignments),
+        timephased=timephased,
+        timephased_negative_values=negative_values,
+        timings_ms=timings,
+    )
+
+
+class BundleReader(MPPReader):
+    """MPPReader servido por um ParsedBundle (sem JVM no processo).
+
+    Os métodos "materializados" devolvem o que o worker extraiu; os iter_* do
+    MPPReader só fatiam esses resultados em lotes. Planos de custom fields não
+    atravessam processos (são handles Java), então get_custom_field_definitions
+    devolve planos vazios: os valores já vêm extraídos nas linhas.
+    """
+
+    def __init__(self, bundle: ParsedBundle, native_dates: bool = True):
+        self.mpp_file_path = Path(bundle.source_path)
+        self.data = None
+        self.native_dates = native_dates
+        self.parallel_threads = 1
+        self.bundle = bundle
+        self.project = bundle
+
+    def read(self):
+        return self.project
+
+    def get_project_info(self) -> Dict[str, Any]:
+        return self.bundle.project_info
+
+    def get_custom_field_definitions(self, prune_empty: bool = True):
+        return self.bundle.custom_field_definitions, {"TASK": [], "RESOURCE": [], "ASSIGNMENT": [], "PROJECT": []}
+
+    def get_calendars(self) -> List[Dict[str, Any]]:
+        return self.bundle.calendars
+
+    def get_baseline_indices_and_names(self) -> List[Dict[str, Any]]:
+        return self.bundle.baselines_meta
+
+    def extract_resources_bundle(self, resource_custom_fields=None, baseline_indices=None):
+        return _unpack_rows(self.bundle.resources), _unpack_rows(self.bundle.resource_baselines)
+
+    def extract_tasks_bundle(self, task_custom_fields=None, baseline_indices=None):
+        return (
+            _unpack_rows(self.bundle.tasks),
+            _unpack_rows(self.bundle.dependencies),
+            _unpack_rows(self.bundle.task_baselines),
+        )
+
+    def get_assignments(self, assignment_custom_fields=None) -> List[Dict[str, Any]]:
+        return _unpack_rows(self.bundle.assignments)
+
+    def get_assignment_timephased(self):
+        timephased_data = [
+            {
+                "assignment_external_id": assignment_external_id,
+                "planned": [dict(zip(TIMEPHASED_PERIOD_FIELDS, row)) for row in planned_rows],
+                "complete": [dict(zip(TIMEPHASED_PERIOD_FIELDS, row)) for row in complete_rows],
+            }
+            for assignment_external_id, planned_rows, complete_rows in self.bundle.timephased
+        ]
+        return timephased_data, self.bundle.timephased_negative_values
+
+    def iter_assignment_timephased_rows(self, batch_rows: int = ITER_TIMEPHASED_BATCH_ROWS):
+        # Já estão em tuplas: fatia direto, sem passar pelos dicts
+        negative_values_count = self.bundle.timephased_negative_values
+        batch, batch_period_rows = [], 0
+        for entry in self.bundle.timephased:
+            batch.append(entry)
+            batch_period_rows += len(entry[1]) + len(entry[2])
+            if batch_period_rows >= batch_rows:
+                yield batch, negative_values_count
+                batch, batch_period_rows, negative_values_count = [], 0, 0
+        if batch or negative_values_count:
+            yield batch, negative_values_count
+
+
+def _jvm_committed_heap_mb() -> float:
+    """Heap comprometido da JVM (Runtime.totalMemory), em MiB."""
+    from jpype.types import JClass
+
+    return JClass("java.lang.Runtime").getRuntime().totalMemory() / (1024 * 1024)
+
+
+def _worker_main(conn, warmup_engines: Tuple[str, ...]) -> None:
+    """Loop do processo worker: sobe a JVM, avisa "ready" e atende (path, engine)."""
+    from .mpp import start_jvm, warm_up
+
+    try:
+        if warmup_engines:
+            warm_up(engines=warmup_engines)
+        else:
+            start_jvm()
+        conn.send(("ready", os.getpid()))
+    except BaseException as e:
+        conn.send(("error", f"{type(e).__name__}: {e}"))
+        return
+
+    while True:
+        try:
+            task = conn.recv()
+        except (EOFError, OSError):
+            return
+        if task is None:
+            return
+        path, engine, parallel_threads = task
+        try:
+            message = ("ok", extract_bundle(path, engine, parallel_threads), _jvm_committed_heap_mb())
+        except Exception as e:
+            message = ("error", f"{type(e).__name__}: {e}", _jvm_committed_heap_mb())
+        try:
+            data = pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            # Ex.: valor Java que escapou da conversão na extração
+            data = pickle.dumps(("error", f"Bundle não serializável: {e}", message[2]))
+        conn.send_bytes(data)
+
+
+@dataclass
+class _ParseTask:
+    # Caminho (str) ou o conteúdo do arquivo, enviado pelo pipe ao worker
+    source: Any
+    name: str
+    engine: str
+    parallel_threads: int
+    future: Future
+    submitted_at: float = field(default_factory=time.perf_counter)
+
+
+@dataclass
+class _WorkerStats:
+    pid: Optional[int] = None
+    files: int = 0
+    files_total: int = 0
+    recycles: int = 0
+    heap_mb: float = 0.0
+    ready: bool = False
+    error: Optional[str] = None
+
+
+class ParseWorkerPool:
+    """Pool de N processos de parse, cada um com uma JVM aquecida.
+
+    Cada worker tem uma thread no pai que pega tarefas da fila, envia o caminho
+    pelo pipe e devolve o ParsedBundle no Future. Um worker que morre no meio de
+    um arquivo falha só aquele Future e é substituído por um processo novo.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        max_files_per_worker: Optional[int] = None,
+        max_heap_mb: Optional[float] = None,
+        warmup_engines: Iterable[str] = ("jpype",),
+        start_timeout: float = PARSE_WORKER_START_TIMEOUT,
+    ):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_files_per_worker = (
+            PARSE_WORKER_MAX_FILES if max_files_per_worker is None else max_files_per_worker
+        )
+        self.max_heap_mb = PARSE_WORKER_MAX_HEAP_MB if max_heap_mb is None else max_heap_mb
+        self.warmup_engines = tuple(warmup_engines)
+        self.start_timeout = start_timeout
+        # spawn: processo limpo (sem herdar threads nem estado da JVM do pai)
+        self._context = multiprocessing.get_context("spawn")
+        self._tasks: queue.Queue = queue.Queue()
+        self._threads: List[threading.Thread] = []
+        self._stats = [_WorkerStats() for _ in range(self.workers)]
+        # Sinalizado quando a primeira subida do worker termina (com sucesso ou não)
+        self._started = [threading.Event() for _ in range(self.workers)]
+        self._closed = False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def start(self) -> None:
+        """Sobe os workers em background (JVM + warm-up); use wait_ready para esperar."""
+        for slot in range(self.workers):
+            thread = threading.Thread(target=self._run, args=(slot,), name=f"parse-worker-{slot}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Espera a primeira subida de todos os workers; True se todos estão prontos."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for event in self._started:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not event.wait(remaining):
+                return False
+        return all(stats.ready for stats in self._stats)
+
+    def submit(self, path: ReaderSource, engine: str = "jpype", parallel_threads: int = 1) -> Future:
+        """Enfileira o parse de `path`; o Future resolve com um ParsedBundle.
+
+        `path` aceita as mesmas fontes do MPPReader: caminho (o worker lê do disco)
+        ou conteúdo em memória/arquivo aberto (os bytes vão pelo pipe).
+        """
+        if self._closed:
+            raise RuntimeError("ParseWorkerPool fechado")
+        data = source_bytes(path)
+        source = str(path) if data is None else bytes(data)
+        future: Future = Future()
+        self._tasks.put(_ParseTask(source, source_name(path), engine, parallel_threads, future))
+        return future
+
+    def parse(self, path: ReaderSource, engine: str = "jpype", parallel_threads: int = 1) -> ParsedBundle:
+        return self.submit(path, engine, parallel_threads).result()
+
+    def open_reader(
+        self,
+        mpp_file_path: ReaderSource,
+        engine: str = "jpype",
+        native_dates: bool = True,
+        parallel_threads: int = 1,
+    ) -> BundleReader:
+        """Mesma assinatura de mpp.create_reader: parse no pool, reader local sobre o bundle."""
+        return BundleReader(self.parse(mpp_file_path, engine, parallel_threads), native_dates=native_dates)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "max_files_per_worker": self.max_files_per_worker,
+            "max_heap_mb": self.max_heap_mb,
+            "queued": self._tasks.qsize(),
+            "slots": [dict(vars(stats)) for stats in self._stats],
+        }
+
+    def close(self) -> None:
+        """Encerra os workers (tarefas já enfileiradas são atendidas antes)."""
+        if self._closed:
+            return
+        self._closed = True
+        for _ in self._threads:
+            self._tasks.put(None)
+        for thread in self._threads:
+            thread.join()
+
+    # ------------------------------------------------------------------
+    # Thread de cada slot (no processo pai)
+    # ------------------------------------------------------------------
+
+    def _spawn(self, slot: int):
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(child_conn, self.warmup_engines),
+            name=f"mpxj-parse-{slot}",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        try:
+            # Espera o "ready" ou a morte do processo (ex.: falha ao importar o mpxj)
+            if not wait([parent_conn, process.sentinel], self.start_timeout):
+                raise RuntimeError(f"worker não ficou pronto em {self.start_timeout:.0f}s")
+            if not parent_conn.poll():
+                process.join()
+                raise RuntimeError(f"worker terminou na inicialização (código {process.exitcode})")
+            status, payload = parent_conn.recv()
+        except BaseException:
+            self._stop_process(process, parent_conn)
+            raise
+        if status != "ready":
+            self._stop_process(process, parent_conn)
+            raise RuntimeError(payload)
+        return process, parent_conn
+
+    @staticmethod
+    def _stop_process(process, conn, timeout: float = 10.0) -> None:
+        try:
+            conn.send(None)
+        except (OSError, ValueError):
+            pass
+        process.join(timeout)
+        if process.is_alive():
+            process.kill()
+            process.join()
+        conn.close()
+
+    def _start_worker(self, slot: int):
+        """Sobe o processo do slot; em caso de falha registra o erro e retorna (None, None)."""
+        stats = self._stats[slot]
+        try:
+            process, conn = self._spawn(slot)
+            stats.pid, stats.files, stats.ready, stats.error = process.pid, 0, True, None
+            return process, conn
+        except Exception as e:
+            stats.pid, stats.ready, stats.error = None, False, str(e)
+            print(f"Aviso: Worker de parse {slot} não subiu: {e}")
+            return None, None
+        finally:
+            self._started[slot].set()
+
+    def _run(self, slot: int) -> None:
+        stats = self._stats[slot]
+        # Subida que falhou é tentada de novo só quando chega o próximo arquivo
+        process, conn = self._start_worker(slot)
+        try:
+            while True:
+                task = self._tasks.get()
+                if task is None:
+                    return
+                if not task.future.set_running_or_notify_cancel():
+                    continue
+                if process is None:
+                    process, conn = self._start_worker(slot)
+                if process is None:
+                    task.future.set_exception(ParseError(f"Worker de parse indisponível: {stats.error}"))
+                    continue
+
+                try:
+                    conn.send((task.source, task.engine, task.parallel_threads))
+                    data = conn.recv_bytes()
+                except (EOFError, OSError):
+                    self._stop_process(process, conn)
+                    task.future.set_exception(
+                        ParseError(f"Worker de parse {stats.pid} morreu durante {task.name} (código {process.exitcode})")
+                    )
+                    stats.recycles += 1
+                    process, conn = self._start_worker(slot)
+                    continue
+
+                status, payload, heap_mb = pickle.loads(data)
+                stats.files += 1
+                stats.files_total += 1
+                stats.heap_mb = round(heap_mb, 1)
+                if status == "ok":
+                    payload.stats.update({
+                        "worker_pid": stats.pid,
+                        "bundle_bytes": len(data),
+                        # Fila + pipe + parse no worker, visto do chamador
+                        "roundtrip_ms": round((time.perf_counter() - task.submitted_at) * 1000, 2),
+                    })
+                    task.future.set_result(payload)
+                else:
+                    task.future.set_exception(ParseError(payload))
+
+                # Reciclagem depois de entregar o resultado (o chamador não espera a JVM
+                # nova); enquanto este slot sobe o processo novo, os outros atendem a fila
+                if (self.max_files_per_worker and stats.files >= self.max_files_per_worker) or (
+                    self.max_heap_mb and heap_mb >= self.max_heap_mb
+                ):
+                    self._stop_process(process, conn)
+                    stats.recycles += 1
+                    process, conn = self._start_worker(slot)
+        finally:
+            if process is not None:
+                self._stop_process(process, conn)
@@ -70,11 +70,63 @@ CREATE TABLE pm.import_log (
 CREATE INDEX import_log_masterplan_id_index ON pm.import_log USING btree (masterplan_id);
 CREATE INDEX import_log_created_at_index ON pm.import_log USING btree (created_at);
 CREATE INDEX import_log_status_index ON pm.import_log USING btree (status);
+-- Import idempotente: busca do último import concluído do mesmo arquivo no masterplan
+CREATE INDEX import_log_masterplan_id_file_hash_index ON pm.import_log USING btree (masterplan_id, file_hash);
+-- Armazenamento endereçado por conteúdo: objeto já enviado por qualquer import
+CREATE INDEX import_log_file_hash_index ON pm.import_log USING btree (file_hash);
 -- Permissions
 ALTER TABLE pm.import_log OWNER TO alpha;
 GRANT ALL ON TABLE pm.import_log TO alpha;
 GRANT SELECT, DELETE, INSERT, UPDATE ON TABLE pm.import_log TO usage_on_tables;
 
+-- pm.import_job definition (fila de imports assíncronos - consumida pelos workers)
+-- Drop table
+-- DROP TABLE pm.import_job;
+CREATE TABLE pm.import_job (
+    id int4 GENERATED ALWAYS AS IDENTITY(
+        INCREMENT BY 1 MINVALUE 1 MAXVALUE 2147483647 START 1 CACHE 1 NO CYCLE
+    ) NOT NULL,
+    -- queued -> running -> completed | failed (running sem heartbeat volta para a fila)
+    status varchar DEFAULT 'queued' NOT NULL,
+    source_file varchar NOT NULL,
+    file_storage_path varchar NOT NULL,
+    file_hash varchar NULL,
+    masterplan_external_id varchar NULL,
+    -- Parâmetros do import (engine, pipelined, load_engine, force)
+    options jsonb DEFAULT '{}'::jsonb NOT NULL,
+    -- Progresso: fase atual (nomes dos Timers do importer) e timings já medidos (ms)
+    phase varchar NULL,
+    progress jsonb NULL,
+    -- Execução
+    worker_id varchar NULL,
+    attempts int4 DEFAULT 0 NOT NULL,
+    heartbeat_at timestamp NULL,
+    started_at timestamp NULL,
+    finished_at timestamp NULL,
+    -- Resultado
+    masterplan_id int4 NULL,
+    import_log_id int4 NULL,
+    result jsonb NULL,
+    error_message text NULL,
+    created_at timestamp DEFAULT CURRENT_TIMESTAMP NOT NULL,
+    created_by int4 NOT NULL,
+    updated_at timestamp NULL,
+    CONSTRAINT import_job_pk PRIMARY KEY (id),
+    CONSTRAINT import_job_status_check CHECK (status IN ('queued', 'running', 'completed', 'failed')),
+    CONSTRAINT import_job_masterplan_id_fk FOREIGN KEY (masterplan_id) REFERENCES pm.masterplan(id),
+    CONSTRAINT import_job_import_log_id_fk FOREIGN KEY (import_log_id) REFERENCES pm.import_log(id)
+);
+-- Claim dos workers (FOR UPDATE SKIP LOCKED): só jobs pendentes ou em execução
+CREATE INDEX import_job_pending_index ON pm.import_job USING btree (id)
+    WHERE status IN ('queued', 'running');
+CREATE INDEX import_job_created_at_index ON pm.import_job USING btree (created_at);
+-- Table Triggers
+CREATE TRIGGER trigger_set_updated_at BEFORE UPDATE ON pm.import_job FOR EACH ROW EXECUTE FUNCTION set_updated_at();
+-- Permissions
+ALTER TABLE pm.import_job OWNER TO alpha;
+GRANT ALL ON TABLE pm.import_job TO alpha;
+GRANT SELECT, DELETE, INSERT, UPDATE ON TABLE pm.import_job TO usage_on_tables;
+
 -- pm.task definition
 -- Drop table
 -- DROP TABLE pm.task;
@@ -97,6 +149,8 @@ CREATE TABLE pm.task (
     milestone bool DEFAULT false NOT NULL,
     summary bool DEFAULT false NOT NULL,
     custom_fields jsonb DEFAULT '{}' NOT NULL,
+    -- Fingerprint do conteúdo importado (re-import só grava linhas que mudaram)
+    content_hash varchar NULL,
     created_at timestamp DEFAULT CURRENT_TIMESTAMP NOT NULL,
     created_by int4 NOT NULL,
     updated_at timestamp DEFAULT CURRENT_TIMESTAMP NOT NULL,
@@ -138,6 +192,8 @@ CREATE TABLE pm.resource (
     cost numeric(15, 2) NULL,
     notes text NULL,
     custom_fields jsonb DEFAULT '{}' NOT NULL,
+    -- Fingerprint do conteúdo importado (re-import só grava linhas que mudaram)
+    content_hash varchar NULL,
     created_at timestamp DEFAULT CURRENT_TIMESTAMP NOT NULL,
     created_by int4 NOT NULL,
     updated_at timestamp DEFAULT CURRENT_TIMESTAMP NOT NULL,
@@ -178,6 +234,8 @@ CREATE TABLE pm.assignment (
     units numeric(10, 2) NULL,
     percent_complete int4 DEFAULT 0 NOT NULL,
     custom_fields jsonb DEFAULT '{}' NOT NULL,
+    -- Fingerprint do conteúdo importado (re-import só grava linhas que mudaram)
+    content_hash varchar NULL,
     created_at timestamp DEFAULT CURRENT_TIMESTAMP NOT NULL,
     created_by int4 NOT NULL,
     updated_at timestamp DEFAULT CURRENT_TIMESTAMP NOT NULL,
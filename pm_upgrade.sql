@@ -0,0 +1,62 @@
+-- Upgrade de um schema pm criado com uma versão anterior do pm.sql.
+-- Idempotente: pode rodar mais de uma vez e em bancos já atualizados.
+-- psql -h localhost -U usuario -d banco -f pm_upgrade.sql
+
+-- pm.import_log: import idempotente (último import concluído do mesmo arquivo no masterplan)
+CREATE INDEX IF NOT EXISTS import_log_masterplan_id_file_hash_index ON pm.import_log USING btree (masterplan_id, file_hash);
+
+-- pm.task / pm.resource / pm.assignment: fingerprint do conteúdo importado
+-- (re-import só grava linhas que mudaram; NULL = linha regravada no próximo import)
+ALTER TABLE pm.task ADD COLUMN IF NOT EXISTS content_hash varchar NULL;
+ALTER TABLE pm.resource ADD COLUMN IF NOT EXISTS content_hash varchar NULL;
+ALTER TABLE pm.assignment ADD COLUMN IF NOT EXISTS content_hash varchar NULL;
+
+-- pm.import_job: fila de imports assíncronos (consumida pelos workers)
+CREATE TABLE IF NOT EXISTS pm.import_job (
+    id int4 GENERATED ALWAYS AS IDENTITY(
+        INCREMENT BY 1 MINVALUE 1 MAXVALUE 2147483647 START 1 CACHE 1 NO CYCLE
+    ) NOT NULL,
+    -- queued -> running -> completed | failed (running sem heartbeat volta para a fila)
+    status varchar DEFAULT 'queued' NOT NULL,
+    source_file varchar NOT NULL,
+    file_storage_path varchar NOT NULL,
+    file_hash varchar NULL,
+    masterplan_external_id varchar NULL,
+    -- Parâmetros do import (engine, pipelined, load_engine, force)
+    options jsonb DEFAULT '{}'::jsonb NOT NULL,
+    -- Progresso: fase atual (nomes dos Timers do importer) e timings já medidos (ms)
+    phase varchar NULL,
+    progress jsonb NULL,
+    -- Execução
+    worker_id varchar NULL,
+    attempts int4 DEFAULT 0 NOT NULL,
+    heartbeat_at timestamp NULL,
+    started_at timestamp NULL,
+    finished_at timestamp NULL,
+    -- Resultado
+    masterplan_id int4 NULL,
+    import_log_id int4 NULL,
+    result jsonb NULL,
+    error_message text NULL,
+    created_at timestamp DEFAULT CURRENT_TIMESTAMP NOT NULL,
+    created_by int4 NOT NULL,
+    updated_at timestamp NULL,
+    CONSTRAINT import_job_pk PRIMARY KEY (id),
+    CONSTRAINT import_job_status_check CHECK (status IN ('queued', 'running', 'completed', 'failed')),
+    CONSTRAINT import_job_masterplan_id_fk FOREIGN KEY (masterplan_id) REFERENCES pm.masterplan(id),
+    CONSTRAINT import_job_import_log_id_fk FOREIGN KEY (import_log_id) REFERENCES pm.import_log(id)
+);
+-- Claim dos workers (FOR UPDATE SKIP LOCKED): só jobs pendentes ou em execução
+CREATE INDEX IF NOT EXISTS import_job_pending_index ON pm.import_job USING btree (id)
+    WHERE status IN ('queued', 'running');
+CREATE INDEX IF NOT EXISTS import_job_created_at_index ON pm.import_job USING btree (created_at);
+-- Table Triggers
+DROP TRIGGER IF EXISTS trigger_set_updated_at ON pm.import_job;
+CREATE TRIGGER trigger_set_updated_at BEFORE UPDATE ON pm.import_job FOR EACH ROW EXECUTE FUNCTION set_updated_at();
+-- Permissions
+ALTER TABLE pm.import_job OWNER TO alpha;
+GRANT ALL ON TABLE pm.import_job TO alpha;
+GRANT SELECT, DELETE, INSERT, UPDATE ON TABLE pm.import_job TO usage_on_tables;
+
+-- pm.import_log: armazenamento endereçado por conteúdo (objeto já enviado por qualquer import)
+CREATE INDEX IF NOT EXISTS import_log_file_hash_index ON pm.import_log USING btree (file_hash);
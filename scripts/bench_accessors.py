@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: sondagem com hasattr por entidade vs accessors resolvidos por classe.
+
+Uso:
+  python scripts/bench_accessors.py                  # Só o micro-benchmark (objetos simulados)
+  python scripts/bench_accessors.py --rows 200000
+  python scripts/bench_accessors.py example.mpp      # Também mede o MPPReader em um arquivo real
+
+Os objetos simulados contam cada lookup de atributo (o equivalente a uma travessia
+JPype na sondagem com hasattr) para comparar, por entidade, o caminho antigo
+(`hasattr(obj, "getX")` + `obj.getX()` a cada linha) com o registro
+`_resolve_accessor`/`_call_accessor` de mpxj_pm.mpp (resolve uma vez por classe).
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from mpxj_pm.mpp import (
+    _RELATION_TARGET_ACCESSORS,
+    _TIMEPHASED_END,
+    _TIMEPHASED_PLANNED_WORK,
+    _accessor_cache,
+    _call_accessor,
+    create_reader,
+)
+
+LOOKUPS = {"count": 0}
+
+
+class _CountingMeta(type):
+    def __getattribute__(cls, name):
+        if not name.startswith("__"):
+            LOOKUPS["count"] += 1
+        return super().__getattribute__(name)
+
+
+class _Counting(metaclass=_CountingMeta):
+    def __getattribute__(self, name):
+        if not name.startswith("__"):
+            LOOKUPS["count"] += 1
+        return object.__getattribute__(self, name)
+
+
+class FakeTask(_Counting):
+    def getUniqueID(self):
+        return 42
+
+
+class FakeRelation(_Counting):
+    """Simula Relation do MPXJ 12+ (só getPredecessorTask, sem getTargetTask)."""
+
+    def getPredecessorTask(self):
+        return FakeTask()
+
+    def getType(self):
+        return "FS"
+
+    def getLag(self):
+        return 0.0
+
+
+class FakePeriod(_Counting):
+    """Simula TimephasedWork (getFinish/getTotalAmount, sem getEnd/getAmount)."""
+
+    def getStart(self):
+        return 0
+
+    def getFinish(self):
+        return 1
+
+    def getTotalAmount(self):
+        return 8.0
+
+
+def legacy_relation(predecessor):
+    target_task = None
+    if hasattr(predecessor, "getTargetTask"):
+        target_task = predecessor.getTargetTask()
+    elif hasattr(predecessor, "getPredecessorTask"):
+        target_task = predecessor.getPredecessorTask()
+    elif hasattr(predecessor, "getSourceTask"):
+        target_task = predecessor.getSourceTask()
+    relation_type = predecessor.getType() if hasattr(predecessor, "getType") and predecessor.getType() else None
+    lag = predecessor.getLag() if hasattr(predecessor, "getLag") else None
+    return target_task, relation_type, lag
+
+
+def resolved_relation(predecessor):
+    return (
+        _call_accessor(predecessor, *_RELATION_TARGET_ACCESSORS),
+        _call_accessor(predecessor, "getType"),
+        _call_accessor(predecessor, "getLag"),
+    )
+
+
+def legacy_period(period):
+    start = end = work = None
+    if hasattr(period, "getStart"):
+        start = period.getStart()
+    if hasattr(period, "getEnd"):
+        end = period.getEnd()
+    if hasattr(period, "getAmount"):
+        work = period.getAmount()
+    elif hasattr(period, "getWork"):
+        work = period.getWork()
+    elif hasattr(period, "getValue"):
+        work = period.getValue()
+    if hasattr(period, "getCost"):
+        period.getCost()
+    if hasattr(period, "getUnits"):
+        period.getUnits()
+    return start, end, work
+
+
+def resolved_period(period):
+    start = _call_accessor(period, "getStart")
+    end = _call_accessor(period, *_TIMEPHASED_END)
+    work = _call_accessor(period, *_TIMEPHASED_PLANNED_WORK)
+    _call_accessor(period, "getCost")
+    _call_accessor(period, "getUnits")
+    return start, end, work
+
+
+def measure(label: str, fn, objects) -> None:
+    LOOKUPS["count"] = 0
+    start = time.perf_counter()
+    for obj in objects:
+        fn(obj)
+    elapsed = time.perf_counter() - start
+    per_entity = LOOKUPS["count"] / len(objects)
+    print(f"  {label:<28} {elapsed * 1000:9.1f} ms   {per_entity:5.2f} lookups/entidade")
+
+
+def run_micro(rows: int) -> None:
+    relations = [FakeRelation() for _ in range(rows)]
+    periods = [FakePeriod() for _ in range(rows)]
+
+    print(f"Micro-benchmark ({rows} entidades simuladas)")
+    print("Relations (predecessoras):")
+    measure("antes (hasattr por linha)", legacy_relation, relations)
+    _accessor_cache.clear()
+    measure("depois (accessor por classe)", resolved_relation, relations)
+    print("Períodos timephased:")
+    measure("antes (hasattr por linha)", legacy_period, periods)
+    _accessor_cache.clear()
+    measure("depois (accessor por classe)", resolved_period, periods)
+
+
+def run_file(mpp_file: Path) -> None:
+    reader = create_reader(str(mpp_file))
+    reader.read()
+
+    print(f"\nArquivo real: {mpp_file.name}")
+    for label, method in (
+        ("get_dependencies", reader.get_dependencies),
+        ("get_assignment_timephased", reader.get_assignment_timephased),
+        ("get_calendars", reader.get_calendars),
+    ):
+        start = time.perf_counter()
+        method()
+        print(f"  {label:<28} {(time.perf_counter() - start) * 1000:9.1f} ms")
+    print(f"  accessors resolvidos (classe, nomes): {len(_accessor_cache)}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("mpp_file", nargs="?", type=Path, help="Arquivo .mpp opcional para medir o reader real")
+    parser.add_argument("--rows", type=int, default=100_000, help="Entidades simuladas (default: 100000)")
+    args = parser.parse_args()
+
+    run_micro(args.rows)
+    if args.mpp_file:
+        if not args.mpp_file.exists():
+            print(f"Arquivo não encontrado: {args.mpp_file}")
+            return 1
+        run_file(args.mpp_file)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""Benchmark: reconciliação de dependências (legado vs statement único set-based).
+
+Uso:
+  python scripts/bench_dependencies.py                      # 100k dependências
+  python scripts/bench_dependencies.py --dependencies 20000 --repeat 3
+  python scripts/bench_dependencies.py --strategies legacy executemany
+
+Estratégias:
+  legacy       upsert em chunks + marca todas como deletadas + UPDATE por par para
+               restaurar (implementação anterior de _import_dependencies)
+  executemany  MPPImporter._import_dependencies com os pares em arrays (unnest)
+  copy         MPPImporter._import_dependencies com os pares por COPY na staging
+
+Para cada estratégia: cria um masterplan temporário com uma cadeia de tasks e grava
+as dependências três vezes (carga inicial, re-import idêntico e re-import com 10%
+removidas, 10% com lag alterado e 10% novas), dentro de uma transação que sofre
+ROLLBACK no final: nada fica no banco.
+
+Requer:
+- variáveis de banco (PG*) e schema pm aplicado (Postgres local)
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+import uuid
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+try:
+    from dotenv import load_dotenv
+except ImportError:  # pragma: no cover
+    def load_dotenv(*args, **kwargs):  # type: ignore[no-redef]
+        return False
+
+from mpxj_pm.db import DBConfig
+from mpxj_pm.importer import MPPImporter
+
+STRATEGIES = ("legacy", "executemany", "copy")
+PASSES = ("initial", "identical", "changed")
+
+
+def build_passes(dependency_count: int) -> dict:
+    """Monta as três versões das dependências (por external_id das tasks)."""
+    initial = [
+        {"predecessor_external_id": str(i), "successor_external_id": str(i + 1), "type": "FS", "lag": 0.0}
+        for i in range(1, dependency_count + 1)
+    ]
+    step = 10
+    changed = []
+    for position, dep in enumerate(initial):
+        if position % step == 0:
+            continue  # removida
+        if position % step == 1:
+            dep = {**dep, "lag": 8.0}  # lag alterado
+        changed.append(dep)
+    # Novas: pula uma task (i -> i + 2)
+    changed.extend(
+        {"predecessor_external_id": str(i), "successor_external_id": str(i + 2), "type": "SS", "lag": 0.0}
+        for i in range(1, dependency_count, step)
+    )
+    return {"initial": initial, "identical": initial, "changed": changed}
+
+
+def legacy_import_dependencies(importer: MPPImporter, cur, masterplan_id: int, dependencies, task_id_map) -> int:
+    """Implementação anterior: upsert + marca todas como deletadas + restaura par a par."""
+    rows = []
+    pairs = []
+    for dep in dependencies:
+        predecessor_task_id = task_id_map.get(dep["predecessor_external_id"])
+        successor_task_id = task_id_map.get(dep["successor_external_id"])
+        if not predecessor_task_id or not successor_task_id or predecessor_task_id == successor_task_id:
+            continue
+        rows.append((masterplan_id, predecessor_task_id, successor_task_id, dep["type"], dep["lag"], importer.created_by))
+        pairs.append((masterplan_id, predecessor_task_id, successor_task_id))
+
+    for i in range(0, len(rows), 5000):
+        cur.executemany(
+            """
+            INSERT INTO pm.task_dependency (
+                masterplan_id, predecessor_task_id, successor_task_id,
+                dependency_type, lag, created_by
+            ) VALUES (%s, %s, %s, %s, %s, %s)
+            ON CONFLICT (predecessor_task_id, successor_task_id)
+            WHERE deleted_at IS NULL
+            DO UPDATE SET
+                dependency_type = EXCLUDED.dependency_type,
+                lag = EXCLUDED.lag,
+                updated_by = EXCLUDED.created_by,
+                updated_at = CURRENT_TIMESTAMP
+            """,
+            rows[i:i + 5000],
+        )
+    cur.execute(
+        """
+        UPDATE pm.task_dependency
+        SET deleted_at = CURRENT_TIMESTAMP, deleted_by = %s, updated_at = CURRENT_TIMESTAMP
+        WHERE masterplan_id = %s AND deleted_at IS NULL
+        """,
+        (importer.created_by, masterplan_id),
+    )
+    for i in range(0, len(pairs), 1000):
+        cur.executemany(
+            """
+            UPDATE pm.task_dependency
+            SET deleted_at = NULL, deleted_by = NULL, updated_at = CURRENT_TIMESTAMP
+            WHERE masterplan_id = %s AND predecessor_task_id = %s AND successor_task_id = %s
+            """,
+            pairs[i:i + 1000],
+        )
+    return len(rows)
+
+
+def run_strategy(importer: MPPImporter, dependency_count: int, passes: dict, strategy: str) -> dict:
+    conn = importer._connect()
+    timings = {}
+    try:
+        with conn.cursor() as cur:
+            cur.execute(
+                "INSERT INTO pm.masterplan (name, external_id, created_by) VALUES (%s, %s, %s) RETURNING id",
+                ("bench_dependencies", str(uuid.uuid4()), importer.created_by),
+            )
+            masterplan_id = cur.fetchone()[0]
+            tasks = [{"external_id": str(i), "name": f"Tarefa {i}"} for i in range(1, dependency_count + 2)]
+            task_id_map = importer._import_tasks(cur, masterplan_id, tasks)
+
+            for name in PASSES:
+                start = time.perf_counter()
+                if strategy == "legacy":
+                    legacy_import_dependencies(importer, cur, masterplan_id, passes[name], task_id_map)
+                else:
+                    importer._import_dependencies(cur, masterplan_id, passes[name], task_id_map, strategy)
+                timings[name] = time.perf_counter() - start
+
+            cur.execute(
+                "SELECT count(*) FROM pm.task_dependency WHERE masterplan_id = %s AND deleted_at IS NULL",
+                (masterplan_id,),
+            )
+            timings["active"] = cur.fetchone()[0]
+    finally:
+        conn.rollback()
+        conn.close()
+    return timings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dependencies", type=int, default=100_000, help="Dependências sintéticas (default: 100000)")
+    parser.add_argument("--strategies", nargs="+", default=list(STRATEGIES), choices=STRATEGIES)
+    parser.add_argument("--repeat", type=int, default=1, help="Rodadas por estratégia (vale a melhor)")
+    args = parser.parse_args()
+
+    load_dotenv(REPO_ROOT / ".env", override=False)
+
+    passes = build_passes(args.dependencies)
+    importer = MPPImporter(DBConfig())
+    print(
+        f"Dependências: {len(passes['initial'])} na carga inicial, "
+        f"{len(passes['changed'])} no re-import com mudanças\n"
+    )
+
+    results = {}
+    for strategy in args.strategies:
+        runs = [run_strategy(importer, args.dependencies, passes, strategy) for _ in range(args.repeat)]
+        results[strategy] = min(runs, key=lambda r: sum(r[name] for name in PASSES))
+
+    print(f"  {'passo':<12}" + "".join(f"{strategy:>14}" for strategy in results))
+    for name in PASSES:
+        print(f"  {name:<12}" + "".join(f"{results[s][name]:>13.3f}s" for s in results))
+    print(f"  {'ativas':<12}" + "".join(f"{results[s]['active']:>14}" for s in results))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
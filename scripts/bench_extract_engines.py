@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Benchmark: compara os engines de extração (JPype por getter vs JsonWriter do MPXJ).
+
+Uso:
+  python scripts/bench_extract_engines.py example.mpp
+  python scripts/bench_extract_engines.py example.mpp --engines jpype json --repeat 3
+
+Mede, para cada engine, o tempo das mesmas fases usadas por MPPImporter.import_project
+(extract_resources, extract_tasks, extract_assignments, extract_timephased) e as
+contagens de linhas produzidas, para conferir que os bundles batem.
+Não requer banco de dados.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from mpxj_pm.mpp import READER_ENGINES, create_reader
+
+
+def run_engine(mpp_file: Path, engine: str) -> dict:
+    timings: dict = {}
+    counts: dict = {}
+
+    start = time.perf_counter()
+    reader = create_reader(str(mpp_file), engine=engine)
+    reader.read()
+    timings["read_mpp_file"] = time.perf_counter() - start
+
+    _, fields_by_class = reader.get_custom_field_definitions()
+    baselines_meta = reader.get_baseline_indices_and_names()
+    baseline_indices = [b["index"] for b in baselines_meta] or None
+
+    start = time.perf_counter()
+    resources, resource_baselines = reader.extract_resources_bundle(
+        resource_custom_fields=fields_by_class.get("RESOURCE", []),
+        baseline_indices=baseline_indices,
+    )
+    timings["extract_resources"] = time.perf_counter() - start
+    counts["resources"] = len(resources)
+    counts["resource_baselines"] = len(resource_baselines)
+
+    start = time.perf_counter()
+    tasks, dependencies, task_baselines = reader.extract_tasks_bundle(
+        task_custom_fields=fields_by_class.get("TASK", []),
+        baseline_indices=baseline_indices,
+    )
+    timings["extract_tasks"] = time.perf_counter() - start
+    counts["tasks"] = len(tasks)
+    counts["dependencies"] = len(dependencies)
+    counts["task_baselines"] = len(task_baselines)
+
+    start = time.perf_counter()
+    assignments = reader.get_assignments(fields_by_class.get("ASSIGNMENT", []))
+    timings["extract_assignments"] = time.perf_counter() - start
+    counts["assignments"] = len(assignments)
+
+    start = time.perf_counter()
+    timephased, _ = reader.get_assignment_timephased()
+    timings["extract_timephased"] = time.perf_counter() - start
+    counts["timephased_periods"] = sum(len(t["planned"]) + len(t["complete"]) for t in timephased)
+
+    return {"timings": timings, "counts": counts}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("mpp_file", type=Path)
+    parser.add_argument("--engines", nargs="+", default=list(READER_ENGINES), choices=list(READER_ENGINES))
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    if not args.mpp_file.exists():
+        print(f"Erro: Arquivo não encontrado: {args.mpp_file}")
+        return 1
+
+    results = {}
+    for engine in args.engines:
+        best = None
+        for _ in range(args.repeat):
+            result = run_engine(args.mpp_file, engine)
+            if best is None or sum(result["timings"].values()) < sum(best["timings"].values()):
+                best = result
+        results[engine] = best
+
+    phases = list(next(iter(results.values()))["timings"])
+    print(f"\n{'fase':<24}" + "".join(f"{engine:>14}" for engine in results))
+    for phase in phases:
+        print(f"{phase:<24}" + "".join(f"{r['timings'][phase] * 1000:>12.1f}ms" for r in results.values()))
+    print(f"{'TOTAL':<24}" + "".join(f"{sum(r['timings'].values()) * 1000:>12.1f}ms" for r in results.values()))
+
+    print(f"\n{'contagem':<24}" + "".join(f"{engine:>14}" for engine in results))
+    for key in next(iter(results.values()))["counts"]:
+        print(f"{key:<24}" + "".join(f"{r['counts'][key]:>14}" for r in results.values()))
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Benchmark: cold start da JVM até o primeiro import, com e sem o archive AppCDS.
+
+Uso:
+  python scripts/bench_jvm_startup.py                          # warmup.xml, 5 processos por modo
+  python scripts/bench_jvm_startup.py exemplo.mpp --runs 10
+  python scripts/bench_jvm_startup.py --archive /app/mpxj_pm/java/mpxj.jsa --modes default appcds
+
+Cada rodada é um processo Python novo (cold start de verdade), que mede:
+  import      import de mpxj_pm.importer (sem JVM)
+  jvm_start   mpxj_pm.mpp.start_jvm (JVM + jars do MPXJ)
+  first_read  primeira leitura + extração completa do arquivo (read, resources,
+              tasks, assignments, timephased), sem banco
+  wall        tempo do processo inteiro, medido pelo processo pai
+
+Modos:
+  off         -Xshare:off (nem o CDS base do JDK)
+  default     CDS base do JDK, sem archive do MPXJ
+  appcds      com MPXJ_CDS_ARCHIVE (gere antes com scripts/build_cds_archive.py)
+
+Vale a mediana das rodadas de cada modo.
+
+Requer:
+- Java e pacote mpxj instalados; archive AppCDS para o modo appcds
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+MODES = ("off", "default", "appcds")
+PHASES = ("import", "jvm_start", "first_read", "wall")
+DEFAULT_ARCHIVE = REPO_ROOT / "mpxj_pm" / "java" / "mpxj.jsa"
+
+
+def child(path: str, engine: str) -> int:
+    """Rodada (processo filho): imprime os tempos em JSON na última linha."""
+    timings = {}
+    start = time.perf_counter()
+    from mpxj_pm.importer import MPPImporter  # noqa: F401 - custo do import do pacote
+    from mpxj_pm.mpp import create_reader, start_jvm
+    timings["import"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    start_jvm()
+    timings["jvm_start"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    reader = create_reader(path, engine=engine, native_dates=True)
+    reader.read()
+    _, fields_by_class = reader.get_custom_field_definitions()
+    reader.extract_resources_bundle(fields_by_class.get("RESOURCE", []))
+    reader.extract_tasks_bundle(fields_by_class.get("TASK", []))
+    reader.get_assignments(fields_by_class.get("ASSIGNMENT", []))
+    reader.get_assignment_timephased()
+    timings["first_read"] = time.perf_counter() - start
+
+    print(json.dumps(timings))
+    return 0
+
+
+def run_mode(mode: str, path: str, engine: str, archive: Path) -> dict:
+    env = dict(os.environ)
+    env.pop("MPXJ_CDS_ARCHIVE", None)
+    env.pop("MPXJ_CDS_DUMP", None)
+    options = env.get("MPXJ_JVM_OPTIONS", "")
+    if mode == "off":
+        env["MPXJ_JVM_OPTIONS"] = f"{options} -Xshare:off".strip()
+    elif mode == "appcds":
+        env["MPXJ_CDS_ARCHIVE"] = str(archive)
+
+    cmd = [sys.executable, str(Path(__file__).resolve()), "--child", "--engine", engine, path]
+    start = time.perf_counter()
+    result = subprocess.run(cmd, env=env, cwd=str(REPO_ROOT), capture_output=True, text=True)
+    wall = time.perf_counter() - start
+    if result.returncode != 0:
+        raise RuntimeError(f"rodada {mode} falhou:\n{result.stderr or result.stdout}")
+    timings = json.loads(result.stdout.strip().splitlines()[-1])
+    timings["wall"] = wall
+    return timings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("file", nargs="?", default=None, help="Arquivo .mpp/.xml (padrão: cronograma de warm-up)")
+    parser.add_argument("--runs", type=int, default=5, help="Processos por modo (vale a mediana)")
+    parser.add_argument("--modes", nargs="+", default=list(MODES), choices=MODES)
+    parser.add_argument("--engine", default="jpype", help="Engine de extração da primeira leitura")
+    parser.add_argument("--archive", default=str(DEFAULT_ARCHIVE), help="Archive AppCDS do modo appcds")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.file is None:
+        from mpxj_pm.mpp import WARMUP_SAMPLE
+        args.file = WARMUP_SAMPLE
+
+    if args.child:
+        return child(args.file, args.engine)
+
+    archive = Path(args.archive)
+    modes = list(args.modes)
+    if "appcds" in modes and not archive.exists():
+        print(f"Aviso: archive não encontrado ({archive}); rode scripts/build_cds_archive.py. Pulando appcds.\n")
+        modes.remove("appcds")
+
+    print(f"Arquivo: {Path(args.file).name} | engine: {args.engine} | {args.runs} processo(s) por modo\n")
+    results = {}
+    for mode in modes:
+        runs = [run_mode(mode, args.file, args.engine, archive) for _ in range(args.runs)]
+        results[mode] = {phase: statistics.median(run[phase] for run in runs) for phase in PHASES}
+
+    print(f"  {'fase':<12}" + "".join(f"{mode:>12}" for mode in results))
+    for phase in PHASES:
+        print(f"  {phase:<12}" + "".join(f"{results[m][phase]:>11.3f}s" for m in results))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""Benchmark: compara os engines de carga (executemany vs COPY em staging + merge).
+
+Uso:
+  python scripts/bench_load_engines.py                    # 50k tasks/assignments/dependências
+  python scripts/bench_load_engines.py --tasks 10000 --repeat 3
+  python scripts/bench_load_engines.py --engines copy
+
+Gera um projeto sintético e grava com os mesmos métodos usados por
+MPPImporter.import_project (_import_resources, _import_tasks, _import_assignments,
+_import_dependencies) em um masterplan temporário. Cada rodada faz a carga inicial
+(insert) e uma segunda carga com os mesmos external_ids (update: como o conteúdo
+é idêntico, mede o caminho de re-import em que o content_hash descarta todas as
+linhas), dentro de uma transação que sofre ROLLBACK no final: nada fica no banco.
+
+Requer:
+- variáveis de banco (PG*) e schema pm aplicado (Postgres local)
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+try:
+    from dotenv import load_dotenv
+except ImportError:  # pragma: no cover
+    def load_dotenv(*args, **kwargs):  # type: ignore[no-redef]
+        return False
+
+from mpxj_pm.db import DBConfig
+from mpxj_pm.importer import LOAD_ENGINES, MPPImporter
+
+
+def build_project(task_count: int, resource_count: int) -> dict:
+    """Monta bundles sintéticos no formato produzido pelo MPPReader."""
+    base = datetime(2026, 1, 5, 8, 0)
+    resources = [
+        {"external_id": str(i), "name": f"Recurso {i}", "type": "WORK", "max_units": 100.0, "custom_fields": {}}
+        for i in range(1, resource_count + 1)
+    ]
+    tasks = [
+        {
+            "external_id": str(i),
+            "name": f"Tarefa {i}",
+            "start": base + timedelta(days=i % 365),
+            "finish": base + timedelta(days=i % 365 + 3),
+            "duration": 3.0,
+            "work": 24.0,
+            "percent_complete": i % 100,
+            "wbs": f"1.{i}",
+            "outline_level": 2,
+            "custom_fields": {"text1": f"valor {i}"},
+        }
+        for i in range(1, task_count + 1)
+    ]
+    assignments = [
+        {
+            "external_id": str(i),
+            "task_external_id": str(i),
+            "resource_external_id": str(i % resource_count + 1),
+            "work": 24.0,
+            "units": 1.0,
+            "start": tasks[i - 1]["start"],
+            "finish": tasks[i - 1]["finish"],
+            "custom_fields": {},
+        }
+        for i in range(1, task_count + 1)
+    ]
+    dependencies = [
+        {"predecessor_external_id": str(i - 1), "successor_external_id": str(i), "type": "FS", "lag": 0.0}
+        for i in range(2, task_count + 1)
+    ]
+    return {"resources": resources, "tasks": tasks, "assignments": assignments, "dependencies": dependencies}
+
+
+def load_once(importer: MPPImporter, cur, masterplan_id: int, project: dict, engine: str) -> dict:
+    timings = {}
+
+    start = time.perf_counter()
+    resource_id_map = importer._import_resources(cur, masterplan_id, project["resources"], engine)
+    timings["resources"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    task_id_map = importer._import_tasks(cur, masterplan_id, project["tasks"], engine)
+    timings["tasks"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    importer._import_assignments(
+        cur, masterplan_id, project["assignments"], task_id_map, resource_id_map, engine
+    )
+    timings["assignments"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    importer._import_dependencies(cur, masterplan_id, project["dependencies"], task_id_map, engine)
+    timings["dependencies"] = time.perf_counter() - start
+
+    timings["total"] = sum(timings.values())
+    return timings
+
+
+def run_engine(importer: MPPImporter, project: dict, engine: str) -> dict:
+    conn = importer._connect()
+    try:
+        with conn.cursor() as cur:
+            cur.execute(
+                "INSERT INTO pm.masterplan (name, external_id, created_by) VALUES (%s, %s, %s) RETURNING id",
+                ("bench_load_engines", str(uuid.uuid4()), importer.created_by),
+            )
+            masterplan_id = cur.fetchone()[0]
+            insert = load_once(importer, cur, masterplan_id, project, engine)
+            update = load_once(importer, cur, masterplan_id, project, engine)
+    finally:
+        conn.rollback()
+        conn.close()
+    return {"insert": insert, "update": update}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=50_000, help="Tasks/assignments sintéticos (default: 50000)")
+    parser.add_argument("--resources", type=int, default=2_000, help="Resources sintéticos (default: 2000)")
+    parser.add_argument("--engines", nargs="+", default=list(LOAD_ENGINES), choices=LOAD_ENGINES)
+    parser.add_argument("--repeat", type=int, default=1, help="Rodadas por engine (vale a melhor)")
+    args = parser.parse_args()
+
+    load_dotenv(REPO_ROOT / ".env", override=False)
+
+    project = build_project(args.tasks, args.resources)
+    importer = MPPImporter(DBConfig())
+    print(
+        f"Projeto sintético: {args.tasks} tasks, {args.resources} resources, "
+        f"{len(project['assignments'])} assignments, {len(project['dependencies'])} dependências\n"
+    )
+
+    results = {}
+    for engine in args.engines:
+        runs = [run_engine(importer, project, engine) for _ in range(args.repeat)]
+        results[engine] = min(runs, key=lambda r: r["insert"]["total"] + r["update"]["total"])
+
+    for mode in ("insert", "update"):
+        print(f"[{mode}]")
+        phases = list(next(iter(results.values()))[mode])
+        print(f"  {'fase':<14}" + "".join(f"{engine:>14}" for engine in results))
+        for phase in phases:
+            print(f"  {phase:<14}" + "".join(f"{results[e][mode][phase]:>13.3f}s" for e in results))
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""Benchmark: extração em shards (MPPReader parallel_threads) vs sequencial, por número de threads.
+
+Uso:
+  python scripts/bench_parallel_extract.py grande.mpp                  # 1, 2, 4, ... até os núcleos
+  python scripts/bench_parallel_extract.py grande.mpp --threads 1 2 4 8 --repeat 5
+  python scripts/bench_parallel_extract.py grande.mpp --baselines --no-custom-fields
+
+O arquivo é lido uma vez (read fica fora da medição); cada rodada extrai o
+projeto inteiro com um MPPReader novo sobre o mesmo ProjectFile, por fase:
+  resources    iter_resources_bundle (+ resource baselines)
+  tasks        iter_tasks_bundle (+ dependencies, task baselines)
+  assignments  iter_assignments
+  timephased   iter_assignment_timephased_rows
+  total        soma das fases
+
+Vale a mediana de `--repeat` rodadas. A saída de cada contagem de threads é
+comparada com a sequencial (mesmas linhas, na mesma ordem); divergência aborta
+o benchmark. O ganho depende de quanto da extração é chamada Java (GIL solto)
+versus conversão em Python (GIL preso): cronogramas com muitos custom fields,
+baselines e timephased tendem a ganhar mais.
+
+Requer:
+- Java e pacote mpxj instalados
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from mpxj_pm.mpp import MPPReader, create_reader, warm_up
+
+PHASES = ("resources", "tasks", "assignments", "timephased", "total")
+
+
+def default_thread_counts() -> list[int]:
+    cores = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 <= cores:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cores:
+        counts.append(cores)
+    return counts
+
+
+def extract(reader: MPPReader, fields_by_class: dict, baseline_indices) -> tuple[dict, dict]:
+    """Extração completa em lotes; retorna (tempos por fase, saída concatenada)."""
+    timings, output = {}, {}
+    stages = {
+        "resources": lambda: reader.iter_resources_bundle(fields_by_class.get("RESOURCE", []), baseline_indices),
+        "tasks": lambda: reader.iter_tasks_bundle(fields_by_class.get("TASK", []), baseline_indices),
+        "assignments": lambda: ((batch,) for batch in reader.iter_assignments(fields_by_class.get("ASSIGNMENT", []))),
+        "timephased": lambda: ((entries,) for entries, _ in reader.iter_assignment_timephased_rows()),
+    }
+    for phase, stage in stages.items():
+        start = time.perf_counter()
+        merged = None
+        for batch in stage():
+            merged = merged or tuple([] for _ in batch)
+            for acc, rows in zip(merged, batch):
+                acc.extend(rows)
+        timings[phase] = time.perf_counter() - start
+        output[phase] = merged
+    timings["total"] = sum(timings.values())
+    return timings, output
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("file", help="Arquivo .mpp/.xml (de preferência um cronograma grande)")
+    parser.add_argument("--threads", nargs="+", type=int, default=None, help="Contagens de threads (padrão: 1, 2, 4, ... núcleos)")
+    parser.add_argument("--repeat", type=int, default=3, help="Rodadas por contagem (vale a mediana)")
+    parser.add_argument("--baselines", action="store_true", help="Extrai também os baselines do arquivo")
+    parser.add_argument("--no-custom-fields", action="store_true", help="Não extrai custom fields")
+    args = parser.parse_args()
+
+    warm_up()
+    base = create_reader(args.file, native_dates=True)
+    start = time.perf_counter()
+    project = base.read()
+    read_seconds = time.perf_counter() - start
+    _, fields_by_class = base.get_custom_field_definitions()
+    if args.no_custom_fields:
+        fields_by_class = {}
+    baseline_indices = None
+    if args.baselines:
+        baseline_indices = [b["index"] for b in base.get_baseline_indices_and_names()] or None
+
+    counts = args.threads or default_thread_counts()
+    if 1 not in counts:
+        counts = [1, *counts]
+    print(
+        f"Arquivo: {Path(args.file).name} (read {read_seconds:.2f}s) | núcleos: {os.cpu_count()} | "
+        f"{args.repeat} rodada(s) por contagem\n"
+    )
+
+    results, reference = {}, None
+    for threads in counts:
+        runs = []
+        for _ in range(args.repeat):
+            reader = create_reader(args.file, native_dates=True, parallel_threads=threads)
+            reader.project = project
+            timings, output = extract(reader, fields_by_class, baseline_indices)
+            if reference is None:
+                reference = output
+            elif output != reference:
+                diverged = [phase for phase in output if output[phase] != reference[phase]]
+                print(f"Erro: saída com {threads} thread(s) difere da sequencial em: {', '.join(diverged)}")
+                return 1
+            runs.append(timings)
+        results[threads] = {phase: statistics.median(run[phase] for run in runs) for phase in PHASES}
+
+    print(f"  {'fase':<12}" + "".join(f"{f'{t} thr':>16}" for t in results))
+    for phase in PHASES:
+        cells = []
+        for threads in results:
+            seconds = results[threads][phase]
+            speedup = results[1][phase] / seconds if seconds else 0.0
+            cells.append(f"{seconds:>8.3f}s {speedup:>5.2f}x")
+        print(f"  {phase:<12}" + "".join(f"{cell:>16}" for cell in cells))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
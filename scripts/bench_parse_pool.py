@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Benchmark: throughput de parse (arquivos/s) em processo vs ParseWorkerPool com N workers.
+
+Uso:
+  python scripts/bench_parse_pool.py exemplo.mpp                      # 1, 2, 4, ... até os núcleos
+  python scripts/bench_parse_pool.py a.mpp b.mpp --files 64 --workers 1 2 4 8
+  python scripts/bench_parse_pool.py exemplo.mpp --engine columnar --max-files-per-worker 10
+
+Cada rodada lê e extrai `--files` arquivos (os informados, em ciclo) com
+mpxj_pm.parse_pool.extract_bundle, sem banco:
+  inproc      sequencial neste processo (uma JVM, como o import sem PARSE_WORKERS)
+  workers=N   ParseWorkerPool com N processos, bundles serializados de volta para
+              este processo (inclui pickle + pipe + montagem do BundleReader)
+
+O tempo de subida dos workers (JVM + warm-up) fica fora da medição. O ganho
+esperado é quase linear até o número de núcleos livres; acima disso os workers
+só disputam CPU.
+
+Requer:
+- Java e pacote mpxj instalados
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from itertools import cycle, islice
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from mpxj_pm.parse_pool import BundleReader, ParseWorkerPool, extract_bundle
+
+
+def default_worker_counts() -> list[int]:
+    cores = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 <= cores:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cores:
+        counts.append(cores)
+    return counts
+
+
+def run_inproc(paths: list[str], engine: str) -> float:
+    from mpxj_pm.mpp import warm_up
+
+    warm_up(engines=[engine])
+    start = time.perf_counter()
+    for path in paths:
+        BundleReader(extract_bundle(path, engine))
+    return time.perf_counter() - start
+
+
+def run_pool(paths: list[str], engine: str, workers: int, max_files_per_worker: int) -> tuple[float, dict]:
+    with ParseWorkerPool(workers, max_files_per_worker=max_files_per_worker, warmup_engines=[engine]) as pool:
+        if not pool.wait_ready(pool.start_timeout):
+            raise RuntimeError(f"workers não subiram: {pool.stats()}")
+        start = time.perf_counter()
+        bundles = [future.result() for future in [pool.submit(path, engine) for path in paths]]
+        for bundle in bundles:
+            BundleReader(bundle)
+        elapsed = time.perf_counter() - start
+        stats = {
+            "bundle_kib": statistics.median(b.stats["bundle_bytes"] for b in bundles) / 1024,
+            "recycles": sum(slot["recycles"] for slot in pool.stats()["slots"]),
+        }
+    return elapsed, stats
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("files", nargs="+", help="Arquivos .mpp/.xml (usados em ciclo)")
+    parser.add_argument("--files", dest="count", type=int, default=32, help="Arquivos parseados por rodada")
+    parser.add_argument("--workers", nargs="+", type=int, default=None, help="Quantidades de workers (padrão: 1, 2, 4, ... núcleos)")
+    parser.add_argument("--engine", default="jpype", help="Engine de extração")
+    parser.add_argument("--max-files-per-worker", type=int, default=0, help="Reciclagem por arquivos (0 = sem reciclar)")
+    parser.add_argument("--no-inproc", action="store_true", help="Pula a rodada em processo")
+    args = parser.parse_args()
+
+    paths = list(islice(cycle(args.files), args.count))
+    counts = args.workers or default_worker_counts()
+    print(f"{len(paths)} arquivo(s) por rodada | engine: {args.engine} | núcleos: {os.cpu_count()}\n")
+
+    results = []
+    if not args.no_inproc:
+        elapsed = run_inproc(paths, args.engine)
+        results.append(("inproc", elapsed, {}))
+    for workers in counts:
+        elapsed, stats = run_pool(paths, args.engine, workers, args.max_files_per_worker)
+        results.append((f"workers={workers}", elapsed, stats))
+
+    baseline = results[0][1]
+    print(f"  {'modo':<12}{'tempo':>10}{'arq/s':>10}{'speedup':>10}{'bundle':>12}{'recicl.':>9}")
+    for name, elapsed, stats in results:
+        bundle = f"{stats['bundle_kib']:.0f} KiB" if stats else "-"
+        print(
+            f"  {name:<12}{elapsed:>9.2f}s{len(paths) / elapsed:>10.1f}{baseline / elapsed:>9.2f}x"
+            f"{bundle:>12}{stats.get('recycles', '-'):>9}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Benchmark de escala: soft delete dos ausentes do arquivo (`!= ALL` vs anti-join).
+
+Uso:
+  python scripts/bench_soft_delete.py                       # 1k, 10k e 100k tasks
+  python scripts/bench_soft_delete.py --sizes 1000 50000 --repeat 3
+  python scripts/bench_soft_delete.py --table pm.resource
+
+Para cada tamanho, cria um masterplan temporário com N linhas e simula um re-import
+em que 10% sumiram do arquivo e 10% voltaram depois de terem sido deletadas:
+
+  legacy    UPDATE ... external_id != ALL(lista) seguido do UPDATE de restauração
+            com = ANY(lista) (implementação anterior de _soft_delete_missing)
+  anti-join restauração por lote antes do upsert (MPPImporter._split_unchanged) e
+            MPPImporter._soft_delete_missing com NOT EXISTS sobre unnest
+
+Cada estratégia roda a partir do mesmo estado (SAVEPOINT) e tudo fica em uma
+transação que sofre ROLLBACK no final: nada fica no banco. Com `!= ALL` o custo
+cresce com N x tamanho da lista; com o anti-join, cresce linearmente.
+
+Requer:
+- variáveis de banco (PG*) e schema pm aplicado (Postgres local)
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+import uuid
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+try:
+    from dotenv import load_dotenv
+except ImportError:  # pragma: no cover
+    def load_dotenv(*args, **kwargs):  # type: ignore[no-redef]
+        return False
+
+from mpxj_pm.db import DBConfig
+from mpxj_pm.importer import MPPImporter
+from mpxj_pm.mpp import ITER_BATCH_SIZE
+
+STRATEGIES = ("legacy", "anti-join")
+
+
+def legacy_soft_delete(importer: MPPImporter, cur, table: str, masterplan_id: int, external_ids) -> None:
+    """Implementação anterior: != ALL para deletar e = ANY para restaurar."""
+    cur.execute(
+        f"""
+        UPDATE {table}
+        SET deleted_at = CURRENT_TIMESTAMP, deleted_by = %s, updated_at = CURRENT_TIMESTAMP
+        WHERE masterplan_id = %s AND deleted_at IS NULL
+            AND external_id IS NOT NULL AND external_id != ALL(%s)
+        """,
+        (importer.created_by, masterplan_id, external_ids),
+    )
+    cur.execute(
+        f"""
+        UPDATE {table}
+        SET deleted_at = NULL, deleted_by = NULL, updated_at = CURRENT_TIMESTAMP
+        WHERE masterplan_id = %s AND deleted_at IS NOT NULL AND external_id = ANY(%s)
+        """,
+        (masterplan_id, external_ids),
+    )
+
+
+def anti_join_soft_delete(importer: MPPImporter, cur, table: str, masterplan_id: int, rows) -> None:
+    """Caminho atual: restaura por lote (sem o upsert) e marca os ausentes com anti-join."""
+    for i in range(0, len(rows), ITER_BATCH_SIZE):
+        importer._split_unchanged(cur, table, masterplan_id, rows[i:i + ITER_BATCH_SIZE])
+    importer._soft_delete_missing(cur, table, masterplan_id, [row[1] for row in rows])
+
+
+def seed(importer: MPPImporter, cur, table: str, size: int) -> int:
+    """Cria o masterplan com `size` linhas ativas e 10% delas já deletadas."""
+    cur.execute(
+        "INSERT INTO pm.masterplan (name, external_id, created_by) VALUES (%s, %s, %s) RETURNING id",
+        ("bench_soft_delete", str(uuid.uuid4()), importer.created_by),
+    )
+    masterplan_id = cur.fetchone()[0]
+    with cur.copy(f"COPY {table} (masterplan_id, external_id, name, created_by) FROM STDIN") as copy:
+        for i in range(size):
+            copy.write_row((masterplan_id, str(i), f"Linha {i}", importer.created_by))
+    cur.execute(
+        f"""
+        UPDATE {table} SET deleted_at = CURRENT_TIMESTAMP
+        WHERE masterplan_id = %s AND external_id::int %% 10 = 1
+        """,
+        (masterplan_id,),
+    )
+    cur.execute(f"ANALYZE {table}")
+    return masterplan_id
+
+
+def run_size(importer: MPPImporter, table: str, size: int, strategies, repeat: int) -> dict:
+    conn = importer._connect()
+    results = {}
+    try:
+        with conn.cursor() as cur:
+            masterplan_id = seed(importer, cur, table, size)
+            # Arquivo do re-import: sem os external_ids terminados em 0, com os terminados em 1 (deletados)
+            rows = [
+                (masterplan_id, str(i), None, importer.created_by)
+                for i in range(size)
+                if i % 10 != 0
+            ]
+            external_ids = [row[1] for row in rows]
+            cur.execute("SAVEPOINT bench_soft_delete")
+            for strategy in strategies:
+                best = None
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    if strategy == "legacy":
+                        legacy_soft_delete(importer, cur, table, masterplan_id, external_ids)
+                    else:
+                        anti_join_soft_delete(importer, cur, table, masterplan_id, rows)
+                    elapsed = time.perf_counter() - start
+                    best = elapsed if best is None else min(best, elapsed)
+                    cur.execute("ROLLBACK TO SAVEPOINT bench_soft_delete")
+                results[strategy] = best
+    finally:
+        conn.rollback()
+        conn.close()
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", nargs="+", type=int, default=[1_000, 10_000, 100_000])
+    parser.add_argument("--table", default="pm.task", choices=("pm.task", "pm.resource"))
+    parser.add_argument("--strategies", nargs="+", default=list(STRATEGIES), choices=STRATEGIES)
+    parser.add_argument("--repeat", type=int, default=1, help="Rodadas por estratégia (vale a melhor)")
+    args = parser.parse_args()
+
+    load_dotenv(REPO_ROOT / ".env", override=False)
+
+    importer = MPPImporter(DBConfig())
+    print(f"Tabela: {args.table} (10% removidas do arquivo, 10% restauradas)\n")
+    print(f"  {'linhas':>10}" + "".join(f"{strategy:>14}" for strategy in args.strategies))
+    for size in args.sizes:
+        results = run_size(importer, args.table, size, args.strategies, args.repeat)
+        print(f"  {size:>10}" + "".join(f"{results[s]:>13.3f}s" for s in args.strategies))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
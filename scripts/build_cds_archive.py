@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Gera o archive AppCDS do MPXJ (class data sharing) para reduzir o cold start da JVM.
+
+Uso:
+  python scripts/build_cds_archive.py                                   # treina com mpxj_pm/samples/warmup.xml
+  python scripts/build_cds_archive.py --output /app/mpxj.jsa exemplo.mpp outro.mpp
+  python scripts/build_cds_archive.py --engines jpype json columnar
+
+Roda um processo de treino com MPXJ_CDS_DUMP apontando para `--output`: a JVM
+sobe com -XX:ArchiveClassesAtExit, o MPPReader lê e extrai os arquivos de
+treino em cada engine (mpxj_pm.mpp.warm_up) e, ao sair, a JVM grava no archive
+todas as classes carregadas (MPXJ, POI e dependências). Em produção, aponte
+MPXJ_CDS_ARCHIVE para o archive (ver Dockerfile).
+
+O archive só vale para o mesmo JDK e o mesmo classpath (jars do mpxj + helpers):
+gere de novo ao atualizar o MPXJ ou a imagem base. Com um archive incompatível
+a JVM só ignora o archive e sobe normalmente.
+
+Requer:
+- Java 13+ (archive dinâmico) e pacote mpxj instalado
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+DEFAULT_OUTPUT = REPO_ROOT / "mpxj_pm" / "java" / "mpxj.jsa"
+DEFAULT_ENGINES = ("jpype", "json", "columnar")
+
+
+def train(files: list[str], engines: list[str]) -> int:
+    """Execução de treino (processo filho): carrega as classes usadas num import."""
+    from mpxj_pm.mpp import WARMUP_SAMPLE, warm_up
+
+    for path in files or [WARMUP_SAMPLE]:
+        timings = warm_up(path, engines=engines)
+        print(f"  {Path(path).name}: " + ", ".join(f"{k}={v:.0f}ms" for k, v in timings.items()))
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("files", nargs="*", help="Arquivos de treino (.mpp/.xml); padrão: cronograma de warm-up")
+    parser.add_argument("--output", default=str(DEFAULT_OUTPUT), help=f"Archive gerado (padrão: {DEFAULT_OUTPUT})")
+    parser.add_argument("--engines", nargs="+", default=list(DEFAULT_ENGINES), help="Engines exercitados no treino")
+    parser.add_argument("--train", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.train:
+        return train(args.files, args.engines)
+
+    output = Path(args.output).resolve()
+    output.parent.mkdir(parents=True, exist_ok=True)
+    if output.exists():
+        output.unlink()
+
+    env = dict(os.environ)
+    env["MPXJ_CDS_DUMP"] = str(output)
+    # O treino não pode usar um archive anterior (o dump é feito sobre o archive base do JDK)
+    env.pop("MPXJ_CDS_ARCHIVE", None)
+
+    print(f"Treinando AppCDS ({', '.join(args.engines)}) -> {output}")
+    start = time.perf_counter()
+    cmd = [sys.executable, str(Path(__file__).resolve()), "--train", "--engines", *args.engines, *args.files]
+    result = subprocess.run(cmd, env=env, cwd=str(REPO_ROOT))
+    if result.returncode != 0:
+        print(f"Erro: execução de treino terminou com código {result.returncode}")
+        return result.returncode
+    if not output.exists():
+        print("Erro: a JVM não gerou o archive (requer Java 13+ com -XX:ArchiveClassesAtExit)")
+        return 1
+
+    size_mb = output.stat().st_size / (1024 * 1024)
+    print(f"Archive gerado: {output} ({size_mb:.1f} MiB, {time.perf_counter() - start:.1f}s)")
+    print(f"Use: MPXJ_CDS_ARCHIVE={output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
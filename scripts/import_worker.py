@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Worker de imports assíncronos: consome a fila pm.import_job (POST /upload com async_import).
+
+Uso:
+  python scripts/import_worker.py                     # roda até SIGTERM/SIGINT
+  python scripts/import_worker.py --once              # processa no máximo um job
+  python scripts/import_worker.py --poll-interval 2 --worker-id ecs-task-1
+
+Vários workers (na mesma máquina ou em várias tasks ECS, com a mesma imagem da API)
+podem rodar ao mesmo tempo: o claim usa FOR UPDATE SKIP LOCKED. No SIGTERM o job
+em andamento termina antes de o processo sair (ajuste o stopTimeout da task).
+
+Requer:
+- variáveis de banco (PG*) e schema pm aplicado (incluindo pm.import_job)
+- S3_BUCKET/AWS_REGION e credenciais AWS para baixar os arquivos enviados
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import signal
+import sys
+import threading
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+try:
+    from dotenv import load_dotenv
+except ImportError:  # pragma: no cover
+    def load_dotenv(*args, **kwargs):  # type: ignore[no-redef]
+        return False
+
+from mpxj_pm.db import DBConfig, create_pool
+from mpxj_pm.jobs import default_worker_id, run_worker
+
+
+def s3_downloader():
+    """Downloader para s3://bucket/key (um client boto3 por worker)."""
+    import boto3
+
+    s3 = boto3.client(
+        "s3",
+        region_name=os.getenv("AWS_REGION") or os.getenv("AWS_DEFAULT_REGION"),
+        endpoint_url=os.getenv("S3_ENDPOINT_URL") or None,
+    )
+
+    def download(uri: str, path: str) -> None:
+        if not uri.startswith("s3://"):
+            raise ValueError(f"file_storage_path não é uma URI S3: {uri}")
+        bucket, _, key = uri[len("s3://"):].partition("/")
+        s3.download_file(bucket, key, path)
+
+    return download
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--poll-interval", type=float, default=5.0, help="Segundos entre consultas com a fila vazia")
+    parser.add_argument("--worker-id", default=None, help="Identificação nos jobs (padrão: host:pid)")
+    parser.add_argument("--once", action="store_true", help="Processa no máximo um job e sai")
+    args = parser.parse_args()
+
+    try:
+        load_dotenv(REPO_ROOT / ".env", override=False)
+    except PermissionError:
+        pass
+
+    stop = threading.Event()
+
+    def request_stop(signum, frame):
+        print("Sinal recebido: encerrando após o job atual")
+        stop.set()
+
+    signal.signal(signal.SIGTERM, request_stop)
+    signal.signal(signal.SIGINT, request_stop)
+
+    worker_id = args.worker_id or default_worker_id()
+    # Import + progresso + heartbeat usam conexões separadas
+    pool = create_pool(DBConfig(), min_size=1, max_size=3, open=True)
+    try:
+        print(f"[{worker_id}] Aguardando jobs (poll a cada {args.poll_interval}s)")
+        processed = run_worker(
+            pool,
+            s3_downloader(),
+            worker_id=worker_id,
+            poll_interval=args.poll_interval,
+            stop=stop,
+            once=args.once,
+        )
+    finally:
+        pool.close()
+    print(f"[{worker_id}] {processed} job(s) processado(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
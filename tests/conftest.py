@@ -0,0 +1,7 @@
+"""Testes unitários sem banco nem JVM (rodar da raiz: python -m pytest -q)."""
+
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
@@ -0,0 +1,45 @@
+"""Paridade entre engines: jpype e json produzem os mesmos bundles (requer JVM + MPXJ)."""
+
+import pytest
+
+pytest.importorskip("jpype")
+pytest.importorskip("mpxj")
+
+from mpxj_pm import mpp  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def jvm():
+    try:
+        mpp.start_jvm()
+    except Exception as e:  # JVM/JAVA_HOME ausente no ambiente de teste
+        pytest.skip(f"JVM indisponível: {e}")
+
+
+def _bundle(engine):
+    reader = mpp.create_reader(mpp.WARMUP_SAMPLE, engine=engine, native_dates=True)
+    reader.read()
+    _, fields = reader.get_custom_field_definitions()
+    baseline_indices = [b["index"] for b in reader.get_baseline_indices_and_names()] or None
+    resources, resource_baselines = reader.extract_resources_bundle(fields.get("RESOURCE", []), baseline_indices)
+    tasks, dependencies, task_baselines = reader.extract_tasks_bundle(fields.get("TASK", []), baseline_indices)
+    # Timephased fica de fora: o JsonWriter só grava os períodos a partir do MPXJ 16
+    return {
+        "resources": resources,
+        "resource_baselines": resource_baselines,
+        "tasks": tasks,
+        "dependencies": dependencies,
+        "task_baselines": task_baselines,
+        "assignments": reader.get_assignments(fields.get("ASSIGNMENT", [])),
+    }
+
+
+def test_jpype_and_json_bundles_match_for_warmup_sample(jvm):
+    jpype_bundle = _bundle("jpype")
+    json_bundle = _bundle("json")
+
+    for key, rows in jpype_bundle.items():
+        assert rows == json_bundle[key], key
+    # Sanidade: o sample tem durações, lags e work para comparar
+    assert any(task["work"] for task in jpype_bundle["tasks"])
+    assert any(dep["lag"] for dep in jpype_bundle["dependencies"])
@@ -0,0 +1,206 @@
+"""Testes do importer que não precisam de banco: o cursor é um fake em memória."""
+
+import json
+from contextlib import contextmanager
+from datetime import date, datetime
+
+import pytest
+
+from mpxj_pm.importer import MPPImporter, _content_hash, _custom_fields_json
+
+
+class FakeCursor:
+    """Cursor que grava os statements e devolve resultados enfileirados por chamada."""
+
+    def __init__(self, *results, description=None):
+        self.results = list(results)
+        self.executed = []
+        self.executemany_rows = []
+        self.description = description
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=None):
+        self.executed.append((query, params))
+
+    def executemany(self, query, rows, returning=False):
+        self.executed.append((query, None))
+        self.executemany_rows.extend(rows)
+
+    def fetchall(self):
+        return self.results.pop(0) if self.results else []
+
+    def fetchone(self):
+        rows = self.fetchall()
+        return rows[0] if rows else None
+
+    def nextset(self):
+        return None
+
+
+class FakeConnection:
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    @contextmanager
+    def transaction(self):
+        yield
+
+    def cursor(self):
+        return self._cursor
+
+
+def test_custom_fields_json_serializes_dates_as_iso():
+    values = {"Date1": datetime(2024, 3, 1, 8, 30), "Start1": date(2024, 3, 2), "Text1": "a", "Number1": 1.5}
+
+    assert json.loads(_custom_fields_json(values)) == {
+        "Date1": "2024-03-01T08:30:00",
+        "Start1": "2024-03-02",
+        "Text1": "a",
+        "Number1": 1.5,
+    }
+    assert _custom_fields_json(None) == "{}"
+
+
+def test_native_and_iso_dates_produce_same_custom_fields_json():
+    native = {"Date1": datetime(2024, 3, 1, 8, 30)}
+    iso = {"Date1": "2024-03-01T08:30:00"}
+
+    assert _custom_fields_json(native) == _custom_fields_json(iso)
+
+
+def test_import_resources_with_date_custom_field():
+    resource = {
+        "external_id": "1",
+        "name": "Analista",
+        "custom_fields": {"Date1": datetime(2024, 3, 1, 8, 30)},
+    }
+    # restore (nada), SELECT existentes (nenhum), RETURNING do executemany
+    cur = FakeCursor([], [], [(10, "1")])
+    changes = {}
+
+    ids = MPPImporter()._import_resources(cur, 7, [resource], changes=changes)
+
+    assert ids == {"1": 10}
+    assert changes["inserted"] == 1
+    (row,) = cur.executemany_rows
+    assert json.loads(row[10]) == {"Date1": "2024-03-01T08:30:00"}
+
+
+def test_find_previous_import_unknown_masterplan_is_never_skipped():
+    cur = FakeCursor([])
+    importer = MPPImporter(connection=FakeConnection(cur))
+
+    assert importer._find_previous_import("abc", "plano-novo") is None
+    assert len(cur.executed) == 1
+
+
+def test_find_previous_import_looks_up_by_masterplan_and_hash():
+    columns = ("id", "masterplan_id", "name")
+    cur = FakeCursor([(7,)], [(42, 7, "Plano")], description=[(name,) for name in columns])
+    importer = MPPImporter(connection=FakeConnection(cur))
+
+    previous = importer._find_previous_import("abc", "plano-1")
+
+    assert previous == {"id": 42, "masterplan_id": 7, "name": "Plano"}
+    assert cur.executed[0][1] == ("plano-1",)
+    assert cur.executed[1][1] == (7, "abc")
+
+
+def test_find_file_masterplan_resolves_by_hash():
+    cur = FakeCursor([("plano-1",)])
+    importer = MPPImporter(connection=FakeConnection(cur))
+
+    assert importer._find_file_masterplan("abc") == "plano-1"
+    query, params = cur.executed[0]
+    assert params == ("abc",)
+    assert "masterplan_external_id_source" in query
+
+
+PREVIOUS_IMPORT_COLUMNS = (
+    "id", "masterplan_id", "file_storage_path", "custom_field_definitions", "tasks", "resources",
+    "assignments", "calendars", "dependencies", "name", "external_id", "start_date", "finish_date",
+    "author", "company", "creation_date", "last_saved",
+)
+
+
+def test_import_without_masterplan_id_skips_before_reading_when_hash_matches():
+    previous = (42, 7, "s3://b/objects/sha256/abc", 0, 3, 1, 2, 1, 2, "Plano", "plano-1",
+                None, None, None, None, None, None)
+    cur = FakeCursor(
+        [("plano-1",)], [(7,)], [previous],
+        description=[(name,) for name in PREVIOUS_IMPORT_COLUMNS],
+    )
+    importer = MPPImporter(connection=FakeConnection(cur))
+
+    def reader_factory(*args, **kwargs):
+        raise AssertionError("o arquivo não deveria ser lido")
+
+    report = importer.import_project(b"mpp", source_file="a.mpp", file_hash="abc", reader_factory=reader_factory)
+
+    assert report.skipped and report.import_log_id == 42 and report.tasks == 3
+    assert report.masterplan_external_id == "plano-1"
+    assert [params for _, params in cur.executed] == [("abc",), ("plano-1",), (7, "abc")]
+
+
+def test_import_without_masterplan_id_reads_file_when_hash_is_unknown():
+    cur = FakeCursor([])
+    importer = MPPImporter(connection=FakeConnection(cur))
+
+    class Stop(Exception):
+        pass
+
+    def reader_factory(*args, **kwargs):
+        raise Stop()
+
+    # Sem candidato pelo hash, a leitura acontece (e o Stop interrompe o import)
+    with pytest.raises(Stop):
+        importer.import_project(b"mpp", source_file="a.mpp", file_hash="abc", reader_factory=reader_factory)
+    assert cur.executed[0][1] == ("abc",)
+
+
+def test_content_hash_is_stable_and_sensitive_to_content():
+    content = ("Tarefa", datetime(2024, 3, 1, 8, 0), 8.0, None, "{}")
+
+    assert _content_hash(content) == _content_hash(tuple(content))
+    assert len(_content_hash(content)) == 32
+    assert _content_hash(content) != _content_hash(("Tarefa", datetime(2024, 3, 1, 8, 0), 8.5, None, "{}"))
+    assert _content_hash(("a", None)) != _content_hash((None, "a"))
+
+
+def _row(external_id, name):
+    content = (name,)
+    return (7, external_id, *content, _content_hash(content), 1)
+
+
+def test_split_unchanged_classifies_rows():
+    new, changed, same, restored = _row("1", "Nova"), _row("2", "Alterada"), _row("3", "Igual"), _row("4", "Volta")
+    cur = FakeCursor(
+        [("4",)],  # UPDATE ... RETURNING: external_ids restaurados
+        [("2", 20, "hash-antigo"), ("3", 30, same[-2]), ("4", 40, "hash-antigo")],
+    )
+    changes = {"inserted": 1}
+
+    pending, ids = MPPImporter()._split_unchanged(cur, "pm.task", 7, [new, changed, same, restored], changes)
+
+    assert pending == [new, changed, restored]
+    assert ids == {"2": 20, "3": 30, "4": 40}
+    assert changes == {"inserted": 2, "updated": 1, "restored": 1, "unchanged": 1}
+    assert cur.executed[0][1] == (1, ["1", "2", "3", "4"], 7)
+    assert cur.executed[1][1] == (7, ["1", "2", "3", "4"])
+
+
+def test_split_unchanged_restored_row_with_same_hash_is_not_rewritten():
+    row = _row("4", "Volta")
+    cur = FakeCursor([("4",)], [("4", 40, row[-2])])
+    changes = {}
+
+    pending, ids = MPPImporter()._split_unchanged(cur, "pm.task", 7, [row], changes)
+
+    assert pending == []
+    assert ids == {"4": 40}
+    assert changes["restored"] == 1 and changes["unchanged"] == 0
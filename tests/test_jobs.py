@@ -0,0 +1,68 @@
+"""Testes da fila de jobs com um pool fake (sem banco)."""
+
+from contextlib import contextmanager
+
+from mpxj_pm.importer import ImportReport
+from mpxj_pm.jobs import fail_job, finish_job, progress_callback, update_progress
+
+
+class FakeResult:
+    def __init__(self, rowcount):
+        self.rowcount = rowcount
+
+
+class FakePool:
+    """Imita psycopg_pool.ConnectionPool: cada execute afeta `rowcount` linhas."""
+
+    def __init__(self, rowcount=1):
+        self.rowcount = rowcount
+        self.executed = []
+
+    @contextmanager
+    def connection(self):
+        yield self
+
+    def execute(self, query, params=None):
+        self.executed.append((query, params))
+        return FakeResult(self.rowcount)
+
+
+def test_finish_job_only_updates_running_job_of_this_worker():
+    pool = FakePool()
+
+    assert finish_job(pool, 5, "worker-a", ImportReport(success=True))
+    query, params = pool.executed[0]
+    assert "worker_id = %s AND status = 'running'" in query
+    assert params[-2:] == (5, "worker-a")
+
+
+def test_finish_and_fail_report_lost_ownership():
+    pool = FakePool(rowcount=0)
+
+    assert not finish_job(pool, 5, "worker-a", ImportReport(success=True))
+    assert not fail_job(pool, 5, "worker-a", "erro")
+    query, params = pool.executed[1]
+    assert "worker_id = %s AND status = 'running'" in query
+    assert params == ("erro", 5, "worker-a")
+
+
+def test_update_progress_only_touches_running_job_of_this_worker():
+    pool = FakePool()
+
+    update_progress(pool, 5, "worker-a", "import_tasks", {"read_mpp_file": 1.0})
+    query, params = pool.executed[0]
+    assert "heartbeat_at" in query
+    assert "worker_id = %s AND status = 'running'" in query
+    assert params[-2:] == (5, "worker-a")
+
+
+def test_progress_callback_passes_worker_id():
+    pool = FakePool()
+    progress = progress_callback(pool, 5, "worker-a", min_interval=60)
+
+    progress("read_mpp_file", {})
+    progress("read_mpp_file", {})  # mesma fase dentro do intervalo: não grava
+    progress("import_tasks", {"read_mpp_file": 1.0})
+
+    assert [params[0] for _, params in pool.executed] == ["read_mpp_file", "import_tasks"]
+    assert all(params[-1] == "worker-a" for _, params in pool.executed)
@@ -0,0 +1,144 @@
+"""Testes do reader com objetos fake no lugar dos handles Java (sem JVM)."""
+
+import threading
+from datetime import datetime
+
+from mpxj_pm import mpp
+from mpxj_pm.mpp import MPPReader, _rebatch
+
+
+class FakeFieldType:
+    def __init__(self, name, data_type=None, field_class="TASK"):
+        self._name = name
+        self._data_type = data_type
+        self._field_class = field_class
+
+    def getFieldTypeClass(self):
+        return self._field_class
+
+    def getDataType(self):
+        return self._data_type
+
+    def name(self):
+        return self._name
+
+    def __str__(self):
+        return self._name
+
+
+class FakeCustomField:
+    def __init__(self, field_type, alias=None):
+        self._field_type = field_type
+        self._alias = alias
+
+    def getFieldType(self):
+        return self._field_type
+
+    def getAlias(self):
+        return self._alias
+
+
+class FakeProject:
+    def __init__(self, fields):
+        self._fields = fields
+
+    def getCustomFields(self):
+        return self._fields
+
+
+class FakeJavaDate:
+    """Imita java.util.Date: só expõe getTime() em milissegundos."""
+
+    def __init__(self, value: datetime):
+        self._millis = value.timestamp() * 1000
+
+    def getTime(self):
+        return self._millis
+
+
+class FakeEntity:
+    def __init__(self, values):
+        self._values = values
+
+    def getCachedValue(self, field_type):
+        return self._values.get(field_type)
+
+
+def _reader_with_fields(*fields, native_dates=True):
+    reader = MPPReader(b"fake", native_dates=native_dates)
+    reader.project = FakeProject(list(fields))
+    return reader
+
+
+def test_field_without_data_type_probes_value_type():
+    field_type = FakeFieldType("DATE1")
+    reader = _reader_with_fields(FakeCustomField(field_type, alias="Entrega"))
+
+    definitions, fields_by_class = reader.get_custom_field_definitions(prune_empty=False)
+
+    assert definitions[0]["data_type"] == "STRING"
+    entity = FakeEntity({field_type: FakeJavaDate(datetime(2024, 3, 1, 8, 30))})
+    values = reader._extract_custom_field_values(entity, fields_by_class["TASK"])
+    assert values == {"Entrega": datetime(2024, 3, 1, 8, 30)}
+
+
+def test_field_with_declared_data_type_uses_specialized_converter():
+    field_type = FakeFieldType("TEXT1", data_type="STRING")
+    reader = _reader_with_fields(FakeCustomField(field_type))
+
+    _, fields_by_class = reader.get_custom_field_definitions(prune_empty=False)
+
+    entity = FakeEntity({field_type: 42})
+    assert reader._extract_custom_field_values(entity, fields_by_class["TASK"]) == {"TEXT1": "42"}
+
+
+class FakeJavaList:
+    """Imita java.util.List: size() e subList(from, to)."""
+
+    def __init__(self, items):
+        self._items = list(items)
+
+    def size(self):
+        return len(self._items)
+
+    def subList(self, start, end):
+        return FakeJavaList(self._items[start:end])
+
+    def __iter__(self):
+        return iter(self._items)
+
+
+def test_rebatch_never_exceeds_batch_size_nor_splits_shards():
+    parts = [([1, 2, 3], ["d1"]), ([4, 5, 6], []), ([7, 8], ["d7"]), ([9], [])]
+
+    batches = list(_rebatch(parts, batch_size=5))
+
+    assert batches == [([1, 2, 3], ["d1"]), ([4, 5, 6, 7, 8], ["d7"]), ([9], [])]
+
+
+def test_rebatch_oversized_shard_goes_alone():
+    assert list(_rebatch([([1], []), ([2, 3, 4], []), ([5], [])], batch_size=2)) == [
+        ([1], []),
+        ([2, 3, 4], []),
+        ([5], []),
+    ]
+
+
+def test_rebatch_keeps_related_rows_of_empty_shards():
+    assert list(_rebatch([([], ["d"])], batch_size=10)) == [([], ["d"])]
+    assert list(_rebatch([([], [])], batch_size=10)) == []
+
+
+def test_iter_shards_preserves_order_across_threads(monkeypatch):
+    attached = []
+    monkeypatch.setattr(mpp, "attach_jvm_thread", lambda: attached.append(threading.current_thread().name))
+    monkeypatch.setattr(mpp, "_extraction_executors", {})
+    reader = MPPReader(b"fake", parallel_threads=3)
+    entities = FakeJavaList(range(25))
+
+    shards = list(reader._iter_shards(entities, lambda shard: [x * 10 for x in shard], shard_size=4))
+
+    assert [len(shard) for shard in shards] == [4, 4, 4, 4, 4, 4, 1]
+    assert [x for shard in shards for x in shard] == [x * 10 for x in range(25)]
+    assert attached and all(name.startswith("mpp-extract-3") for name in attached)
+    mpp._extraction_executors[3].shutdown()
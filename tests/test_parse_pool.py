@@ -0,0 +1,46 @@
+"""Testes do formato compacto dos bundles do pool de parse (sem JVM)."""
+
+import importlib
+import pickle
+from datetime import datetime
+
+from mpxj_pm import parse_pool
+from mpxj_pm.parse_pool import _pack_rows, _unpack_rows
+
+
+def test_pack_rows_stores_keys_once():
+    rows = [
+        {"external_id": "1", "name": "A", "start": datetime(2024, 1, 1)},
+        {"external_id": "2", "name": "B", "start": None},
+    ]
+
+    keys, packed = _pack_rows(rows)
+
+    assert keys == ("external_id", "name", "start")
+    assert packed == [("1", "A", datetime(2024, 1, 1)), ("2", "B", None)]
+    assert _unpack_rows((keys, packed)) == rows
+
+
+def test_unpack_rows_keeps_absent_keys_absent():
+    rows = [{"external_id": "1", "custom_fields": {"Text1": "x"}}, {"external_id": "2", "notes": None}]
+
+    unpacked = _unpack_rows(pickle.loads(pickle.dumps(_pack_rows(rows))))
+
+    assert unpacked == rows
+    assert "notes" not in unpacked[0] and "custom_fields" not in unpacked[1]
+
+
+def test_pack_rows_empty():
+    assert _pack_rows([]) == ((), [])
+    assert _unpack_rows(((), [])) == []
+
+
+def test_max_files_env_zero_disables_recycling(monkeypatch):
+    try:
+        monkeypatch.setenv("PARSE_WORKER_MAX_FILES", "0")
+        assert importlib.reload(parse_pool).PARSE_WORKER_MAX_FILES == 0
+        monkeypatch.delenv("PARSE_WORKER_MAX_FILES")
+        assert importlib.reload(parse_pool).PARSE_WORKER_MAX_FILES == 50
+    finally:
+        monkeypatch.undo()
+        importlib.reload(parse_pool)